@@ -0,0 +1,117 @@
+# benchmarks/bench_base_page_actions.py
+"""
+Micro-benchmark for BasePage actions: protocol round-trips and latency per flow.
+
+Runs LoginPage.login, AddToCartPage.add_to_cart and CheckoutPage.checkout in both
+the locator fast path and the legacy wait + action path, then prints one row per
+flow and mode (mean round-trips, mean/min latency in ms).
+
+Usage: python -m benchmarks.bench_base_page_actions [--iterations 5] [--json out.json]
+"""
+import sys
+import json
+import time
+import argparse
+import statistics
+from playwright.sync_api import sync_playwright
+from config.config import TEST_URL
+from pages.login_page import LoginPage
+from pages.addtocart_page import AddToCartPage
+from pages.checkout_page import CheckoutPage
+
+FLOWS = [
+    ("LoginPage.login", lambda page, legacy: LoginPage(page, legacy_waits=legacy).login()),
+    ("AddToCartPage.add_to_cart", lambda page, legacy: AddToCartPage(page, legacy_waits=legacy).add_to_cart()),
+    ("CheckoutPage.checkout", lambda page, legacy: CheckoutPage(page, legacy_waits=legacy).checkout()),
+]
+
+
+class RoundTripCounter:
+    """
+    Count client -> browser protocol messages sent on a Playwright connection.
+
+    Wraps the (private) Connection._send_message_to_server hook; every call there is
+    one request/response round-trip to the browser driver.
+    """
+
+    def __init__(self, page):
+        self.count = 0
+        self._connection = page._impl_obj._connection
+        self._original = self._connection._send_message_to_server
+
+    def __enter__(self):
+        def counting_send(*args, **kwargs):
+            self.count += 1
+            return self._original(*args, **kwargs)
+
+        self._connection._send_message_to_server = counting_send
+        return self
+
+    def __exit__(self, *exc_info):
+        self._connection._send_message_to_server = self._original
+
+
+def run_journey(browser, legacy):
+    """Run login -> add to cart -> checkout once in a fresh context; return {flow: (round_trips, ms)}."""
+    context = browser.new_context()
+    try:
+        page = context.new_page()
+        page.goto(TEST_URL)
+        results = {}
+        for name, flow in FLOWS:
+            with RoundTripCounter(page) as counter:
+                start = time.perf_counter()
+                flow(page, legacy)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+            results[name] = (counter.count, elapsed_ms)
+        return results
+    finally:
+        context.close()
+
+
+def benchmark(iterations):
+    """Collect per-flow samples for both modes; the first journey per mode is a discarded warm-up."""
+    samples = {}
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch()
+        try:
+            for mode, legacy in (("locator", False), ("legacy", True)):
+                run_journey(browser, legacy)
+                for _ in range(iterations):
+                    for name, (round_trips, elapsed_ms) in run_journey(browser, legacy).items():
+                        samples.setdefault((name, mode), []).append((round_trips, elapsed_ms))
+        finally:
+            browser.close()
+
+    summary = []
+    for (name, mode), values in samples.items():
+        latencies = [ms for _, ms in values]
+        summary.append({
+            "flow": name,
+            "mode": mode,
+            "round_trips": statistics.mean(rt for rt, _ in values),
+            "mean_ms": round(statistics.mean(latencies), 1),
+            "min_ms": round(min(latencies), 1),
+        })
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="BasePage action round-trip/latency micro-benchmark")
+    parser.add_argument("--iterations", type=int, default=5, help="Measured journeys per mode")
+    parser.add_argument("--json", dest="json_path", help="Optional path to write results as JSON")
+    args = parser.parse_args(argv)
+
+    summary = benchmark(args.iterations)
+    print(f"{'flow':<28}{'mode':<10}{'round-trips':>12}{'mean ms':>10}{'min ms':>10}")
+    for row in sorted(summary, key=lambda r: (r["flow"], r["mode"])):
+        print(f"{row['flow']:<28}{row['mode']:<10}{row['round_trips']:>12.1f}{row['mean_ms']:>10.1f}{row['min_ms']:>10.1f}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,308 @@
+# benchmarks/bench_journeys.py
+"""
+End-to-end journey benchmark against the local saucedemo stand-in.
+
+Measures:
+- Cold timings: browser launch + the first journey in a fresh browser, per step
+- Warm timings: later journeys on the same browser, per step (mean / p50 / p95 ms)
+  Steps: LoginPage.login, AddToCartPage.add_to_cart, CheckoutPage.checkout,
+  ClearProductPage.clear_product_from_cart, common.clearcart.clearcart
+- Throughput: journeys per second with 1 / 4 / 16 concurrent contexts (asyncio page objects)
+- Peak RSS of the Python process plus its browser/driver child processes
+
+Results are written as JSON tagged with the git commit; --compare flags regressions
+beyond --threshold against a stored baseline (exit code 1).
+
+Usage:
+  python -m benchmarks.bench_journeys --json benchmarks/results/current.json
+  python -m benchmarks.bench_journeys --json current.json --compare benchmarks/baseline.json
+  python -m benchmarks.bench_journeys --results current.json --compare benchmarks/baseline.json
+"""
+import os
+
+# Benchmarks always target the local stand-in unless explicitly overridden
+os.environ.setdefault("SAUCEDEMO_TARGET", "local")
+
+import sys
+import json
+import time
+import asyncio
+import argparse
+import threading
+import subprocess
+import statistics
+from datetime import datetime, timezone
+from config.config import TEST_URL, TARGET, LOCAL_HOST, LOCAL_PORT
+from common.action_timing import percentile
+from common.browser_profile import tree_rss_bytes
+
+STEPS = [
+    "LoginPage.login",
+    "AddToCartPage.add_to_cart",
+    "CheckoutPage.checkout",
+    "ClearProductPage.clear_product_from_cart",
+    "common.clearcart.clearcart",
+]
+
+DEFAULT_CONCURRENCY = (1, 4, 16)
+
+
+class PeakRssSampler:
+    """
+    Background sampler of resident memory for this process and all of its descendants
+    (Playwright driver + browser processes). Reads /proc, so the tree total is Linux-only;
+    elsewhere only the Python process' own peak (getrusage) is reported.
+    """
+
+    def __init__(self, interval=0.1):
+        self.interval = interval
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak_bytes = max(self.peak_bytes, tree_rss_bytes(os.getpid()))
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        if os.path.isdir("/proc"):
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        else:
+            import resource
+            # ru_maxrss is KiB on Linux, bytes on macOS
+            scale = 1 if sys.platform == "darwin" else 1024
+            self.peak_bytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def git_commit():
+    """Current commit hash (with a -dirty suffix for uncommitted changes), or "unknown"."""
+    try:
+        sha = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                               capture_output=True, text=True, check=True).stdout.strip()
+        return f"{sha}-dirty" if dirty else sha
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_sync_journey(browser):
+    """One full journey in a fresh context; return {step: ms}."""
+    from common.clearcart import clearcart
+    from pages.login_page import LoginPage
+    from pages.addtocart_page import AddToCartPage
+    from pages.checkout_page import CheckoutPage
+    from pages.clear_product_page import ClearProductPage
+
+    actions = [
+        lambda page: LoginPage(page).login(),
+        lambda page: AddToCartPage(page).add_to_cart(),
+        lambda page: CheckoutPage(page).checkout(),
+        lambda page: ClearProductPage(page).clear_product_from_cart(),
+        lambda page: clearcart(page),
+    ]
+    context = browser.new_context()
+    try:
+        page = context.new_page()
+        page.goto(TEST_URL)
+        timings = {}
+        for name, action in zip(STEPS, actions):
+            start = time.perf_counter()
+            action(page)
+            timings[name] = (time.perf_counter() - start) * 1000
+        return timings
+    finally:
+        context.close()
+
+
+def latency_stats(values):
+    ordered = sorted(values)
+    return {
+        "mean_ms": round(statistics.mean(ordered), 1),
+        "p50_ms": round(percentile(ordered, 0.50), 1),
+        "p95_ms": round(percentile(ordered, 0.95), 1),
+    }
+
+
+def measure_cold_warm(iterations, headed=False):
+    """Browser launch + first journey (cold), then `iterations` journeys on the warm browser."""
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as playwright:
+        start = time.perf_counter()
+        browser = playwright.chromium.launch(headless=not headed)
+        launch_ms = (time.perf_counter() - start) * 1000
+        try:
+            cold = run_sync_journey(browser)
+            warm = {name: [] for name in STEPS}
+            for _ in range(iterations):
+                for name, ms in run_sync_journey(browser).items():
+                    warm[name].append(ms)
+        finally:
+            browser.close()
+
+    return (
+        {"browser_launch_ms": round(launch_ms, 1), "steps_ms": {name: round(ms, 1) for name, ms in cold.items()},
+         "total_ms": round(launch_ms + sum(cold.values()), 1)},
+        {"iterations": iterations, "steps": {name: latency_stats(values) for name, values in warm.items()},
+         "journey_mean_ms": round(sum(statistics.mean(values) for values in warm.values()), 1)},
+    )
+
+
+async def full_async_journey(browser):
+    """login -> add to cart -> checkout -> remove product, in its own context (asyncio page objects)."""
+    from pages.async_pages import AsyncLoginPage, AsyncAddToCartPage, AsyncCheckoutPage, AsyncClearProductPage
+
+    start = time.perf_counter()
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
+        await page.goto(TEST_URL)
+        await AsyncLoginPage(page).login()
+        await AsyncAddToCartPage(page).add_to_cart()
+        await AsyncCheckoutPage(page).checkout()
+        await AsyncClearProductPage(page).clear_product_from_cart()
+        return time.perf_counter() - start
+    finally:
+        await context.close()
+
+
+async def measure_throughput(levels, journeys, headed=False):
+    """Journeys per second for each concurrency level on one shared browser."""
+    from playwright.async_api import async_playwright
+    from common.async_runner import run_journeys
+
+    results = {}
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=not headed)
+        try:
+            for concurrency in levels:
+                result = await run_journeys(browser, max(journeys, concurrency), concurrency, journey=full_async_journey)
+                results[str(concurrency)] = {
+                    "journeys_per_second": result["journeys_per_second"],
+                    "mean_seconds": result["mean_seconds"],
+                    "failed": result["failed"],
+                }
+        finally:
+            await browser.close()
+    return results
+
+
+def run_benchmark(iterations, journeys, levels, headed=False):
+    """Run all measurements against the stand-in and return the JSON-ready result."""
+    server = None
+    if TARGET == "local":
+        from standin.server import ensure_running
+        server = ensure_running(LOCAL_HOST, LOCAL_PORT)
+    try:
+        with PeakRssSampler() as sampler:
+            cold, warm = measure_cold_warm(iterations, headed)
+            throughput = asyncio.run(measure_throughput(levels, journeys, headed))
+    finally:
+        if server is not None:
+            server.stop()
+
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "target": TEST_URL,
+        "cold": cold,
+        "warm": warm,
+        "throughput": throughput,
+        "peak_rss_mb": round(sampler.peak_bytes / (1024 * 1024), 1),
+    }
+
+
+def comparable_metrics(result):
+    """Flatten a result into {metric: (value, higher_is_better)}."""
+    metrics = {
+        "cold.total_ms": (result["cold"]["total_ms"], False),
+        "warm.journey_mean_ms": (result["warm"]["journey_mean_ms"], False),
+        "peak_rss_mb": (result["peak_rss_mb"], False),
+    }
+    for name, stats in result["warm"]["steps"].items():
+        metrics[f"warm.{name}.p50_ms"] = (stats["p50_ms"], False)
+    for level, stats in result["throughput"].items():
+        metrics[f"throughput.c{level}.journeys_per_second"] = (stats["journeys_per_second"], True)
+    return metrics
+
+
+def compare(current, baseline, threshold):
+    """
+    List regressions of current vs baseline beyond `threshold` (fraction, e.g. 0.10):
+    latencies/RSS that grew, throughput that dropped. Metrics missing on either side are skipped.
+    :return: List of human-readable regression lines (empty when within threshold)
+    """
+    regressions = []
+    base_metrics = comparable_metrics(baseline)
+    for metric, (value, higher_is_better) in comparable_metrics(current).items():
+        if metric not in base_metrics or not base_metrics[metric][0]:
+            continue
+        base = base_metrics[metric][0]
+        change = (value - base) / base
+        if (change < -threshold) if higher_is_better else (change > threshold):
+            regressions.append(f"{metric}: {base} -> {value} ({change:+.1%})")
+    return regressions
+
+
+def print_result(result):
+    print(f"commit: {result['commit']}  target: {result['target']}")
+    print(f"cold: launch {result['cold']['browser_launch_ms']} ms, first journey total {result['cold']['total_ms']} ms")
+    print(f"{'step':<44}{'cold ms':>10}{'warm mean':>11}{'p50':>9}{'p95':>9}")
+    for name in STEPS:
+        warm = result["warm"]["steps"][name]
+        print(f"{name:<44}{result['cold']['steps_ms'][name]:>10.1f}{warm['mean_ms']:>11.1f}{warm['p50_ms']:>9.1f}{warm['p95_ms']:>9.1f}")
+    for level, stats in result["throughput"].items():
+        print(f"concurrency {level:>3}: {stats['journeys_per_second']} journeys/s (failed: {stats['failed']})")
+    print(f"peak RSS (python + browser): {result['peak_rss_mb']} MB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="End-to-end journey benchmark against the local stand-in")
+    parser.add_argument("--iterations", type=int, default=10, help="Warm journeys after the cold one")
+    parser.add_argument("--journeys", type=int, default=32, help="Journeys per concurrency level")
+    parser.add_argument("--concurrency", default=",".join(map(str, DEFAULT_CONCURRENCY)),
+                        help="Comma-separated concurrent context counts")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    parser.add_argument("--json", dest="json_path", help="Write results as JSON")
+    parser.add_argument("--results", help="Compare an existing results file instead of running")
+    parser.add_argument("--compare", dest="baseline", help="Baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed regression (fraction)")
+    args = parser.parse_args(argv)
+
+    if args.results:
+        with open(args.results, encoding="utf-8") as f:
+            result = json.load(f)
+    else:
+        if TARGET != "local":
+            print(f"Note: benchmarking against {TEST_URL} (SAUCEDEMO_TARGET={TARGET}); numbers include network latency")
+        levels = [int(level) for level in args.concurrency.split(",") if level]
+        result = run_benchmark(args.iterations, args.journeys, levels, args.headed)
+    print_result(result)
+
+    if args.json_path:
+        os.makedirs(os.path.dirname(args.json_path) or ".", exist_ok=True)
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(result, baseline, args.threshold)
+        print(f"compared with baseline {baseline.get('commit', 'unknown')} (threshold {args.threshold:.0%})")
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print("no regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+# benchmarks/bench_startup.py
+"""
+Startup benchmark for the pytest session (no browser needed).
+
+Measures, over --iterations fresh interpreter runs:
+- Collection: wall time of `pytest --collect-only -q`, and whether it left a log file behind
+- Time to first test: process start until the first test's setup begins; this module is loaded
+  as a pytest plugin (-p benchmarks.bench_startup) that records the moment and ends the session
+  before any fixture (browser) is set up
+- --imports: the slowest imports of a collection run (python -X importtime, cumulative)
+
+Usage: python -m benchmarks.bench_startup [--iterations 5] [--imports] [--json out.json] [test paths...]
+(test paths default to pytest.ini's testpaths; pass the same paths to compare revisions with different suites)
+"""
+import os
+import sys
+import json
+import time
+import glob
+import argparse
+import statistics
+import subprocess
+import pytest
+
+# Set by the benchmark for the probed pytest process: start timestamp and result file
+PROBE_START_ENV = "SAUCEDEMO_STARTUP_PROBE_START"
+PROBE_FILE_ENV = "SAUCEDEMO_STARTUP_PROBE_FILE"
+
+LOG_GLOB = os.path.join("logs-saucedemo", "**", "test_log_*")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Probe plugin: record time-to-first-test and stop the session (only when run by this benchmark)."""
+    if PROBE_FILE_ENV not in os.environ:
+        return
+    elapsed = time.time() - float(os.environ[PROBE_START_ENV])
+    with open(os.environ[PROBE_FILE_ENV], "w", encoding="utf-8") as f:
+        json.dump({"seconds": elapsed, "test": item.nodeid}, f)
+    pytest.exit("startup probe done", returncode=0)
+
+
+def _log_files():
+    return set(glob.glob(LOG_GLOB, recursive=True))
+
+
+def measure_collection(iterations, paths=()):
+    """Wall time of --collect-only runs (seconds) and how many of them created a log file."""
+    samples, created_logs = [], 0
+    for _ in range(iterations):
+        before = _log_files()
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider", *paths],
+                       capture_output=True, check=True)
+        samples.append(time.perf_counter() - start)
+        new_logs = _log_files() - before
+        created_logs += bool(new_logs)
+        for path in new_logs:
+            os.remove(path)
+    return samples, created_logs
+
+
+def measure_first_test(iterations, paths=(), probe_file=".startup-probe.json"):
+    """Seconds from interpreter start until the first test's setup hook fires."""
+    samples = []
+    for _ in range(iterations):
+        env = dict(os.environ, **{PROBE_FILE_ENV: probe_file, PROBE_START_ENV: repr(time.time())})
+        before = _log_files()
+        subprocess.run([sys.executable, "-m", "pytest", "-q", "-p", "benchmarks.bench_startup", "-p", "no:cacheprovider", *paths],
+                       capture_output=True, env=env)
+        for path in _log_files() - before:
+            os.remove(path)
+        with open(probe_file, encoding="utf-8") as f:
+            samples.append(json.load(f)["seconds"])
+        os.remove(probe_file)
+    return samples
+
+
+def slowest_imports(limit=10, paths=()):
+    """Top-level imports of a collection run by cumulative import time (ms)."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider", *paths],
+                            capture_output=True, text=True)
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Only top-level entries (nested imports are indented): their cumulative time includes their own imports
+        if not name.startswith("  "):
+            imports.append((int(cumulative) / 1000, name.strip()))
+    return sorted(imports, reverse=True)[:limit]
+
+
+def stats_ms(samples):
+    return {
+        "mean_ms": round(statistics.mean(samples) * 1000),
+        "min_ms": round(min(samples) * 1000),
+        "max_ms": round(max(samples) * 1000),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure pytest collection time and time to first test")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--imports", action="store_true", help="Also list the slowest imports of a collection run")
+    parser.add_argument("--json", help="Write the results to this file")
+    parser.add_argument("paths", nargs="*", help="Test paths to collect/run (default: pytest.ini testpaths)")
+    args = parser.parse_args(argv)
+
+    collection, created_logs = measure_collection(args.iterations, args.paths)
+    result = {
+        "collection": stats_ms(collection),
+        "collection_runs_creating_logs": created_logs,
+        "first_test": stats_ms(measure_first_test(args.iterations, args.paths)),
+    }
+    if args.imports:
+        result["slowest_imports_ms"] = {name: round(ms, 1) for ms, name in slowest_imports(paths=args.paths)}
+
+    print(f"{'metric':<20}{'mean':>8}{'min':>8}{'max':>8}  (ms, {args.iterations} runs)")
+    for metric in ("collection", "first_test"):
+        row = result[metric]
+        print(f"{metric:<20}{row['mean_ms']:>8}{row['min_ms']:>8}{row['max_ms']:>8}")
+    print(f"collection runs that created a log file: {created_logs}/{args.iterations}")
+    for name, ms in result.get("slowest_imports_ms", {}).items():
+        print(f"import {name:<40}{ms:>8.1f}ms")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
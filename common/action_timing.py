@@ -0,0 +1,177 @@
+# common/action_timing.py
+import json
+import math
+import time
+import functools
+import logging
+from collections import deque
+from playwright.sync_api import TimeoutError
+from config.config import ACTION_TIMING_BUFFER
+
+# Initialize logger for action timing module
+logger = logging.getLogger(__name__)
+
+# BasePage primitives wrapped while instrumentation is installed
+INSTRUMENTED_METHODS = (
+    "wait_elem_visible",
+    "elem_clickable",
+    "elem_click",
+    "elem_input",
+    "find_elements",
+    "is_element_exist",
+    "elem_count",
+    "elem_text",
+    "eval_all",
+    "snapshot",
+    "save_screen_shot",
+    "queue_screen_shot",
+)
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class ActionRecorder:
+    """
+    Fixed-size in-memory ring buffer of BasePage action timings:
+    - One tuple per call: (page object class, method, selector, seconds, outcome)
+    - Oldest entries are dropped once the buffer is full (counted in `dropped`)
+    """
+
+    def __init__(self, capacity=ACTION_TIMING_BUFFER):
+        self.buffer = deque(maxlen=capacity)
+        self.total_calls = 0
+
+    @property
+    def dropped(self):
+        return self.total_calls - len(self.buffer)
+
+    def record(self, page_object, method, selector, seconds, outcome):
+        self.total_calls += 1
+        self.buffer.append((page_object, method, selector, seconds, outcome))
+
+    @staticmethod
+    def _stats(durations, outcomes):
+        durations = sorted(durations)
+        return {
+            "calls": len(durations),
+            "p50_ms": round(percentile(durations, 0.50) * 1000, 1),
+            "p95_ms": round(percentile(durations, 0.95) * 1000, 1),
+            "max_ms": round(durations[-1] * 1000, 1),
+            "total_ms": round(sum(durations) * 1000, 1),
+            "outcomes": dict(outcomes),
+        }
+
+    def aggregate(self):
+        """
+        Aggregate the buffer into latency tables, hottest (largest total time) first:
+        - by_selector: per page object + method + selector
+        - by_page_object: per page object + method
+        """
+        groups = {"by_selector": {}, "by_page_object": {}}
+        for page_object, method, selector, seconds, outcome in self.buffer:
+            for table, key in (("by_selector", (page_object, method, selector)), ("by_page_object", (page_object, method))):
+                durations, outcomes = groups[table].setdefault(key, ([], {}))
+                durations.append(seconds)
+                outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+        report = {"total_calls": self.total_calls, "dropped": self.dropped}
+        for table, entries in groups.items():
+            rows = []
+            for key, (durations, outcomes) in entries.items():
+                row = dict(zip(("page_object", "method", "selector"), key))
+                row.update(self._stats(durations, outcomes))
+                rows.append(row)
+            report[table] = sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+        return report
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.aggregate(), f, indent=2)
+        return path
+
+    def summary(self):
+        """Hot-path line for the run summary (top 3 selectors by total time)."""
+        if not self.total_calls:
+            return ""
+        hottest = self.aggregate()["by_selector"][:3]
+        parts = [f"{row['page_object']}.{row['method']}({row['selector']}) total={row['total_ms']:.0f}ms p95={row['p95_ms']:.0f}ms"
+                 for row in hottest]
+        return f"{self.total_calls} calls; hottest: " + "; ".join(parts)
+
+
+# Process-wide recorder used by install()
+recorder = ActionRecorder()
+
+
+def selector_key(selector):
+    """
+    Stable report key for the first argument of a primitive:
+    - selector strings as-is
+    - snapshot field maps as {field, ...} (field names, not the generated selectors)
+    - Locators by their selector chain (str(locator) embeds the frame URL, which varies per page)
+    """
+    if isinstance(selector, str):
+        return selector
+    if isinstance(selector, dict):
+        return "{" + ", ".join(selector) + "}"
+    impl = getattr(selector, "_impl_obj", selector)  # sync/async API wrappers hold the Locator implementation
+    return getattr(impl, "_selector", None) or type(selector).__name__
+
+
+def _outcome_for(result):
+    """Classify non-raising results where absence is the answer (find_elements / is_element_exist / elem_count)."""
+    return "empty" if result in (False, 0) or result == [] else "ok"
+
+
+def _timed(method, func, action_recorder):
+    @functools.wraps(func)
+    def wrapper(self, selector, *args, **kwargs):
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            result = func(self, selector, *args, **kwargs)
+            outcome = _outcome_for(result)
+            return result
+        except Exception as e:
+            # playwright.sync_api and playwright.async_api share TimeoutError
+            outcome = "timeout" if isinstance(e, TimeoutError) else "error"
+            raise
+        finally:
+            action_recorder.record(
+                type(self).__name__, method, selector_key(selector),
+                time.perf_counter() - start, outcome,
+            )
+    wrapper.__untimed__ = func
+    return wrapper
+
+
+def install(cls=None, action_recorder=recorder):
+    """
+    Wrap BasePage primitives with timing wrappers (idempotent).
+    Uninstalled classes run the original methods, so disabled instrumentation costs nothing.
+    """
+    if cls is None:
+        from pages.base_page import BasePage
+        cls = BasePage
+    for method in INSTRUMENTED_METHODS:
+        func = cls.__dict__[method]
+        if not hasattr(func, "__untimed__"):
+            setattr(cls, method, _timed(method, func, action_recorder))
+    logger.info(f"Action timing instrumentation installed on {cls.__name__}")
+
+
+def uninstall(cls=None):
+    """Restore the original (untimed) BasePage primitives."""
+    if cls is None:
+        from pages.base_page import BasePage
+        cls = BasePage
+    for method in INSTRUMENTED_METHODS:
+        func = cls.__dict__[method]
+        if hasattr(func, "__untimed__"):
+            setattr(cls, method, func.__untimed__)
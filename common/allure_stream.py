@@ -0,0 +1,145 @@
+# common/allure_stream.py
+import os
+import gzip
+import json
+import uuid
+import hashlib
+import logging
+import shutil
+from attr import asdict
+from allure_commons import hookimpl
+from allure_commons.logger import AllureFileLogger
+from config.config import ALLURE_COMPRESS_MIN_KB
+
+# Initialize logger for allure streaming module
+logger = logging.getLogger(__name__)
+
+# Result/container fields that can hold attachments (directly or in nested steps)
+NESTED_FIELDS = ("attachments", "steps", "befores", "afters")
+
+# Text attachments worth compressing (images and trace zips are compressed already)
+COMPRESSIBLE_EXTENSIONS = (".txt", ".log", ".json", ".html", ".xml", ".csv", ".uri")
+COMPRESSED_TYPE = "application/gzip"
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class StreamingAllureLogger(AllureFileLogger):
+    """
+    Drop-in replacement for allure-pytest's AllureFileLogger:
+    - Results/containers are written once, as compact JSON, via temp file + rename
+      (a crashed or cancelled run never leaves half-written result files)
+    - Attachments are deduplicated by content hash: identical screenshots, traces or logs are
+      stored once and later references are rewritten to the stored file before the result is written
+    - Text attachments of at least compress_min_kb are stored gzipped (<name>.gz, application/gzip,
+      offered as a download by the report); 0 disables compression
+    """
+
+    def __init__(self, report_dir, compress_min_kb=ALLURE_COMPRESS_MIN_KB):
+        super().__init__(report_dir, clean=False)
+        self.compress_min_bytes = compress_min_kb * 1024
+        self._by_hash = {}
+        self._aliases = {}
+        self._compressed = set()
+        self.stats = {"results": 0, "attachments": 0, "deduplicated": 0, "compressed": 0, "bytes_saved": 0}
+
+    def _compress(self, file_name, size):
+        return bool(self.compress_min_bytes) and size >= self.compress_min_bytes and file_name.endswith(COMPRESSIBLE_EXTENSIONS)
+
+    def _store(self, digest, file_name, size, read):
+        """Write an attachment (gzipped when worth it) unless identical content is already stored."""
+        existing = self._by_hash.get(digest)
+        if existing is not None:
+            self._aliases[file_name] = existing
+            self.stats["deduplicated"] += 1
+            self.stats["bytes_saved"] += size
+            return
+        stored_name = file_name
+        if self._compress(file_name, size):
+            stored_name = f"{file_name}.gz"
+            path = self._report_dir / stored_name
+            with gzip.open(path, "wb") as f:
+                f.write(read())
+            self._aliases[file_name] = stored_name
+            self._compressed.add(stored_name)
+            self.stats["compressed"] += 1
+            self.stats["bytes_saved"] += size - os.path.getsize(path)
+        else:
+            with open(self._report_dir / stored_name, "wb") as f:
+                f.write(read())
+        self._by_hash[digest] = stored_name
+        self.stats["attachments"] += 1
+
+    def _alias_sources(self, item):
+        """Point attachment sources of an item (and its nested steps/fixtures) at the stored files."""
+        source = getattr(item, "source", None)
+        if source in self._aliases:
+            item.source = self._aliases[source]
+            if item.source in self._compressed:
+                item.type = COMPRESSED_TYPE
+        for field in NESTED_FIELDS:
+            for child in getattr(item, field, None) or ():
+                self._alias_sources(child)
+
+    def _report_item(self, item):
+        self._alias_sources(item)
+        data = asdict(item, filter=lambda _, value: value or value is False)
+        path = self._report_dir / item.file_pattern.format(prefix=uuid.uuid4())
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+        self.stats["results"] += 1
+
+    @hookimpl
+    def report_attached_file(self, source, file_name):
+        def read():
+            with open(source, "rb") as f:
+                return f.read()
+        self._store(_file_digest(source), file_name, os.path.getsize(source), read)
+
+    @hookimpl
+    def report_attached_data(self, body, file_name):
+        data = body.encode("utf-8") if isinstance(body, str) else body
+        self._store(hashlib.sha256(data).hexdigest(), file_name, len(data), lambda: data)
+
+    def summary(self):
+        """One-line summary for the run summary."""
+        if not self.stats["results"]:
+            return ""
+        return (
+            f"results={self.stats['results']} attachments={self.stats['attachments']} "
+            f"deduplicated={self.stats['deduplicated']} compressed={self.stats['compressed']} "
+            f"({self.stats['bytes_saved'] / (1024 * 1024):.1f}MB saved)"
+        )
+
+
+def install(config):
+    """
+    Swap allure-pytest's file logger for the streaming one (same results directory).
+    allure-pytest's own cleanup unregisters its logger at exit, so it is re-registered
+    (idle) just before that happens.
+    :return: The StreamingAllureLogger, or None when --alluredir is not set
+    """
+    import allure_commons
+
+    for plugin in allure_commons.plugin_manager.get_plugins():
+        if type(plugin) is AllureFileLogger:
+            streaming = StreamingAllureLogger(plugin._report_dir)
+            allure_commons.plugin_manager.unregister(plugin)
+            allure_commons.plugin_manager.register(streaming)
+
+            def restore():
+                allure_commons.plugin_manager.unregister(streaming)
+                allure_commons.plugin_manager.register(plugin)
+
+            config.add_cleanup(restore)
+            logger.info(f"Streaming Allure results into {plugin._report_dir}")
+            return streaming
+    return None
@@ -0,0 +1,123 @@
+# common/async_runner.py
+"""
+Concurrent journey runner on the asyncio page objects:
+- One shared browser, one fresh context per journey
+- Journeys mirror test_end_to_end_checkout_flow: login -> add to cart -> checkout -> assertions
+- asyncio.Semaphore caps the number of journeys in flight
+
+Usage: python -m common.async_runner --journeys 50 --concurrency 10
+"""
+import sys
+import time
+import asyncio
+import argparse
+import logging
+from playwright.async_api import async_playwright
+from config.config import TEST_URL, TARGET, LOCAL_HOST, LOCAL_PORT
+from common.logger_config import configure_logging
+from pages.async_pages import AsyncLoginPage, AsyncAddToCartPage, AsyncCheckoutPage
+
+# Initialize logger for async runner module
+logger = logging.getLogger(__name__)
+
+
+async def checkout_journey(browser, context_args=None):
+    """
+    Run one end-to-end checkout journey in its own browser context:
+    1. Login via UI
+    2. Add the first product to the cart
+    3. Checkout and verify name/price consistency between cart and order review
+    :return: Journey duration in seconds
+    :raises AssertionError: On cart count or name/price mismatch
+    """
+    start = time.perf_counter()
+    context = await browser.new_context(**(context_args or {}))
+    try:
+        page = await context.new_page()
+        await page.goto(TEST_URL)
+        await AsyncLoginPage(page).login()
+
+        cart_product_info = await AsyncAddToCartPage(page).add_to_cart()
+        assert cart_product_info["original_num"] >= 1, \
+            f"Cart count validation failed: Expected ≥1, Actual={cart_product_info['original_num']}"
+
+        order_product_info = await AsyncCheckoutPage(page).checkout()
+        assert cart_product_info["original_name"] == order_product_info["name"], \
+            f"Product name mismatch: Cart={cart_product_info['original_name']}, Order={order_product_info['name']}"
+        assert cart_product_info["original_price"] == order_product_info["price"], \
+            f"Product price mismatch: Cart={cart_product_info['original_price']}, Order={order_product_info['price']}"
+        return time.perf_counter() - start
+    finally:
+        await context.close()
+
+
+async def run_journeys(browser, journeys, concurrency, journey=checkout_journey):
+    """
+    Run `journeys` journeys on one browser with at most `concurrency` in flight.
+    :return: Dict with passed/failed counts, wall time, throughput and latency figures
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    durations, errors = [], []
+
+    async def guarded(index):
+        async with semaphore:
+            try:
+                durations.append(await journey(browser))
+            except Exception as e:
+                errors.append(f"journey {index}: {type(e).__name__}: {str(e)}")
+                logger.error(f"Journey {index} failed. Error: {str(e)}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(guarded(index) for index in range(journeys)))
+    wall = time.perf_counter() - start
+
+    durations.sort()
+    return {
+        "journeys": journeys,
+        "concurrency": concurrency,
+        "passed": len(durations),
+        "failed": len(errors),
+        "wall_seconds": round(wall, 2),
+        "journeys_per_second": round(len(durations) / wall, 2) if wall else 0.0,
+        "mean_seconds": round(sum(durations) / len(durations), 2) if durations else None,
+        "max_seconds": round(durations[-1], 2) if durations else None,
+        "errors": errors,
+    }
+
+
+async def main_async(journeys, concurrency, headed=False):
+    server = None
+    if TARGET == "local":
+        from standin.server import ensure_running
+        server = ensure_running(LOCAL_HOST, LOCAL_PORT)
+    try:
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=not headed)
+            try:
+                return await run_journeys(browser, journeys, concurrency)
+            finally:
+                await browser.close()
+    finally:
+        if server is not None:
+            server.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run checkout journeys concurrently on one browser")
+    parser.add_argument("--journeys", type=int, default=20, help="Total journeys to run")
+    parser.add_argument("--concurrency", type=int, default=5, help="Maximum journeys in flight")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    args = parser.parse_args(argv)
+
+    configure_logging()
+    result = asyncio.run(main_async(args.journeys, args.concurrency, args.headed))
+    for key, value in result.items():
+        if key != "errors":
+            print(f"{key}: {value}")
+    for error in result["errors"]:
+        print(error)
+    return 1 if result["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+# common/browser_profile.py
+import os
+import json
+import logging
+from config.config import BROWSER_PROFILE, LEAN_VIEWPORT, CONTEXT_MEMORY_BUDGET_MB, CONTEXT_MEMORY_FILE
+
+# Initialize logger for browser profile module
+logger = logging.getLogger(__name__)
+
+PROFILES = ("default", "lean")
+
+# Chromium switches for the lean profile: no GPU, extensions or background networking,
+# and images are neither fetched nor decoded (no page object reads images)
+LEAN_LAUNCH_ARGS = [
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-component-extensions-with-background-pages",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--mute-audio",
+    "--blink-settings=imagesEnabled=false",
+]
+
+# Injected into every document of a lean context: no animations, transitions or caret blinking
+NO_ANIMATIONS_SCRIPT = """
+(() => {
+    const css = '*, *::before, *::after { animation: none !important; transition: none !important; caret-color: transparent !important; }';
+    const inject = () => {
+        const style = document.createElement('style');
+        style.textContent = css;
+        (document.head || document.documentElement).appendChild(style);
+    };
+    if (document.readyState === 'loading') document.addEventListener('DOMContentLoaded', inject);
+    else inject();
+})();
+"""
+
+
+def _check(profile):
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown browser profile {profile!r}, expected one of {PROFILES}")
+    return profile
+
+
+def launch_args(base_args=None, profile=BROWSER_PROFILE):
+    """Browser launch options for the profile, merged onto base_args (e.g. pytest-playwright's --headed)."""
+    args = dict(base_args or {})
+    if _check(profile) == "lean":
+        args["args"] = list(args.get("args", [])) + LEAN_LAUNCH_ARGS
+    return args
+
+
+def context_args(base_args=None, profile=BROWSER_PROFILE):
+    """new_context() options for the profile: small viewport and reduced motion when lean."""
+    args = dict(base_args or {})
+    if _check(profile) == "lean":
+        args.setdefault("viewport", dict(LEAN_VIEWPORT))
+        args["reduced_motion"] = "reduce"
+    return args
+
+
+def prepare_context(context, profile=BROWSER_PROFILE):
+    """Per-context setup that cannot be expressed as new_context() options (CSS injection)."""
+    if _check(profile) == "lean":
+        context.add_init_script(NO_ANIMATIONS_SCRIPT)
+
+
+def tree_rss_bytes(root_pid=None):
+    """
+    Resident memory of a process and all of its descendants (Playwright driver + browser processes).
+    Reads /proc, so Linux only; returns 0 elsewhere.
+    """
+    root_pid = root_pid or os.getpid()
+    if not os.path.isdir("/proc"):
+        return 0
+    parents, rss = {}, {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", encoding="utf-8") as f:
+                # Field 4 (after the parenthesised command name) is the parent pid
+                parents[int(entry)] = int(f.read().rsplit(")", 1)[1].split()[1])
+            with open(f"/proc/{entry}/statm", encoding="utf-8") as f:
+                rss[int(entry)] = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, IndexError, ValueError):
+            continue
+    total = 0
+    for pid in rss:
+        current = pid
+        while current and current != root_pid:
+            current = parents.get(current)
+        if current == root_pid:
+            total += rss[pid]
+    return total
+
+
+class ContextMemoryMonitor:
+    """
+    Per-context memory tracking:
+    - heap_mb(page): JS heap of a context's page via CDP Performance.getMetrics (Chromium only)
+    - over_budget(page): heap above budget_mb -> the caller recycles the context
+    - sample(live_contexts): process-tree RSS above the browser's baseline, per live context,
+      giving the contexts-per-GB figure; the last figure per profile is kept in history_path
+      so the run summary can show the default (before) and lean (after) profiles side by side
+    """
+
+    def __init__(self, budget_mb=CONTEXT_MEMORY_BUDGET_MB, profile=BROWSER_PROFILE, history_path=CONTEXT_MEMORY_FILE):
+        self.budget_mb = budget_mb
+        self.profile = _check(profile)
+        self.history_path = history_path
+        self.baseline_bytes = None
+        self.per_context_mb = []
+        self.stats = {"checked": 0, "over_budget": 0, "peak_heap_mb": 0.0}
+        self._sessions = {}
+
+    def set_baseline(self):
+        """Record process-tree RSS with the browser running but no contexts open."""
+        self.baseline_bytes = tree_rss_bytes()
+
+    def heap_mb(self, page):
+        """JS heap size of the page in MB, or None if it cannot be measured (non-Chromium, closed page)."""
+        try:
+            session = self._sessions.get(id(page))
+            if session is None:
+                session = page.context.new_cdp_session(page)
+                session.send("Performance.enable")
+                self._sessions[id(page)] = session
+            metrics = {item["name"]: item["value"] for item in session.send("Performance.getMetrics")["metrics"]}
+        except Exception as e:
+            logger.debug(f"Context memory not measurable. Error: {str(e)}")
+            return None
+        return metrics.get("JSHeapTotalSize", 0) / (1024 * 1024)
+
+    def over_budget(self, page):
+        heap = self.heap_mb(page)
+        if heap is None:
+            return False
+        self.stats["checked"] += 1
+        self.stats["peak_heap_mb"] = max(self.stats["peak_heap_mb"], heap)
+        if heap <= self.budget_mb:
+            return False
+        self.stats["over_budget"] += 1
+        logger.info(f"Context JS heap {heap:.1f}MB exceeds budget {self.budget_mb}MB, recycling it")
+        return True
+
+    def forget(self, page):
+        """Drop the cached CDP session of a page whose context is being closed."""
+        self._sessions.pop(id(page), None)
+
+    def sample(self, live_contexts):
+        """Record browser memory per live context (needs set_baseline() first)."""
+        if self.baseline_bytes is None or live_contexts <= 0:
+            return
+        used = tree_rss_bytes() - self.baseline_bytes
+        if used > 0:
+            self.per_context_mb.append(used / live_contexts / (1024 * 1024))
+
+    def contexts_per_gb(self):
+        if not self.per_context_mb:
+            return None
+        return 1024 / (sum(self.per_context_mb) / len(self.per_context_mb))
+
+    def _load_history(self):
+        try:
+            with open(self.history_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        """Store this run's contexts-per-GB figure under the active profile."""
+        figure = self.contexts_per_gb()
+        if figure is None:
+            return
+        history = self._load_history()
+        history[self.profile] = round(figure, 1)
+        tmp_path = f"{self.history_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(history, f, indent=2)
+        os.replace(tmp_path, self.history_path)
+
+    def summary(self):
+        """One-line summary for the run summary."""
+        figure = self.contexts_per_gb()
+        if figure is None and not self.stats["checked"]:
+            return ""
+        history = self._load_history()
+        parts = [f"profile={self.profile}"]
+        if figure is not None:
+            parts.append(f"contexts_per_GB={figure:.1f}")
+        for profile in PROFILES:
+            if profile != self.profile and profile in history:
+                parts.append(f"({profile}: {history[profile]})")
+        parts.append(f"peak_heap={self.stats['peak_heap_mb']:.1f}MB over_budget_recycled={self.stats['over_budget']}")
+        return " ".join(parts)
@@ -0,0 +1,144 @@
+# common/catalog.py
+import os
+import re
+import sys
+import json
+import time
+import logging
+from decimal import Decimal
+from collections import namedtuple
+from urllib.parse import urljoin
+from config.config import TEST_URL, TARGET, LOCAL_HOST, LOCAL_PORT, CATALOG_FILE, CATALOG_TTL
+from pages.base_page import BasePage
+from pages.snapshot import attribute, price, rows
+
+# Initialize logger for catalog module
+logger = logging.getLogger(__name__)
+
+# How to refresh the cache; test collection only ever reads it
+REFRESH_HINT = "refresh it with python -m common.catalog or pytest --refresh-catalog"
+
+# One inventory product as shown on inventory.html (price as Decimal)
+CatalogItem = namedtuple("CatalogItem", ["id", "slug", "name", "price"])
+
+# Every inventory card in one snapshot; id from the title link, slug from the add/remove button
+CATALOG_FIELDS = {
+    "cards": rows(
+        '[data-test="inventory-item"]',
+        link=attribute('a[id$="_title_link"]', "id"),
+        action=attribute('button[data-test^="add-to-cart-"], button[data-test^="remove-"]', "data-test"),
+        name='[data-test="inventory-item-name"]',
+        price=price('[data-test="inventory-item-price"]'),
+    ),
+}
+
+
+def scrape_catalog(page):
+    """
+    Scrape the inventory catalogue from a logged-in page (navigates to inventory.html if needed).
+    :return: List of CatalogItem in display order
+    """
+    if not page.url.endswith("inventory.html"):
+        page.goto(urljoin(TEST_URL, "inventory.html"))
+    page.wait_for_selector('[data-test="inventory-item"]')
+    items = []
+    for card in BasePage(page).snapshot(CATALOG_FIELDS).cards:
+        link_id = re.match(r"item_(\d+)_title_link$", card.link or "")
+        slug = re.sub(r"^(add-to-cart|remove)-", "", card.action or "")
+        items.append(CatalogItem(int(link_id.group(1)) if link_id else None, slug or None, card.name, card.price))
+    return items
+
+
+def load_catalog(path=CATALOG_FILE, ttl=CATALOG_TTL):
+    """Return the cached catalogue for the current TEST_URL, or None if missing, stale or for another site."""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable catalogue cache {path}. Error: {str(e)}")
+        return None
+    if cached.get("url") != TEST_URL or time.time() - cached.get("saved_at", 0) > ttl:
+        return None
+    return [CatalogItem(**dict(item, price=Decimal(item["price"]))) for item in cached["items"]]
+
+
+def save_catalog(items, path=CATALOG_FILE):
+    """Write the catalogue cache atomically (parallel workers may read it concurrently)."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"url": TEST_URL, "saved_at": time.time(), "items": [dict(item._asdict(), price=str(item.price)) for item in items]}, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def refresh_catalog(path=CATALOG_FILE, context_options=None):
+    """
+    Scrape the catalogue with a short-lived headless browser and cache it:
+    1. Start the local stand-in when TARGET is local (no-op if already served)
+    2. Reuse (or create) the cached login session
+    3. Scrape inventory.html once and save it to the catalogue cache
+    :param context_options: new_context() options (default: the browser profile's, as the test fixtures use)
+    """
+    from playwright.sync_api import sync_playwright
+    from common.session_state import ensure_state
+    from common.browser_profile import launch_args, context_args
+
+    context_options = context_args() if context_options is None else context_options
+    server = None
+    if TARGET == "local":
+        from standin.server import ensure_running
+        server = ensure_running(LOCAL_HOST, LOCAL_PORT)
+    try:
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch(**launch_args())
+            try:
+                context = browser.new_context(**context_options, storage_state=ensure_state(browser, context_args=context_options))
+                items = scrape_catalog(context.new_page())
+            finally:
+                browser.close()
+    finally:
+        if server is not None:
+            server.stop()
+
+    save_catalog(items, path)
+    logger.info(f"Scraped {len(items)} products into {path}")
+    return items
+
+
+def get_catalog(path=CATALOG_FILE):
+    """
+    Cached catalogue if fresh, otherwise scrape it (falling back to a stale cache if scraping fails).
+    Explicit refresh steps only (parallel runner, --refresh-catalog); collection uses load_catalog().
+    """
+    items = load_catalog(path)
+    if items is not None:
+        return items
+    try:
+        return refresh_catalog(path)
+    except Exception as e:
+        stale = load_catalog(path, ttl=float("inf"))
+        if not stale:
+            raise
+        logger.warning(f"Catalogue scrape failed, using stale cache. Error: {str(e)}")
+        return stale
+
+
+def multi_item_carts(items):
+    """Multi-item cart combinations: consecutive pairs plus one cart holding every product."""
+    carts = [items[index:index + 2] for index in range(0, len(items) - 1, 2)]
+    if len(items) > 2:
+        carts.append(list(items))
+    return carts
+
+
+def main():
+    """Scrape the catalogue now (python -m common.catalog)."""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    items = refresh_catalog()
+    print(f"Cached {len(items)} products in {CATALOG_FILE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,23 +1,117 @@
 # common/clearcart.py
-from pages.base_page import BasePage
+import time
 import logging
+from urllib.parse import urljoin
+from config.config import TEST_URL, CLEAR_CART_MODE
+from pages.base_page import BasePage
 
 # Initialize logger for clearcart module
 logger = logging.getLogger(__name__)
 
-def clearcart(driver):
+# Locators (generalized to match all remove buttons)
+shopping_cart_btn = '.shopping_cart_link'
+cart_badge = '.shopping_cart_badge'
+remove_btns_locator = "//button[contains(@id, 'remove-')]"
+# Always on the cart page, with or without items (page-ready check before counting items)
+cart_checkout_btn = "#checkout"
+menu_btn = "#react-burger-menu-btn"
+all_items_btn = "#inventory_sidebar_link"
+
+# localStorage key holding the app's client-side cart (list of product ids)
+CART_STORAGE_KEY = "cart-contents"
+
+
+class ClearCartTimings:
+    """Per-mode wall-clock timings of clearcart() calls, shown in the run summary."""
+
+    def __init__(self):
+        self.samples = {"fast": [], "click": []}
+
+    def record(self, mode, seconds):
+        self.samples[mode].append(seconds)
+
+    def summary(self):
+        parts = []
+        for mode, values in self.samples.items():
+            if values:
+                parts.append(f"{mode}: n={len(values)} mean={sum(values) / len(values) * 1000:.0f}ms max={max(values) * 1000:.0f}ms")
+        return " | ".join(parts)
+
+
+timings = ClearCartTimings()
+
+
+def clearcart(driver, mode=CLEAR_CART_MODE, return_to_inventory=True):
     """
     Universal shopping cart clearing function:
-    - Compatible with scenarios with 1 or multiple items in cart
-    - Return directly if cart is empty
+    - mode="fast": resets the app's client-side cart state in one step (no per-item clicks),
+      verified with a single badge check; falls back to click mode if the UI disagrees
+    - mode="click": opens the cart and clicks every remove button (compatible with 1 or many items)
+    - return_to_inventory (default True): both modes end on inventory.html; fast mode opens it
+      directly instead of walking the burger menu. False stays on the current page
     - Log exceptions and re-raise for troubleshooting
     """
-    # Locators (generalized to match all remove buttons)
-    shopping_cart_btn = '.shopping_cart_link'
-    remove_btns_locator = "//button[contains(@id, 'remove-')]"
-    menu_btn = "#react-burger-menu-btn"
-    all_items_btn = "#inventory_sidebar_link"
+    if mode == "fast":
+        start = time.perf_counter()
+        try:
+            if _clear_cart_fast(driver, return_to_inventory):
+                timings.record("fast", time.perf_counter() - start)
+                logger.info(f"Shopping cart reset in fast mode ({(time.perf_counter() - start) * 1000:.0f} ms)")
+                return
+            logger.warning("Fast cart reset not reflected in the UI, falling back to click-by-click clearing")
+        except Exception as e:
+            logger.warning(f"Fast cart reset failed, falling back to click-by-click clearing. Error: {str(e)}")
+
+    start = time.perf_counter()
+    _clear_cart_by_click(driver, return_to_inventory)
+    timings.record("click", time.perf_counter() - start)
+    logger.info(f"Shopping cart cleared in click mode ({(time.perf_counter() - start) * 1000:.0f} ms)")
+
+
+def _clear_cart_fast(driver, return_to_inventory):
+    """
+    Reset the cart through the app's own client-side state:
+    1. Remove the persisted cart from localStorage (what "Reset App State" does)
+    2. Reload (or open inventory) so the app re-reads the empty state
+    3. Verify once: header rendered and no cart badge
+    :return: True if the UI shows an empty cart
+    """
+    driver.evaluate(f"() => localStorage.removeItem('{CART_STORAGE_KEY}')")
+    if return_to_inventory:
+        driver.goto(urljoin(TEST_URL, "inventory.html"))
+    else:
+        driver.reload()
+
+    base_page = BasePage(driver)
+    base_page.wait_elem_visible(shopping_cart_btn)
+    return base_page.elem_count(cart_badge) == 0
+
+
+async def clearcart_async(driver, return_to_inventory=True):
+    """
+    asyncio twin of clearcart(mode="fast") for the async page objects (load runner):
+    same client-side reset and single badge check, no click fallback
+    :raises AssertionError: If the UI still shows cart items after the reset
+    """
+    # Imported here so sync callers never load playwright.async_api
+    from pages.async_base_page import AsyncBasePage
 
+    start = time.perf_counter()
+    await driver.evaluate(f"() => localStorage.removeItem('{CART_STORAGE_KEY}')")
+    if return_to_inventory:
+        await driver.goto(urljoin(TEST_URL, "inventory.html"))
+    else:
+        await driver.reload()
+
+    base_page = AsyncBasePage(driver)
+    await base_page.wait_elem_visible(shopping_cart_btn)
+    if await base_page.elem_count(cart_badge):
+        raise AssertionError("Cart badge still visible after fast cart reset")
+    timings.record("fast", time.perf_counter() - start)
+
+
+def _clear_cart_by_click(driver, return_to_inventory):
+    """Click-by-click clearing (verified fallback): open cart, remove each item, optionally return to inventory."""
     # Initialize BasePage (driver is required parameter)
     base_page = BasePage(driver)
 
@@ -26,27 +120,31 @@ def clearcart(driver):
         base_page.elem_click(shopping_cart_btn)
         logger.info("Successfully navigated to shopping cart page")
 
-        # Step 2: Locate all remove buttons (use find_elements instead of is_element_exist)
-        remove_btns = base_page.find_elements(remove_btns_locator)
+        # Step 2: Wait for the cart page, then list the remove buttons without waiting
+        # (an empty cart is a valid answer, not a timeout)
+        base_page.wait_elem_visible(cart_checkout_btn)
+        driver.wait_for_load_state("domcontentloaded")
+        remove_btns = base_page.locator(remove_btns_locator).all()
 
-        # Step 3: Check if cart is empty - return immediately if true
+        # Step 3: Check if cart is empty - skip removal logic if true
         if not remove_btns:
             logger.info("Shopping cart is already empty, no need to clear")
-            # Optional: Return to inventory page even if cart is empty (adjust per requirements)
-            base_page.elem_click(menu_btn)
-            base_page.elem_click(all_items_btn)
-            return  # Critical: Terminate function to skip removal logic
-
-        # Step 4: Remove all items one by one (core logic)
-        for btn in remove_btns:
-            base_page.elem_click(btn)
-            logger.info("Successfully removed one cart item")
+        else:
+            # Step 4: Remove all items one by one (core logic)
+            # Last-to-first: nth() locators re-resolve, so earlier indices stay valid after each removal
+            for btn in reversed(remove_btns):
+                base_page.elem_click(btn)
+                logger.info("Successfully removed one cart item")
 
-        logger.info("All items in shopping cart have been cleared")
+            # Step 5: Verify with a single badge check
+            if base_page.elem_count(cart_badge):
+                raise AssertionError("Cart badge still visible after removing all items")
+            logger.info("All items in shopping cart have been cleared")
 
-        # Step 5: Return to inventory page after successful removal (execute once)
-        base_page.elem_click(menu_btn)
-        base_page.elem_click(all_items_btn)
+        # Step 6: Return to inventory page (execute once, only when requested)
+        if return_to_inventory:
+            base_page.elem_click(menu_btn)
+            base_page.elem_click(all_items_btn)
 
     except Exception as e:
         # Exception fallback: Return to inventory page + log error + re-raise exception
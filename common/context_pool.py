@@ -0,0 +1,191 @@
+# common/context_pool.py
+import json
+import time
+import logging
+from collections import deque
+from urllib.parse import urljoin
+from config.config import TEST_URL, CONTEXT_POOL_SIZE, CONTEXT_MAX_USES, STATE_TTL
+from common.wait_policy import policy as wait_policy
+
+# Initialize logger for context pool module
+logger = logging.getLogger(__name__)
+
+# Markers of a healthy parked page (logged-in inventory page)
+HOMEPAGE_TITLE = ".app_logo"
+LANDING_PATH = "inventory.html"
+
+# Client-side state cleared between tests (the app's cart lives in localStorage)
+RESET_SCRIPT = "() => { localStorage.removeItem('cart-contents'); sessionStorage.clear(); }"
+
+
+class PooledContext:
+    """A browser context + its single page, with usage bookkeeping."""
+
+    def __init__(self, context, page, cookies):
+        self.context = context
+        self.page = page
+        self.cookies = cookies  # Logged-in cookies restored on every release
+        self.uses = 0
+        self.created_at = time.time()
+
+
+class ContextPool:
+    """
+    Session-wide pool of warm browser contexts, logged in and parked on inventory.html:
+    - acquire(): hands out a parked context (hit) or builds one on demand (miss)
+    - release(): resets client-side state, re-parks and health-checks the context, or
+      recycles it after a failed test, max_uses checkouts, max_age seconds or when its
+      memory is over budget (optional ContextMemoryMonitor)
+    - Warming runs at session start and on release (test teardown). Playwright's sync API is
+      bound to the thread that created it, so contexts cannot be built on a background thread;
+      topping up between tests keeps the work off the tests' own critical path.
+    """
+
+    def __init__(self, browser, state_provider, size=CONTEXT_POOL_SIZE, max_uses=CONTEXT_MAX_USES,
+                 max_age=STATE_TTL, context_args=None, prepare=None, memory_monitor=None):
+        """
+        :param browser: Playwright Browser kept alive for the session
+        :param state_provider: Callable returning a fresh storage_state path (see conftest.login_state)
+        :param prepare: Optional callable applied to every new context (e.g. NetworkRouter.install)
+        :param memory_monitor: Optional ContextMemoryMonitor enforcing the per-context memory budget
+        """
+        self.browser = browser
+        self.state_provider = state_provider
+        self.size = size
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self.context_args = dict(context_args or {})
+        self.prepare = prepare
+        self.memory_monitor = memory_monitor
+        self.idle = deque()
+        self.stats = {"acquired": 0, "hits": 0, "misses": 0, "recycled": 0, "health_failures": 0, "wait_seconds": 0.0}
+        self.checked_out = 0
+
+    def _landing_url(self):
+        return urljoin(TEST_URL, LANDING_PATH)
+
+    def _park(self, page):
+        """Navigate to the inventory page and wait until it has rendered."""
+        page.goto(self._landing_url())
+        timeout = wait_policy.timeout_for(HOMEPAGE_TITLE)
+        with wait_policy.track(HOMEPAGE_TITLE, timeout):
+            page.wait_for_selector(HOMEPAGE_TITLE, timeout=timeout)
+
+    def _create(self):
+        """Build a new logged-in context parked on the inventory page (closed again if any step fails)."""
+        state_path = self.state_provider()
+        context = self.browser.new_context(**self.context_args, storage_state=state_path)
+        try:
+            if self.prepare:
+                self.prepare(context)
+            with open(state_path, encoding="utf-8") as f:
+                cookies = json.load(f).get("cookies", [])
+            page = context.new_page()
+            self._park(page)
+        except Exception:
+            try:
+                context.close()
+            except Exception as e:
+                logger.warning(f"Failed to close context after failed creation. Error: {str(e)}")
+            raise
+        return PooledContext(context, page, cookies)
+
+    def _healthy(self, pooled):
+        """Cheap, non-waiting checks that a parked context can be handed out."""
+        try:
+            return (
+                not pooled.page.is_closed()
+                and len(pooled.context.pages) == 1
+                and time.time() - pooled.created_at < self.max_age
+                and pooled.page.url.endswith(LANDING_PATH)
+                and pooled.page.is_visible(HOMEPAGE_TITLE)
+            )
+        except Exception:
+            return False
+
+    def _discard(self, pooled):
+        self.stats["recycled"] += 1
+        if self.memory_monitor:
+            self.memory_monitor.forget(pooled.page)
+        try:
+            pooled.context.close()
+        except Exception as e:
+            logger.warning(f"Failed to close recycled context. Error: {str(e)}")
+
+    def warm(self):
+        """Top the idle queue up to the configured size."""
+        while len(self.idle) < self.size:
+            self.idle.append(self._create())
+
+    def acquire(self):
+        """Check out a context (parked on inventory.html) for one test."""
+        start = time.perf_counter()
+        self.stats["acquired"] += 1
+        pooled = None
+        while self.idle:
+            candidate = self.idle.popleft()
+            if self._healthy(candidate):
+                pooled = candidate
+                self.stats["hits"] += 1
+                break
+            self.stats["health_failures"] += 1
+            self._discard(candidate)
+        if pooled is None:
+            self.stats["misses"] += 1
+            pooled = self._create()
+        pooled.uses += 1
+        self.checked_out += 1
+        self.stats["wait_seconds"] += time.perf_counter() - start
+        return pooled
+
+    def release(self, pooled, failed=False):
+        """
+        Return a context after a test:
+        - Failed tests, exhausted (max_uses), stale (max_age) or over-budget contexts are closed
+        - Otherwise extra pages are closed, cart/session storage and cookies are reset to the
+          logged-in state and the page is parked on inventory.html again
+        - The pool is topped up afterwards
+        """
+        self.checked_out -= 1
+        if self.memory_monitor:
+            # Sampled while the test's context is still open: idle + this one are live
+            self.memory_monitor.sample(len(self.idle) + self.checked_out + 1)
+        reusable = not failed and pooled.uses < self.max_uses and time.time() - pooled.created_at < self.max_age
+        if reusable and self.memory_monitor and self.memory_monitor.over_budget(pooled.page):
+            reusable = False
+        if reusable:
+            try:
+                for extra_page in pooled.context.pages[1:]:
+                    extra_page.close()
+                pooled.page.evaluate(RESET_SCRIPT)
+                pooled.context.clear_cookies()
+                pooled.context.add_cookies(pooled.cookies)
+                # Wait for the inventory page to render before the non-waiting health check
+                self._park(pooled.page)
+                reusable = self._healthy(pooled)
+            except Exception as e:
+                logger.warning(f"Context reset failed, recycling it. Error: {str(e)}")
+                reusable = False
+
+        if reusable:
+            self.idle.append(pooled)
+        else:
+            self._discard(pooled)
+        self.warm()
+
+    def close(self):
+        while self.idle:
+            self.idle.popleft().context.close()
+
+    def hit_rate(self):
+        return self.stats["hits"] / self.stats["acquired"] if self.stats["acquired"] else 0.0
+
+    def summary(self):
+        """One-line summary for the run summary."""
+        if not self.stats["acquired"]:
+            return ""
+        mean_wait_ms = self.stats["wait_seconds"] / self.stats["acquired"] * 1000
+        return (
+            f"acquired={self.stats['acquired']} hit_rate={self.hit_rate():.0%} mean_wait={mean_wait_ms:.0f}ms "
+            f"recycled={self.stats['recycled']} health_failures={self.stats['health_failures']}"
+        )
@@ -0,0 +1,381 @@
+# common/dependency_index.py
+import os
+import ast
+import json
+import inspect
+import logging
+import textwrap
+import functools
+import importlib
+import subprocess
+import contextlib
+from config.config import DEPENDENCY_INDEX_FILE
+
+# Initialize logger for dependency index module
+logger = logging.getLogger(__name__)
+
+# Page-object modules whose classes are instrumented (methods + locator attributes)
+PAGE_MODULES = (
+    "pages.base_page",
+    "pages.async_base_page",
+    "pages.login_page",
+    "pages.addtocart_page",
+    "pages.checkout_page",
+    "pages.clear_product_page",
+    "pages.async_pages",
+)
+
+# Page-object modules used by session-scoped setup (login), which a warm storage_state cache
+# can skip entirely: any change to them runs every test
+SESSION_MODULES = ("pages.login_page",)
+
+# Changes under these paths never affect test outcomes
+IGNORED_PREFIXES = ("benchmarks/", "docs/")
+IGNORED_SUFFIXES = (".md", ".gitignore")
+
+# Pseudo commit ref for --changed-since: the commit the index was last updated at
+LAST_RUN_REF = "last"
+
+
+def symbol_key(module, qualname, member):
+    """Index key of a class member, e.g. "pages.checkout_page:CheckoutFlow.checkout_btn"."""
+    return f"{module}:{qualname}.{member}"
+
+
+def _is_locator(value):
+    # Locators are selector strings and snapshot specs (dicts of Field / selector strings)
+    return isinstance(value, (str, dict))
+
+
+def spec_references(cls):
+    """
+    Class attributes each snapshot spec of a class is built from, read from its source
+    ({"cart_fields": {"cart_count"}}): the spec only holds copies of the selector strings,
+    so a test reading the spec depends on the locators named in it.
+    """
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(cls)))
+    except (OSError, TypeError, SyntaxError):
+        return {}
+    references = {}
+    for item in tree.body[0].body:
+        if isinstance(item, ast.Assign) and isinstance(item.value, ast.Dict):
+            names = {node.id for node in ast.walk(item.value) if isinstance(node, ast.Name) and node.id in cls.__dict__}
+            for target in item.targets:
+                if isinstance(target, ast.Name):
+                    references[target.id] = names
+    return references
+
+
+class RecordedLocator:
+    """
+    Stand-in for a class-level locator while recording is installed: returns the original
+    value and records its symbol keys on every read, through an instance or the class itself
+    (AddToCartPage.cart_count).
+    """
+
+    def __init__(self, recorder, value, keys):
+        self.recorder = recorder
+        self.value = value
+        self.keys = keys
+
+    def __get__(self, obj, objtype=None):
+        if self.recorder.current is not None:
+            self.recorder.current.update(self.keys)
+        return self.value
+
+
+class DependencyRecorder:
+    """
+    Records, per test, which page-object symbols it touched at runtime:
+    - Methods: every function defined on a page-object class is wrapped while installed
+      (recorded under the class that defines it, e.g. CheckoutFlow.checkout_flow)
+    - Locators: reads of class-level selector strings/specs, through an instance or the class
+      (RecordedLocator); reading a snapshot spec also records the locators it is built from
+    - Symbols touched while session/module-scoped fixtures set up (login, context pool) go to
+      `session`: every test depends on them
+    - Symbols touched outside tests and fixtures (collection) are not recorded
+    """
+
+    def __init__(self):
+        self.dependencies = {}
+        self.session = set()
+        self.current = None
+        self._wrapped = []
+        self._replaced = []
+
+    def start(self, nodeid):
+        self.current = self.dependencies.setdefault(nodeid, set())
+
+    def stop(self):
+        self.current = None
+
+    @contextlib.contextmanager
+    def session_scope(self):
+        """Attribute everything touched inside the block to the session set (shared fixture setup)."""
+        previous, self.current = self.current, self.session
+        try:
+            yield
+        finally:
+            self.current = previous
+
+    def _wrap(self, cls, name, func):
+        key = symbol_key(cls.__module__, cls.__qualname__, name)
+        recorder = self
+
+        # updated=() keeps markers of other instrumentation (action timing) off this wrapper
+        @functools.wraps(func, updated=())
+        def wrapper(*args, **kwargs):
+            if recorder.current is not None:
+                recorder.current.add(key)
+            return func(*args, **kwargs)
+        wrapper.__untracked__ = func
+        return wrapper
+
+    def install(self, modules=PAGE_MODULES):
+        """Instrument every class defined in the page-object modules (idempotent)."""
+        if self._wrapped:
+            return
+        for module_name in modules:
+            module = importlib.import_module(module_name)
+            for cls in vars(module).values():
+                if not inspect.isclass(cls) or cls.__module__ != module_name:
+                    continue
+                specs = spec_references(cls)
+                for name, value in list(cls.__dict__.items()):
+                    if inspect.isfunction(value) and not name.startswith("__"):
+                        setattr(cls, name, self._wrap(cls, name, value))
+                        self._wrapped.append((cls, name, value))
+                    elif _is_locator(value) and not name.startswith("_"):
+                        keys = {symbol_key(module_name, cls.__qualname__, member) for member in {name} | specs.get(name, set())}
+                        setattr(cls, name, RecordedLocator(self, value, frozenset(keys)))
+                        self._replaced.append((cls, name, value))
+        logger.info(f"Dependency recording installed on {len(self._wrapped)} page-object methods "
+                    f"and {len(self._replaced)} locators")
+
+    def uninstall(self):
+        """Restore the original page-object classes."""
+        for cls, name, value in reversed(self._wrapped + self._replaced):
+            setattr(cls, name, value)
+        self._wrapped, self._replaced = [], []
+
+
+# ------------------------------
+# Persisted index
+# ------------------------------
+def load_index(path=DEPENDENCY_INDEX_FILE):
+    """
+    Load the index as {"commit": str|None, "tests": {nodeid: set(symbols)}, "session": set(symbols),
+    "failed": set(nodeids)}; "session" holds symbols used by shared fixture setup (every test depends on them).
+    On disk symbols are interned: a sorted symbol table plus per-test lists of table positions.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            raw = json.load(f)
+    except (OSError, ValueError):
+        return {"commit": None, "tests": {}, "session": set(), "failed": set()}
+    symbols = raw.get("symbols", [])
+    return {
+        "commit": raw.get("commit"),
+        "tests": {nodeid: {symbols[index] for index in indexes} for nodeid, indexes in raw.get("tests", {}).items()},
+        "session": {symbols[index] for index in raw.get("session", [])},
+        "failed": set(raw.get("failed", [])),
+    }
+
+
+def save_index(dependencies, failed, path=DEPENDENCY_INDEX_FILE, commit=None, session=()):
+    """
+    Merge this run's dependencies into the index (tests run now replace their entries).
+    :param dependencies: {nodeid: set(symbols)} recorded this run
+    :param failed: Node ids that failed this run (always re-selected next time)
+    :param commit: Commit the recorded run corresponds to (default: current HEAD)
+    :param session: Symbols used by shared fixture setup this run; accumulated across runs,
+                    since cached login state skips that setup on most runs
+    """
+    if not dependencies:
+        return
+    index = load_index(path)
+    index["tests"].update(dependencies)
+    index["session"] |= set(session)
+    index["failed"] = (index["failed"] - set(dependencies)) | set(failed)
+    symbols = sorted(set().union(index["session"], *index["tests"].values()))
+    positions = {symbol: position for position, symbol in enumerate(symbols)}
+    compact = {
+        "commit": commit or git_head() or index["commit"],
+        "symbols": symbols,
+        "tests": {nodeid: sorted(positions[symbol] for symbol in deps) for nodeid, deps in sorted(index["tests"].items())},
+        "session": sorted(positions[symbol] for symbol in index["session"]),
+        "failed": sorted(index["failed"]),
+    }
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(compact, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def write_worker_index(dependencies, failed, path, session=()):
+    """Per-worker dump of this run's raw dependencies (merged by common.parallel_runner)."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"tests": {nodeid: sorted(deps) for nodeid, deps in dependencies.items()},
+                   "session": sorted(session), "failed": sorted(failed)}, f)
+
+
+def read_worker_index(path):
+    """:return: (dependencies, failed, session symbols) of one worker dump"""
+    with open(path, encoding="utf-8") as f:
+        raw = json.load(f)
+    return {nodeid: set(deps) for nodeid, deps in raw["tests"].items()}, set(raw["failed"]), set(raw.get("session", []))
+
+
+# ------------------------------
+# Diff analysis
+# ------------------------------
+def _git(*args):
+    return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout
+
+
+def git_head():
+    try:
+        return _git("rev-parse", "HEAD").strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def changed_files(ref):
+    """Files changed between ref and the working tree (including untracked files)."""
+    # NUL-separated output: paths may contain spaces ("tests/test_full flow.py")
+    tracked = _git("diff", "--name-only", "-z", ref, "--").split("\0")
+    untracked = _git("ls-files", "--others", "--exclude-standard", "-z").split("\0")
+    return sorted((set(tracked) | set(untracked)) - {""})
+
+
+def _source_at(ref, path):
+    try:
+        return _git("show", f"{ref}:{path}")
+    except subprocess.CalledProcessError:
+        return ""
+
+
+def _members(source):
+    """
+    Split a module into comparable parts (ast dumps, so formatting/comments do not count):
+    - classes: {class name: (header dump, {member name: dump})}
+    - functions: {top-level function name: dump}
+    - module: dumps of every other top-level statement
+    """
+    classes, functions, module = {}, {}, []
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ClassDef):
+            members, header = {}, []
+            for item in node.body:
+                names = []
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    names = [item.name]
+                elif isinstance(item, ast.Assign):
+                    names = [target.id for target in item.targets if isinstance(target, ast.Name)]
+                elif isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
+                    names = [item.target.id]
+                for name in names:
+                    members[name] = ast.dump(item)
+                if not names:
+                    header.append(ast.dump(item))
+            header.extend(ast.dump(part) for part in node.bases + node.decorator_list)
+            classes[node.name] = (header, members)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions[node.name] = ast.dump(node)
+        else:
+            module.append(ast.dump(node))
+    return classes, functions, module
+
+
+def _changed(old, new):
+    return {name for name in set(old) | set(new) if old.get(name) != new.get(name)}
+
+
+class Change:
+    """
+    Result of analysing a diff:
+    - symbols: changed page-object symbols (same keys as recorded by DependencyRecorder)
+    - tests: {test file path: set of changed test function names, or None for "every test in the file"}
+    - run_all: reason why every test must run (a change that cannot be mapped to symbols), or None
+    """
+
+    def __init__(self):
+        self.symbols = set()
+        self.tests = {}
+        self.run_all = None
+
+
+def analyse_changes(ref):
+    """Map the diff between ref and the working tree onto page-object symbols and test functions."""
+    change = Change()
+    for path in changed_files(ref):
+        if path.startswith(IGNORED_PREFIXES) or path.endswith(IGNORED_SUFFIXES):
+            continue
+        if not path.endswith(".py"):
+            change.run_all = change.run_all or f"non-Python change: {path}"
+            continue
+        old_source = _source_at(ref, path)
+        new_source = open(path, encoding="utf-8").read() if os.path.exists(path) else ""
+        try:
+            old_classes, old_functions, old_module = _members(old_source)
+            new_classes, new_functions, new_module = _members(new_source)
+        except SyntaxError:
+            change.run_all = change.run_all or f"unparsable file: {path}"
+            continue
+        module_name = path[:-3].replace("/", ".")
+
+        if path.startswith("tests/") and os.path.basename(path).startswith("test_"):
+            if old_module != new_module or old_classes != new_classes:
+                change.tests[path] = None
+            else:
+                names = _changed(old_functions, new_functions)
+                if names:
+                    change.tests[path] = names
+        elif module_name in PAGE_MODULES and old_module == new_module and old_functions == new_functions:
+            for class_name in set(old_classes) | set(new_classes):
+                old_header, old_members = old_classes.get(class_name, ([], {}))
+                new_header, new_members = new_classes.get(class_name, ([], {}))
+                names = set(old_members) | set(new_members) if old_header != new_header else _changed(old_members, new_members)
+                change.symbols.update(symbol_key(module_name, class_name, name) for name in names)
+                if names and module_name in SESSION_MODULES:
+                    change.run_all = change.run_all or f"session-scoped login code changed: {module_name}:{class_name}"
+        elif old_source != new_source:
+            # conftest, config, common/, module-level page code: no per-test mapping
+            change.run_all = change.run_all or f"unmapped change: {path}"
+    return change
+
+
+def select_tests(items, index, change):
+    """
+    Split collected items into (selected, deselected) for a change:
+    - Every test runs when the change could not be mapped (change.run_all), or when it touches
+      a symbol used by shared fixture setup (index["session"]; change.run_all is set then)
+    - Tests with no index entry, or that failed last time, always run
+    - Otherwise a test runs if its file/function changed or it touched a changed symbol
+    """
+    session_changes = change.symbols & index.get("session", set())
+    if session_changes and not change.run_all:
+        change.run_all = f"symbols used by session-scoped fixtures changed: {', '.join(sorted(session_changes))}"
+    if change.run_all:
+        return list(items), []
+    selected, deselected = [], []
+    for item in items:
+        path = item.nodeid.split("::", 1)[0]
+        deps = index["tests"].get(item.nodeid)
+        test_names = change.tests.get(path, set())
+        if (
+            deps is None
+            or item.nodeid in index["failed"]
+            or test_names is None
+            or getattr(item, "originalname", item.name) in test_names
+            or deps & change.symbols
+        ):
+            selected.append(item)
+        else:
+            deselected.append(item)
+    return selected, deselected
+
+
+# Process-wide recorder used by the conftest hooks
+recorder = DependencyRecorder()
@@ -0,0 +1,464 @@
+# common/load_runner.py
+"""
+Load mode: replays checkout journeys as a sustained traffic profile.
+
+- Journeys reuse the asyncio page objects step by step:
+  login -> add_to_cart -> checkout -> clearcart (fast reset), one fresh context each
+- Open model (--rate): journeys start at a target arrival rate (fixed interval or Poisson),
+  whether or not earlier journeys have finished; arrivals beyond --max-in-flight are dropped
+- Closed model (--concurrency): N virtual users loop journeys back to back
+- Load is spread across --processes worker processes, each driving one browser
+- Per-step latencies go into HDR-style histograms; workers stream snapshots to the parent,
+  which prints live throughput/latency/error lines and a final per-step table
+- Targets the local stand-in server by default (SAUCEDEMO_TARGET overrides)
+
+Usage:
+  python -m common.load_runner --rate 4 --duration 120 --processes 2
+  python -m common.load_runner --concurrency 8 --duration 60 --json load.json
+"""
+import os
+
+# Load runs target the local stand-in unless explicitly overridden
+os.environ.setdefault("SAUCEDEMO_TARGET", "local")
+
+import sys
+import json
+import time
+import queue
+import random
+import asyncio
+import argparse
+import logging
+import multiprocessing
+from config.config import (
+    TEST_URL, TARGET, LOCAL_HOST, LOCAL_PORT,
+    LOAD_DURATION_SECONDS, LOAD_REPORT_SECONDS, LOAD_MAX_IN_FLIGHT,
+)
+from playwright.async_api import async_playwright
+from common.sharding import WORKER_ENV
+from common.logger_config import configure_logging
+from common.browser_profile import launch_args, context_args
+from common.clearcart import clearcart_async
+from pages.async_pages import AsyncLoginPage, AsyncAddToCartPage, AsyncCheckoutPage
+
+# Initialize logger for load runner module
+logger = logging.getLogger(__name__)
+
+# Timed steps, in journey order; "journey" is the whole journey and
+# "schedule_lag" how late the open model started a journey versus its planned arrival
+STEPS = ("login", "add_to_cart", "checkout", "clearcart", "journey", "schedule_lag")
+
+# Seconds between worker snapshots sent to the parent
+SNAPSHOT_SECONDS = 1.0
+
+
+class LatencyHistogram:
+    """
+    HDR-style latency histogram in microseconds:
+    - Values below 2^SUB_BITS are stored exactly; above that every power of two is split
+      into 2^(SUB_BITS-1) linear buckets, so any value is within ~0.4% of its bucket
+    - Constant memory no matter how many samples; histograms from different
+      processes merge by adding bucket counts
+    """
+
+    SUB_BITS = 8
+    SUB_BUCKETS = 1 << SUB_BITS
+    HALF = SUB_BUCKETS >> 1
+
+    def __init__(self):
+        self.counts = {}
+        self.total = 0
+        self.sum_us = 0
+        self.min_us = None
+        self.max_us = 0
+
+    @classmethod
+    def bucket(cls, value):
+        if value < cls.SUB_BUCKETS:
+            return value
+        shift = value.bit_length() - cls.SUB_BITS
+        return cls.SUB_BUCKETS + (shift - 1) * cls.HALF + ((value >> shift) - cls.HALF)
+
+    @classmethod
+    def bucket_value(cls, index):
+        """Midpoint of a bucket's value range."""
+        if index < cls.SUB_BUCKETS:
+            return index
+        offset = index - cls.SUB_BUCKETS
+        shift = offset // cls.HALF + 1
+        return ((offset % cls.HALF + cls.HALF) << shift) + ((1 << shift) >> 1)
+
+    def record(self, seconds):
+        value = max(0, int(seconds * 1_000_000))
+        index = self.bucket(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.total += 1
+        self.sum_us += value
+        self.min_us = value if self.min_us is None else min(self.min_us, value)
+        self.max_us = max(self.max_us, value)
+
+    def merge(self, other):
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total += other.total
+        self.sum_us += other.sum_us
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, pct):
+        """Value (ms) at or below which pct% of the samples fall, or None without samples."""
+        if not self.total:
+            return None
+        target = max(1, -(-self.total * pct // 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self.bucket_value(index), self.max_us) / 1000
+        return self.max_us / 1000
+
+    def mean(self):
+        return self.sum_us / self.total / 1000 if self.total else None
+
+    def to_dict(self):
+        return {"counts": {str(index): count for index, count in self.counts.items()}, "total": self.total,
+                "sum_us": self.sum_us, "min_us": self.min_us, "max_us": self.max_us}
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls()
+        histogram.counts = {int(index): count for index, count in data["counts"].items()}
+        histogram.total = data["total"]
+        histogram.sum_us = data["sum_us"]
+        histogram.min_us = data["min_us"]
+        histogram.max_us = data["max_us"]
+        return histogram
+
+
+class LoadStats:
+    """Journey counters, per-step histograms and per-step error counts (by error type)."""
+
+    def __init__(self):
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+        self.steps = {name: LatencyHistogram() for name in STEPS}
+        self.errors = {}
+
+    def record(self, step, seconds):
+        self.steps[step].record(seconds)
+
+    def record_error(self, step, error):
+        by_type = self.errors.setdefault(step, {})
+        by_type[type(error).__name__] = by_type.get(type(error).__name__, 0) + 1
+
+    def drain(self):
+        """Snapshot as a plain dict (picklable, JSON-able) and reset for the next interval."""
+        snapshot = {
+            "completed": self.completed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "steps": {name: histogram.to_dict() for name, histogram in self.steps.items() if histogram.total},
+            "errors": self.errors,
+        }
+        self.__init__()
+        return snapshot
+
+    def merge(self, snapshot):
+        self.completed += snapshot["completed"]
+        self.failed += snapshot["failed"]
+        self.dropped += snapshot["dropped"]
+        for name, data in snapshot["steps"].items():
+            self.steps[name].merge(LatencyHistogram.from_dict(data))
+        for step, by_type in snapshot["errors"].items():
+            merged = self.errors.setdefault(step, {})
+            for error_type, count in by_type.items():
+                merged[error_type] = merged.get(error_type, 0) + count
+
+    def error_rate(self):
+        finished = self.completed + self.failed
+        return self.failed / finished if finished else 0.0
+
+
+# ------------------------------
+# Worker process
+# ------------------------------
+async def load_journey(browser, stats, context_options):
+    """
+    One checkout journey in its own context, timing each step:
+    1. login: open the app and log in (LoginPage flow)
+    2. add_to_cart: add the first product, cart count checked
+    3. checkout: checkout to order review, name/price checked against the cart
+    4. clearcart: fast client-side cart reset, verified via the badge
+    A failure is recorded against the step it happened in and ends the journey.
+    """
+    journey_start = time.perf_counter()
+    step = "login"
+    context = await browser.new_context(**context_options)
+    try:
+        page = await context.new_page()
+
+        # Step 1: Login
+        start = time.perf_counter()
+        await page.goto(TEST_URL)
+        await AsyncLoginPage(page).login()
+        stats.record(step, time.perf_counter() - start)
+
+        # Step 2: Add to cart
+        step, start = "add_to_cart", time.perf_counter()
+        cart_product_info = await AsyncAddToCartPage(page).add_to_cart()
+        assert cart_product_info["original_num"] >= 1, \
+            f"Cart count validation failed: Expected ≥1, Actual={cart_product_info['original_num']}"
+        stats.record(step, time.perf_counter() - start)
+
+        # Step 3: Checkout
+        step, start = "checkout", time.perf_counter()
+        order_product_info = await AsyncCheckoutPage(page).checkout()
+        assert (cart_product_info["original_name"], cart_product_info["original_price"]) == \
+            (order_product_info["name"], order_product_info["price"]), \
+            f"Cart/order mismatch: Cart={cart_product_info}, Order={order_product_info}"
+        stats.record(step, time.perf_counter() - start)
+
+        # Step 4: Reset the cart
+        step, start = "clearcart", time.perf_counter()
+        await clearcart_async(page)
+        stats.record(step, time.perf_counter() - start)
+
+        stats.record("journey", time.perf_counter() - journey_start)
+        stats.completed += 1
+    except Exception as e:
+        stats.failed += 1
+        stats.record_error(step, e)
+        logger.error(f"Load journey failed at {step}. Error: {str(e).splitlines()[0] if str(e) else type(e).__name__}")
+    finally:
+        await context.close()
+
+
+async def _open_model(browser, stats, options, index, deadline, in_flight):
+    """Start journeys at the worker's share of the arrival rate until the deadline."""
+    loop = asyncio.get_running_loop()
+    rate = options["rate"] / options["processes"]
+    # Stagger workers so their fixed-interval arrivals interleave instead of coinciding
+    planned = loop.time() + index / options["rate"]
+    while planned < deadline:
+        await asyncio.sleep(max(0.0, planned - loop.time()))
+        # Lateness is recorded rather than skipped (no coordinated omission): a slow
+        # generator shows up as schedule_lag instead of silently lowering the rate
+        stats.record("schedule_lag", max(0.0, loop.time() - planned))
+        if len(in_flight) >= options["max_in_flight"]:
+            stats.dropped += 1
+        else:
+            task = asyncio.ensure_future(load_journey(browser, stats, options["context_args"]))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        planned += random.expovariate(rate) if options["arrivals"] == "poisson" else 1 / rate
+    if in_flight:
+        await asyncio.gather(*list(in_flight))
+
+
+async def _closed_model(browser, stats, options, index, deadline, in_flight):
+    """Run this worker's share of the virtual users back to back until the deadline."""
+    loop = asyncio.get_running_loop()
+    users = options["concurrency"] // options["processes"] + (index < options["concurrency"] % options["processes"])
+
+    async def user():
+        while loop.time() < deadline:
+            task = asyncio.ensure_future(load_journey(browser, stats, options["context_args"]))
+            in_flight.add(task)
+            try:
+                await task
+            finally:
+                in_flight.discard(task)
+
+    await asyncio.gather(*(user() for _ in range(users)))
+
+
+async def worker_async(index, options, results):
+    stats, in_flight = LoadStats(), set()
+
+    async def report():
+        while True:
+            await asyncio.sleep(SNAPSHOT_SECONDS)
+            results.put({"worker": index, "in_flight": len(in_flight), "stats": stats.drain()})
+
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(**launch_args({"headless": not options["headed"]}))
+        reporter = asyncio.ensure_future(report())
+        try:
+            deadline = asyncio.get_running_loop().time() + options["duration"]
+            model = _open_model if options["rate"] else _closed_model
+            await model(browser, stats, options, index, deadline, in_flight)
+        finally:
+            reporter.cancel()
+            await browser.close()
+    results.put({"worker": index, "in_flight": 0, "stats": stats.drain(), "done": True})
+
+
+def worker_main(index, options, results):
+    """Worker process entry point: log to its own directory, run the load, always report completion."""
+    os.environ[WORKER_ENV] = f"load-{index}"
+    configure_logging(console=False)
+    try:
+        asyncio.run(worker_async(index, options, results))
+    except Exception as e:
+        logger.error(f"Load worker {index} crashed. Error: {str(e)}")
+        results.put({"worker": index, "in_flight": 0, "stats": LoadStats().drain(), "done": True,
+                     "error": f"{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}"})
+
+
+# ------------------------------
+# Parent: live + final reporting
+# ------------------------------
+def _ms(value):
+    return "-" if value is None else f"{value:.0f}"
+
+
+def live_line(elapsed, interval_seconds, interval, totals, in_flight):
+    journey = interval.steps["journey"]
+    return (
+        f"[{elapsed:6.1f}s] journeys/s={interval.completed / interval_seconds:.2f} "
+        f"completed={totals.completed} failed={totals.failed} dropped={totals.dropped} in_flight={in_flight} "
+        f"error_rate={interval.error_rate():.1%} journey_ms p50={_ms(journey.percentile(50))} "
+        f"p99={_ms(journey.percentile(99))}"
+    )
+
+
+def final_result(totals, options, wall_seconds, worker_errors):
+    steps = {}
+    for name, histogram in totals.steps.items():
+        if not histogram.total and name not in totals.errors:
+            continue
+        errors = sum(totals.errors.get(name, {}).values())
+        steps[name] = {
+            "count": histogram.total,
+            "errors": errors,
+            "error_rate": round(errors / (histogram.total + errors), 4) if histogram.total + errors else 0.0,
+            "mean_ms": round(histogram.mean(), 1) if histogram.total else None,
+            **{f"p{pct}_ms": histogram.percentile(pct) for pct in (50, 90, 99, 99.9)},
+            "max_ms": histogram.max_us / 1000,
+        }
+    return {
+        "target": TARGET,
+        "options": {key: value for key, value in options.items() if key != "context_args"},
+        "wall_seconds": round(wall_seconds, 2),
+        "completed": totals.completed,
+        "failed": totals.failed,
+        "dropped": totals.dropped,
+        "journeys_per_second": round(totals.completed / wall_seconds, 2) if wall_seconds else 0.0,
+        "error_rate": round(totals.error_rate(), 4),
+        "steps": steps,
+        "errors": totals.errors,
+        "worker_errors": worker_errors,
+        "histograms": {name: histogram.to_dict() for name, histogram in totals.steps.items() if histogram.total},
+    }
+
+
+def print_result(result):
+    print(
+        f"\n{result['completed']} journeys in {result['wall_seconds']}s: {result['journeys_per_second']} journeys/s, "
+        f"failed={result['failed']} dropped={result['dropped']} error_rate={result['error_rate']:.2%}"
+    )
+    print(f"{'step':<14}{'count':>8}{'errors':>8}{'err%':>8}{'p50':>8}{'p90':>8}{'p99':>8}{'p99.9':>8}{'max':>8}  (ms)")
+    for name, row in result["steps"].items():
+        print(
+            f"{name:<14}{row['count']:>8}{row['errors']:>8}{row['error_rate'] * 100:>7.1f}%"
+            f"{_ms(row['p50_ms']):>8}{_ms(row['p90_ms']):>8}{_ms(row['p99_ms']):>8}{_ms(row['p99.9_ms']):>8}{_ms(row['max_ms']):>8}"
+        )
+    for step, by_type in result["errors"].items():
+        print(f"errors in {step}: " + ", ".join(f"{error_type} x{count}" for error_type, count in by_type.items()))
+    for error in result["worker_errors"]:
+        print(f"worker error: {error}")
+
+
+def run_load(options, report_seconds=LOAD_REPORT_SECONDS, out=sys.stdout):
+    """
+    Run the load profile across worker processes and aggregate their snapshots:
+    1. Start the local stand-in (when targeting it) in this process, shared by all workers
+    2. Spawn the workers (spawn start method: no forked Playwright/server threads)
+    3. Merge snapshots into running totals, printing a live line every report_seconds
+    :return: Final result dict (see final_result)
+    """
+    server = None
+    if TARGET == "local":
+        from standin.server import ensure_running
+        server = ensure_running(LOCAL_HOST, LOCAL_PORT)
+
+    spawn = multiprocessing.get_context("spawn")
+    results = spawn.Queue()
+    workers = [spawn.Process(target=worker_main, args=(index, options, results), daemon=True)
+               for index in range(options["processes"])]
+    totals, interval, in_flight = LoadStats(), LoadStats(), {}
+    worker_errors, done = [], set()
+    try:
+        start = last_report = time.monotonic()
+        for worker in workers:
+            worker.start()
+        while len(done) < len(workers):
+            try:
+                message = results.get(timeout=report_seconds)
+            except queue.Empty:
+                message = None
+            if message is not None:
+                totals.merge(message["stats"])
+                interval.merge(message["stats"])
+                in_flight[message["worker"]] = message["in_flight"]
+                if message.get("done"):
+                    done.add(message["worker"])
+                    if message.get("error"):
+                        worker_errors.append(f"worker {message['worker']}: {message['error']}")
+            elif all(not worker.is_alive() for worker in workers):
+                worker_errors.append("workers exited without reporting completion")
+                break
+            now = time.monotonic()
+            if now - last_report >= report_seconds:
+                print(live_line(now - start, now - last_report, interval, totals, sum(in_flight.values())), file=out, flush=True)
+                interval, last_report = LoadStats(), now
+        wall_seconds = time.monotonic() - start
+    finally:
+        for worker in workers:
+            worker.join(timeout=30)
+        if server is not None:
+            server.stop()
+    return final_result(totals, options, wall_seconds, worker_errors)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay checkout journeys as a sustained load profile")
+    model = parser.add_mutually_exclusive_group(required=True)
+    model.add_argument("--rate", type=float, help="Open model: journeys started per second (all processes)")
+    model.add_argument("--concurrency", type=int, help="Closed model: virtual users looping journeys (all processes)")
+    parser.add_argument("--arrivals", choices=("fixed", "poisson"), default="fixed", help="Arrival spacing for --rate")
+    parser.add_argument("--duration", type=float, default=LOAD_DURATION_SECONDS, help="Seconds to generate load")
+    parser.add_argument("--processes", type=int, default=1, help="Worker processes (one browser each)")
+    parser.add_argument("--max-in-flight", type=int, default=LOAD_MAX_IN_FLIGHT, help="Journeys in flight per process (--rate)")
+    parser.add_argument("--report-interval", type=float, default=LOAD_REPORT_SECONDS, help="Seconds between live lines")
+    parser.add_argument("--max-error-rate", type=float, default=0.0, help="Exit 1 when the journey error rate exceeds this")
+    parser.add_argument("--headed", action="store_true", help="Show the browser windows")
+    parser.add_argument("--json", help="Write the final result (with raw histograms) to this file")
+    args = parser.parse_args(argv)
+    if (args.rate is not None and args.rate <= 0) or (args.concurrency is not None and args.concurrency < 1):
+        parser.error("--rate and --concurrency must be positive")
+    if args.concurrency is not None and args.concurrency < args.processes:
+        parser.error("--concurrency must be at least --processes")
+
+    options = {
+        "rate": args.rate,
+        "concurrency": args.concurrency,
+        "arrivals": args.arrivals,
+        "duration": args.duration,
+        "processes": args.processes,
+        "max_in_flight": args.max_in_flight,
+        "headed": args.headed,
+        "context_args": context_args(),
+    }
+    result = run_load(options, args.report_interval)
+    print_result(result)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    return 1 if result["error_rate"] > args.max_error_rate or result["worker_errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
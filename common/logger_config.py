@@ -1,40 +1,208 @@
 # common/logger_config.py
 import os
+import sys
+import json
+import queue
+import atexit
 import logging
+import threading
+from collections import deque
 from datetime import datetime
+from logging.handlers import QueueHandler
+from config.config import LOG_DIR, LOG_FORMAT, LOG_MAX_MB, LOG_BACKUPS
+from common.sharding import artifact_dir, worker_id
+
+TEXT_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+# Background writer and root QueueHandler shared by the whole process (set by configure_logging)
+_writer = None
+_queue_handler = None
+# Buffering root handler installed by defer_logging until configure_logging runs
+_deferred = None
+_lock = threading.Lock()
+
+
+class TestIdFilter(logging.Filter):
+    """Stamp each record with the running pytest test id (empty outside tests)."""
+
+    def filter(self, record):
+        # Records buffered before logging was configured keep the id stamped when they were logged
+        if not hasattr(record, "test_id"):
+            record.test_id = os.environ.get("PYTEST_CURRENT_TEST", "").rsplit(" (", 1)[0]
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, logger, worker, test_id, message."""
+
+    def format(self, record):
+        return json.dumps({
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "worker": worker_id(),
+            "test_id": getattr(record, "test_id", ""),
+            "message": record.getMessage(),
+        }, ensure_ascii=False)
+
+
+class BatchingLogWriter(threading.Thread):
+    """
+    Consumer side of the logging queue:
+    - Drains every queued record in one go and writes them with a single write + flush
+      per sink (log file, console)
+    - Rotates the log file once it exceeds max_bytes (file -> file.1 -> ... -> file.<backup_count>)
+    """
+
+    def __init__(self, log_file, formatter, max_bytes, backup_count, console=None):
+        super().__init__(name="log-writer", daemon=True)
+        self.queue = queue.Queue()
+        self.log_file = log_file
+        self.formatter = formatter
+        self.console_formatter = logging.Formatter(TEXT_FORMAT)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.console = console
+        self.stream = open(log_file, "a", encoding="utf-8")
+
+    def _rotate(self):
+        self.stream.close()
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.log_file}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.log_file}.{index + 1}")
+        if self.backup_count > 0:
+            os.replace(self.log_file, f"{self.log_file}.1")
+        self.stream = open(self.log_file, "w" if self.backup_count <= 0 else "a", encoding="utf-8")
+
+    def _write(self, records):
+        self.stream.write("".join(self.formatter.format(record) + "\n" for record in records))
+        self.stream.flush()
+        if self.console is not None:
+            # Records already echoed by the DeferredHandler are not printed twice
+            self.console.write("".join(self.console_formatter.format(record) + "\n" for record in records
+                                       if not getattr(record, "echoed", False)))
+            self.console.flush()
+        if self.max_bytes and self.stream.tell() >= self.max_bytes:
+            self._rotate()
+
+    def run(self):
+        stopping = False
+        while not stopping:
+            # Block for the first record, then take whatever else is already queued
+            batch = [self.queue.get()]
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = None in batch
+            records = [record for record in batch if record is not None]
+            if records:
+                try:
+                    self._write(records)
+                except Exception as e:
+                    sys.stderr.write(f"Log writer failed to write {len(records)} records. Error: {str(e)}\n")
+        self.stream.close()
+
+    def stop(self):
+        self.queue.put(None)
+        self.join()
+
+
+class DeferredHandler(logging.Handler):
+    """
+    Root handler used until configure_logging() runs (see defer_logging):
+    - Buffers records (the newest `capacity`), replayed into the log file once it is opened
+    - Echoes WARNING and above to stderr right away, so they are seen even if no test ever runs
+    """
+
+    def __init__(self, capacity=10000, echo_level=logging.WARNING):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+        self.echo_level = echo_level
+        self.echo_formatter = logging.Formatter(TEXT_FORMAT)
+        self.addFilter(TestIdFilter())
+
+    def emit(self, record):
+        self.records.append(record)
+        if record.levelno >= self.echo_level:
+            record.echoed = True
+            sys.stderr.write(self.echo_formatter.format(record) + "\n")
+
+
+def defer_logging():
+    """
+    Make log calls safe before any log file exists: records are buffered in memory until
+    configure_logging() runs (the pytest session calls it when the first test starts), so runs
+    that never execute a test, such as --collect-only, open no log file and start no writer thread.
+    :return: Root logger
+    """
+    global _deferred
+    root_logger = logging.getLogger()
+    with _lock:
+        if _writer is None and _deferred is None:
+            _deferred = DeferredHandler()
+            root_logger.setLevel(logging.INFO)
+            root_logger.addHandler(_deferred)
+    return root_logger
+
+
+def configure_logging(log_format=LOG_FORMAT, max_mb=LOG_MAX_MB, backup_count=LOG_BACKUPS, console=True):
+    """
+    Configure the process-wide logging subsystem (idempotent):
+    1. Root logger gets a single QueueHandler, so log calls only enqueue on the test thread
+    2. A background BatchingLogWriter writes batches to a timestamped file in the
+       (per-worker) logs-saucedemo directory and to the console
+    3. log_format "jsonl" writes JSON lines keyed by test id instead of plain text
+    4. Records buffered by defer_logging() are replayed into the new file
+    Later calls return the already-configured root logger without touching its handlers.
+    :return: Root logger
+    """
+    global _writer, _queue_handler, _deferred
+    root_logger = logging.getLogger()
+    with _lock:
+        if _writer is not None:
+            return root_logger
+
+        extension = "jsonl" if log_format == "jsonl" else "log"
+        log_file = os.path.join(artifact_dir(LOG_DIR), f"test_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}")
+        formatter = JsonLinesFormatter() if log_format == "jsonl" else logging.Formatter(TEXT_FORMAT)
+        _writer = BatchingLogWriter(
+            log_file, formatter, int(max_mb * 1024 * 1024), backup_count,
+            console=sys.stderr if console else None,
+        )
+        _writer.start()
+
+        _queue_handler = QueueHandler(_writer.queue)
+        _queue_handler.addFilter(TestIdFilter())
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(_queue_handler)
+        if _deferred is not None:
+            root_logger.removeHandler(_deferred)
+            for record in _deferred.records:
+                _queue_handler.handle(record)
+            _deferred = None
+        atexit.register(shutdown_logging)
+    return root_logger
+
+
+def shutdown_logging():
+    """Flush queued records and stop the background writer (safe to call more than once)."""
+    global _writer, _queue_handler, _deferred
+    with _lock:
+        if _deferred is not None:
+            # Logging never got configured: drop the buffer (warnings were already echoed)
+            logging.getLogger().removeHandler(_deferred)
+            _deferred = None
+        if _writer is None:
+            return
+        logging.getLogger().removeHandler(_queue_handler)
+        _writer.stop()
+        _writer, _queue_handler = None, None
+
 
 def configure_logger(name="saucedemo_logger"):
-    # Create saucedemo exclusive log directory
-    log_dir = "logs-saucedemo"
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-    
-    # Generate log file with timestamp
-    log_file = os.path.join(log_dir, f"test_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
-    
-    # Get logger instance
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
-    
-    # Clear existing handlers to avoid duplicate logs
-    if logger.hasHandlers():
-        logger.handlers.clear()
-    
-    # Create file handler
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
-    file_handler.setLevel(logging.INFO)
-    
-    # Create stream handler
-    stream_handler = logging.StreamHandler()
-    stream_handler.setLevel(logging.INFO)
-    
-    # Set log format
-    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    file_handler.setFormatter(formatter)
-    stream_handler.setFormatter(formatter)
-    
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(stream_handler)
-    
-    return logger
+    """Backward-compatible entry point: configure the shared subsystem and return a named logger."""
+    configure_logging()
+    return logging.getLogger(name)
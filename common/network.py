@@ -0,0 +1,213 @@
+# common/network.py
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+from config.config import BLOCKED_URL_PATTERNS, CACHED_ASSET_PATTERN, ASSET_CACHE_DIR, ASSET_CACHE_MAX_MB
+
+# Initialize logger for network routing module
+logger = logging.getLogger(__name__)
+
+# Response headers worth replaying from the cache (body is stored decoded, so no encoding/length)
+REPLAYED_HEADERS = ("content-type", "cache-control", "etag", "last-modified", "access-control-allow-origin")
+
+# Fingerprinted asset URLs (content hash in the file name, e.g. main.018d2d1e.chunk.js): their
+# content never changes, so they are served from the cache without asking the server
+FINGERPRINTED_URL = re.compile(r"[.-][0-9a-f]{8,}(\.chunk)?\.[a-z0-9]+(\?.*)?$")
+
+
+def is_fingerprinted(url):
+    return bool(FINGERPRINTED_URL.search(url))
+
+
+def conditional_headers(headers):
+    """If-None-Match / If-Modified-Since request headers for the validators of a cached response."""
+    lowered = {name.lower(): value for name, value in headers.items()}
+    conditions = {}
+    if "etag" in lowered:
+        conditions["if-none-match"] = lowered["etag"]
+    if "last-modified" in lowered:
+        conditions["if-modified-since"] = lowered["last-modified"]
+    return conditions
+
+
+class AssetCache:
+    """
+    Content-addressed on-disk cache for static responses:
+    - blobs/<sha256 of body>: response bodies, shared by every URL serving identical bytes
+    - index/<sha256 of url>.json: status, replayed headers and the blob hash for a URL
+    - Size-bounded LRU: hits touch the blob mtime, eviction removes the oldest blobs first
+    - Safe for concurrent workers (atomic writes via temp file + os.replace)
+    """
+
+    def __init__(self, root=ASSET_CACHE_DIR, max_bytes=ASSET_CACHE_MAX_MB * 1024 * 1024):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.blob_dir = os.path.join(root, "blobs")
+        self.index_dir = os.path.join(root, "index")
+        os.makedirs(self.blob_dir, exist_ok=True)
+        os.makedirs(self.index_dir, exist_ok=True)
+        self._bytes_since_evict = 0
+
+    @staticmethod
+    def _digest(data):
+        return hashlib.sha256(data).hexdigest()
+
+    def _index_path(self, url):
+        return os.path.join(self.index_dir, f"{self._digest(url.encode('utf-8'))}.json")
+
+    def _write_atomic(self, path, data):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def get(self, url):
+        """Return (status, headers, body) for a cached URL, or None on a miss."""
+        try:
+            with open(self._index_path(url), encoding="utf-8") as f:
+                entry = json.load(f)
+            blob_path = os.path.join(self.blob_dir, entry["blob"])
+            with open(blob_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+        # Touch the blob so LRU eviction keeps recently used assets
+        try:
+            os.utime(blob_path)
+        except OSError:
+            pass
+        return entry["status"], entry["headers"], body
+
+    def put(self, url, status, headers, body):
+        """Store a response body (deduplicated by content hash) and point the URL at it."""
+        blob = self._digest(body)
+        blob_path = os.path.join(self.blob_dir, blob)
+        if not os.path.exists(blob_path):
+            self._write_atomic(blob_path, body)
+            self._bytes_since_evict += len(body)
+        replayed = {name: value for name, value in headers.items() if name.lower() in REPLAYED_HEADERS}
+        entry = {"blob": blob, "status": status, "headers": replayed, "size": len(body)}
+        self._write_atomic(self._index_path(url), json.dumps(entry).encode("utf-8"))
+
+        # Amortise directory scans: evict after every ~10% of the budget written
+        if self._bytes_since_evict > self.max_bytes // 10:
+            self.evict()
+
+    def evict(self):
+        """Delete least-recently-used blobs until the cache fits in max_bytes; return bytes freed."""
+        self._bytes_since_evict = 0
+        blobs = []
+        for name in os.listdir(self.blob_dir):
+            if name.endswith(".tmp"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.blob_dir, name))
+            except OSError:
+                continue
+            blobs.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in blobs)
+        freed = 0
+        for _, size, name in sorted(blobs):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.blob_dir, name))
+            except OSError:
+                continue
+            total -= size
+            freed += size
+        # Index entries pointing at evicted blobs are treated as misses by get()
+        if freed:
+            logger.info(f"Asset cache evicted {freed / 1024:.0f} KB (now {total / 1024:.0f} KB)")
+        return freed
+
+
+class NetworkRouter:
+    """
+    Request routing installed on every browser context by the page fixtures:
+    - Aborts requests matching config.BLOCKED_URL_PATTERNS (analytics, tracking pixels, error beacons)
+    - Serves GET requests for static assets (config.CACHED_ASSET_PATTERN) from AssetCache,
+      filling the cache on first fetch
+    - Cached copies of fingerprinted URLs are served as-is; any other cached asset is revalidated
+      with its ETag / Last-Modified (a 304 serves the cached body), and re-fetched in full when it
+      has no validator, so an edited unhashed file (e.g. /static/js/app.js) is never served stale
+    - Keeps hit/miss/blocked counters for the run summary
+    """
+
+    def __init__(self, blocked_patterns=BLOCKED_URL_PATTERNS, asset_pattern=CACHED_ASSET_PATTERN, cache=None):
+        self.blocked = re.compile("|".join(f"(?:{pattern})" for pattern in blocked_patterns)) if blocked_patterns else None
+        self.asset_pattern = re.compile(asset_pattern) if asset_pattern else None
+        self.cache = cache
+        self.stats = {"blocked": 0, "hits": 0, "revalidated": 0, "misses": 0, "bytes_from_cache": 0,
+                      "bytes_fetched": 0, "errors": 0}
+
+    def install(self, context):
+        """Register route handlers on a BrowserContext (before its first navigation)."""
+        if self.blocked:
+            context.route(self.blocked, self._block)
+        if self.asset_pattern and self.cache:
+            context.route(self.asset_pattern, self._serve_asset)
+        return context
+
+    def _block(self, route):
+        self.stats["blocked"] += 1
+        route.abort("blockedbyclient")
+
+    def _serve_asset(self, route):
+        request = route.request
+        if request.method != "GET":
+            route.fallback()
+            return
+
+        cached = self.cache.get(request.url)
+        if cached and is_fingerprinted(request.url):
+            self._fulfill_cached(route, cached, "hits")
+            return
+        conditions = conditional_headers(cached[1]) if cached else {}
+
+        try:
+            response = route.fetch(headers=dict(request.headers, **conditions)) if conditions else route.fetch()
+            if response.status == 304 and cached:
+                self._fulfill_cached(route, cached, "revalidated")
+                return
+            body = response.body()
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Asset fetch failed for {request.url}: {str(e)}")
+            route.fallback()
+            return
+        self.stats["misses"] += 1
+        self.stats["bytes_fetched"] += len(body)
+        if response.status == 200:
+            self.cache.put(request.url, response.status, response.headers, body)
+        route.fulfill(response=response, body=body)
+
+    def _fulfill_cached(self, route, cached, counter):
+        status, headers, body = cached
+        self.stats[counter] += 1
+        self.stats["bytes_from_cache"] += len(body)
+        route.fulfill(status=status, headers=headers, body=body)
+
+    def hit_rate(self):
+        """Share of asset requests answered with a cached body (fresh hits and 304 revalidations)."""
+        served = self.stats["hits"] + self.stats["revalidated"]
+        lookups = served + self.stats["misses"]
+        return served / lookups if lookups else 0.0
+
+    def summary(self):
+        """One-line summary for the terminal report."""
+        return (
+            f"blocked={self.stats['blocked']} hits={self.stats['hits']} revalidated={self.stats['revalidated']} "
+            f"misses={self.stats['misses']} "
+            f"hit_rate={self.hit_rate():.0%} served_from_cache={self.stats['bytes_from_cache'] / 1024:.0f}KB "
+            f"fetched={self.stats['bytes_fetched'] / 1024:.0f}KB errors={self.stats['errors']}"
+        )
+
+    def write_stats(self, path):
+        """Persist counters as JSON (merged with other worker artifacts by the parallel runner)."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(dict(self.stats, hit_rate=round(self.hit_rate(), 4), written_at=time.time()), f, indent=2)
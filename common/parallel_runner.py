@@ -0,0 +1,147 @@
+# common/parallel_runner.py
+"""
+Parallel sharded test runner:
+- Starts N pytest worker processes, each with one long-lived browser (session-scoped
+  pytest-playwright fixture) and a fresh context per test
+- Tests are split longest-first using recorded durations (see common.sharding)
+- Each worker writes into worker-<id> artifact subdirectories, merged after the run
+
+Usage: python -m common.parallel_runner -n 4 [-- extra pytest args]
+"""
+import os
+import sys
+import glob
+import argparse
+import subprocess
+from config.config import LOG_DIR, SCREENSHOT_DIR, ALLURE_DIR, TRACE_DIR, TARGET, LOCAL_HOST, LOCAL_PORT
+from common.sharding import WORKER_ENV, load_durations, save_durations, merge_worker_dirs
+from common.catalog import get_catalog
+from common.dependency_index import read_worker_index, save_index
+from common.run_report import merge_worker_reports
+from common.wait_policy import load_history, merge_history
+
+# Pytest exit code when a shard ends up with no tests (more workers than tests)
+NO_TESTS_COLLECTED = 5
+
+
+def build_worker_command(index, num_workers, pytest_args):
+    """Build the pytest command line for one worker."""
+    return [
+        sys.executable, "-m", "pytest",
+        f"--shard-id={index}",
+        f"--num-shards={num_workers}",
+        f"--alluredir={os.path.join(ALLURE_DIR, f'worker-{index}')}",
+        f"--html=reports/report-worker-{index}.html",
+        *pytest_args,
+    ]
+
+
+def merge_durations():
+    """Fold per-worker durations.json files into the shared durations file."""
+    merged = {}
+    for path in sorted(glob.glob(os.path.join(LOG_DIR, "worker-*", "durations.json"))):
+        merged.update(load_durations(path))
+        os.remove(path)
+    save_durations(merged)
+
+
+def merge_dependencies():
+    """Fold per-worker dependencies.json files into the dependency index."""
+    merged, failed, session = {}, set(), set()
+    for path in sorted(glob.glob(os.path.join(LOG_DIR, "worker-*", "dependencies.json"))):
+        dependencies, worker_failed, worker_session = read_worker_index(path)
+        merged.update(dependencies)
+        failed |= worker_failed
+        session |= worker_session
+        os.remove(path)
+    save_index(merged, failed, session=session)
+
+
+def merge_wait_history():
+    """Fold per-worker wait_history.json files into the shared wait history."""
+    for path in sorted(glob.glob(os.path.join(LOG_DIR, "worker-*", "wait_history.json"))):
+        merge_history(load_history(path))
+        os.remove(path)
+
+
+def run(num_workers, pytest_args):
+    """
+    Run the suite across worker processes and merge their artifacts:
+    1. Spawn one pytest process per shard (output captured per worker)
+    2. Wait for all workers and replay their output in shard order
+    3. Merge recorded durations, dependencies, wait history and worker artifact directories
+    :return: Combined exit code (first non-zero worker code, empty shards ignored)
+    """
+    # One shared local stand-in for all workers (they detect it and skip starting their own)
+    server = None
+    if TARGET == "local":
+        from standin.server import ensure_running
+        server = ensure_running(LOCAL_HOST, LOCAL_PORT)
+
+    workers = []
+    exit_code = 0
+    try:
+        # Refresh the product catalogue once up front (workers only read the cache), so every worker
+        # collects the same product matrix
+        try:
+            get_catalog()
+        except Exception as e:
+            print(f"{'!' * 70}\nWARNING: no product catalogue available ({str(e)}).\n"
+                  f"Workers that select product-matrix tests will fail collection.\n{'!' * 70}", file=sys.stderr)
+
+        for index in range(num_workers):
+            worker_log_dir = os.path.join(LOG_DIR, f"worker-{index}")
+            os.makedirs(worker_log_dir, exist_ok=True)
+            output = open(os.path.join(worker_log_dir, "pytest-output.txt"), "w", encoding="utf-8")
+            env = dict(os.environ, **{WORKER_ENV: str(index)})
+            try:
+                process = subprocess.Popen(
+                    build_worker_command(index, num_workers, pytest_args),
+                    stdout=output, stderr=subprocess.STDOUT, env=env,
+                )
+            except Exception:
+                output.close()
+                raise
+            workers.append((index, process, output))
+
+        for index, process, output in workers:
+            code = process.wait()
+            output.close()
+            with open(output.name, encoding="utf-8", errors="replace") as f:
+                print(f"===== worker {index} (exit code {code}) =====")
+                print(f.read())
+            if code not in (0, NO_TESTS_COLLECTED) and exit_code == 0:
+                exit_code = code
+    finally:
+        # Never leave workers or the shared stand-in running when spawning or waiting fails
+        for index, process, output in workers:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            output.close()
+        if server is not None:
+            server.stop()
+
+    merge_durations()
+    merge_dependencies()
+    merge_wait_history()
+    merge_worker_reports()
+    merge_worker_dirs(LOG_DIR)
+    merge_worker_dirs(SCREENSHOT_DIR)
+    merge_worker_dirs(TRACE_DIR)
+    merge_worker_dirs(ALLURE_DIR, prefix=False)
+    return exit_code
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the saucedemo suite in parallel shards")
+    parser.add_argument("-n", "--workers", type=int, default=os.cpu_count() or 2, help="Number of worker processes")
+    parser.add_argument("pytest_args", nargs=argparse.REMAINDER, help="Arguments passed to every pytest worker (after --)")
+    args = parser.parse_args(argv)
+
+    pytest_args = args.pytest_args[1:] if args.pytest_args[:1] == ["--"] else args.pytest_args
+    return run(max(1, args.workers), pytest_args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+# common/retry_policy.py
+import os
+import re
+import json
+import random
+import asyncio
+import logging
+from retrying import Retrying
+from playwright.sync_api import Error, TimeoutError
+from config.config import STEP_RETRIES, STEP_RETRY_ATTEMPTS, STEP_RETRY_BASE_MS, STEP_RETRY_MAX_MS, STEP_RETRY_BUDGET
+
+# Initialize logger for retry policy module
+logger = logging.getLogger(__name__)
+
+# Playwright error messages of failures that typically clear up on their own
+# (re-renders, navigations racing an action, overlays still animating away)
+TRANSIENT_ERRORS = (
+    "not attached to the DOM",
+    "detached",
+    "Execution context was destroyed",
+    "intercepts pointer events",
+    "not stable",
+    "not visible",
+    "Cannot find context with specified id",
+)
+
+# Click states derived from a failed click (see click_state)
+CLICK_APPLIED = "applied"   # the click went through (and landed where expected): do not click again
+CLICK_RETRY = "retry"       # Playwright never dispatched the click: clicking again is safe
+CLICK_UNKNOWN = "unknown"   # dispatched but outcome unknown: give up rather than double-click
+
+
+def current_test_id():
+    """Node id of the running pytest test, or None outside tests (no per-test budget applies)."""
+    current = os.environ.get("PYTEST_CURRENT_TEST", "")
+    return current.rsplit(" (", 1)[0] if current else None
+
+
+def is_timeout(error):
+    # playwright.sync_api and playwright.async_api share their error classes
+    return isinstance(error, TimeoutError)
+
+
+def is_transient(error):
+    """
+    Only Playwright errors are retried; closed pages/contexts never recover.
+    Timeouts are never retried: the action already waited its full (learned) timeout,
+    so another attempt would only double the time a missing element takes to fail.
+    Other errors are retried when their message is transient.
+    """
+    if not isinstance(error, Error):
+        return False
+    message = str(error)
+    if "has been closed" in message or is_timeout(error):
+        return False
+    return any(pattern in message for pattern in TRANSIENT_ERRORS)
+
+
+def click_state(error, url_before, url_now, expected_url=None):
+    """
+    Decide whether a failed click may be repeated, from Playwright's call log in the error:
+    - "click action done", or the page moved to `expected_url` (regex searched in the URL):
+      the click took effect
+    - Page moved anywhere else (login redirect, error page): outcome unknown, never applied
+    - No "performing click action": actionability checks failed, nothing was clicked
+    - Otherwise the click was dispatched with an unknown outcome
+    """
+    message = str(error)
+    if "click action done" in message:
+        return CLICK_APPLIED
+    if url_now != url_before:
+        return CLICK_APPLIED if expected_url and re.search(expected_url, url_now) else CLICK_UNKNOWN
+    if "performing click action" not in message:
+        return CLICK_RETRY
+    return CLICK_UNKNOWN
+
+
+class RetryPolicy:
+    """
+    Step-level retries for BasePage / AsyncBasePage actions:
+    - Idempotent actions (waits, reads, fills) are retried in place on transient Playwright errors
+    - Clicks pass a `state` callable; they are retried only when the click was never dispatched
+      and treated as done when it already took effect (see click_state)
+    - Full-jitter exponential backoff between attempts (retrying.Retrying drives sync actions)
+    - At most `attempts` tries per action and `budget` retries per test, so a genuinely broken
+      step still fails fast instead of multiplying CI wall time
+    - Every retry is counted per selector: retries, recovered, gave_up, applied
+    """
+
+    def __init__(self, enabled=STEP_RETRIES, attempts=STEP_RETRY_ATTEMPTS, base_ms=STEP_RETRY_BASE_MS,
+                 max_ms=STEP_RETRY_MAX_MS, budget=STEP_RETRY_BUDGET):
+        self.enabled = enabled
+        self.attempts = attempts
+        self.base_ms = base_ms
+        self.max_ms = max_ms
+        self.budget = budget
+        self.by_selector = {}
+        self.budget_exhausted = 0
+        self._budget_test = None
+        self._budget_used = 0
+
+    def _counts(self, selector):
+        return self.by_selector.setdefault(str(selector), {"retries": 0, "recovered": 0, "gave_up": 0, "applied": 0})
+
+    def _budget_left(self):
+        test_id = current_test_id()
+        if test_id is None:
+            return True
+        if test_id != self._budget_test:
+            self._budget_test, self._budget_used = test_id, 0
+        return self._budget_used < self.budget
+
+    def _should_retry(self, selector, error, state, attempt_number):
+        if attempt_number >= self.attempts or not is_transient(error):
+            return False
+        if state is not None and state(error) != CLICK_RETRY:
+            return False
+        if not self._budget_left():
+            self.budget_exhausted += 1
+            logger.warning(f"Retry budget of {self.budget} used up for this test, not retrying {selector}")
+            return False
+        return True
+
+    def _delay_ms(self, attempt_number):
+        """Full jitter: uniform in [0, min(max_ms, base_ms * 2^(attempt-1))]."""
+        return random.uniform(0, min(self.max_ms, self.base_ms * 2 ** (attempt_number - 1)))
+
+    def _on_retry(self, selector, attempt_number):
+        self._budget_used += 1
+        self._counts(selector)["retries"] += 1
+        logger.info(f"Retrying {selector} (attempt {attempt_number + 1}/{self.attempts})")
+
+    def _applied(self, selector, error, state):
+        """True if a failed click already took effect (counted, then reported as success)."""
+        if state is not None and state(error) == CLICK_APPLIED:
+            self._counts(selector)["applied"] += 1
+            logger.info(f"Click on {selector} took effect despite: {str(error).splitlines()[0]}")
+            return True
+        return False
+
+    def call(self, selector, action, state=None):
+        """
+        Run a synchronous action with step-level retries.
+        :param selector: Selector the action targets (retry accounting key)
+        :param action: Zero-argument callable performing one attempt
+        :param state: Optional callable(error) -> CLICK_* for non-idempotent clicks
+        :return: The action's result
+        """
+        if not self.enabled:
+            return action()
+        tries = {"count": 0}
+
+        def attempt():
+            tries["count"] += 1
+            try:
+                return action()
+            except Exception as e:
+                if self._applied(selector, e, state):
+                    return None
+                raise
+
+        def wait(attempt_number, delay_since_first_ms):
+            self._on_retry(selector, attempt_number)
+            return self._delay_ms(attempt_number)
+
+        retrying = Retrying(
+            stop_max_attempt_number=self.attempts,
+            wait_func=wait,
+            retry_on_exception=lambda error: self._should_retry(selector, error, state, tries["count"]),
+        )
+        try:
+            result = retrying.call(attempt)
+        except Exception:
+            if tries["count"] > 1:
+                self._counts(selector)["gave_up"] += 1
+            raise
+        if tries["count"] > 1:
+            self._counts(selector)["recovered"] += 1
+        return result
+
+    async def call_async(self, selector, action, state=None):
+        """asyncio twin of call(): action is a zero-argument coroutine function."""
+        if not self.enabled:
+            return await action()
+        attempt_number = 1
+        while True:
+            try:
+                result = await action()
+            except Exception as e:
+                if self._applied(selector, e, state):
+                    result = None
+                elif self._should_retry(selector, e, state, attempt_number):
+                    self._on_retry(selector, attempt_number)
+                    await asyncio.sleep(self._delay_ms(attempt_number) / 1000)
+                    attempt_number += 1
+                    continue
+                else:
+                    if attempt_number > 1:
+                        self._counts(selector)["gave_up"] += 1
+                    raise
+            if attempt_number > 1:
+                self._counts(selector)["recovered"] += 1
+            return result
+
+    def write_json(self, path):
+        report = {
+            "budget_exhausted": self.budget_exhausted,
+            "by_selector": dict(sorted(self.by_selector.items(), key=lambda item: item[1]["retries"], reverse=True)),
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        return path
+
+    def summary(self):
+        """One-line summary for the run summary (totals + most retried selectors)."""
+        if not self.by_selector:
+            return ""
+        totals = {key: sum(counts[key] for counts in self.by_selector.values()) for key in ("retries", "recovered", "gave_up", "applied")}
+        hottest = sorted(self.by_selector.items(), key=lambda item: item[1]["retries"], reverse=True)[:3]
+        parts = [f"{selector} x{counts['retries']}" for selector, counts in hottest if counts["retries"]]
+        return (
+            f"retries={totals['retries']} recovered={totals['recovered']} gave_up={totals['gave_up']} "
+            f"clicks_already_applied={totals['applied']} budget_exhausted={self.budget_exhausted}"
+            + (f"; most retried: {', '.join(parts)}" if parts else "")
+        )
+
+
+# Process-wide policy shared by all page objects
+policy = RetryPolicy()
@@ -0,0 +1,154 @@
+# common/run_report.py
+import os
+import json
+import time
+import html
+import glob
+import shutil
+import logging
+from config.config import SUMMARY_DIR, SUMMARY_FLUSH_SECONDS
+
+# Initialize logger for run report module
+logger = logging.getLogger(__name__)
+
+STATUSES = ("passed", "failed", "error", "skipped")
+STATUS_COLOURS = {"passed": "#2e7d32", "failed": "#c62828", "error": "#ef6c00", "skipped": "#757575"}
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>saucedemo run summary</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; width: 100%; }}
+th, td {{ border-bottom: 1px solid #ddd; padding: 4px 8px; text-align: left; vertical-align: top; }}
+td.status {{ font-weight: bold; }}
+pre {{ margin: 0; white-space: pre-wrap; }}
+</style></head><body>
+<h1>saucedemo run summary</h1>
+<p>{totals} &middot; {duration:.1f}s of test time &middot; updated {updated}{state}</p>
+<table><tr><th>Test</th><th>Status</th><th>Duration</th><th>Message</th></tr>
+{rows}
+</table></body></html>
+"""
+
+
+class IncrementalReport:
+    """
+    Pure-Python run report kept current while tests finish (no post-processing pass):
+    - results.jsonl: one line appended per finished test (O(1) per test; a later line for the
+      same test, e.g. a teardown error after a passed call, supersedes the earlier one)
+    - summary.json / summary.html: totals + per-test table, rewritten at most every
+      flush_seconds (and once more at the end), so a usable report exists mid-run
+    """
+
+    def __init__(self, directory=SUMMARY_DIR, flush_seconds=SUMMARY_FLUSH_SECONDS):
+        self.directory = directory
+        self.flush_seconds = flush_seconds
+        self.rows = {}
+        self._last_flush = 0.0
+        self._jsonl = None
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def add(self, nodeid, status, duration, message=""):
+        """Record one finished test and refresh the summary files if they are due."""
+        row = {"nodeid": nodeid, "status": status, "duration": round(duration, 3), "message": message}
+        self.rows[nodeid] = row
+        if self._jsonl is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._jsonl = open(self._path("results.jsonl"), "w", encoding="utf-8")
+        self._jsonl.write(json.dumps(row) + "\n")
+        self._jsonl.flush()
+        if time.monotonic() - self._last_flush >= self.flush_seconds:
+            self.flush()
+
+    def add_report(self, report):
+        """Feed a pytest TestReport: the call phase, or a failed/skipped setup/teardown."""
+        if report.when == "teardown" and self.rows.get(report.nodeid, {}).get("status") != "passed":
+            return
+        if report.when == "call" or (report.when == "setup" and not report.passed) or (report.when == "teardown" and report.failed):
+            if report.passed:
+                status = "passed"
+            elif report.skipped:
+                status = "skipped"
+            else:
+                status = "failed" if report.when == "call" else "error"
+            message = report.longreprtext.strip().splitlines()[-1] if report.longreprtext.strip() else ""
+            self.add(report.nodeid, status, report.duration, message[:500])
+
+    def totals(self):
+        counts = {status: 0 for status in STATUSES}
+        for row in self.rows.values():
+            counts[row["status"]] = counts.get(row["status"], 0) + 1
+        return counts
+
+    def flush(self, final=False):
+        """Rewrite summary.json and summary.html atomically."""
+        if not self.rows:
+            return
+        self._last_flush = time.monotonic()
+        write_summary(list(self.rows.values()), self.directory, final=final)
+
+    def close(self):
+        self.flush(final=True)
+        if self._jsonl is not None:
+            self._jsonl.close()
+            self._jsonl = None
+
+    def summary(self):
+        """One-line summary for the run summary."""
+        if not self.rows:
+            return ""
+        counts = ", ".join(f"{status}={count}" for status, count in self.totals().items() if count)
+        return f"{counts}; {self._path('summary.html')}"
+
+
+def _write_atomic(path, text):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def write_summary(rows, directory, final=True):
+    """Write summary.json and summary.html for a list of result rows (failures listed first)."""
+    os.makedirs(directory, exist_ok=True)
+    counts = {status: 0 for status in STATUSES}
+    for row in rows:
+        counts[row["status"]] = counts.get(row["status"], 0) + 1
+    ordered = sorted(rows, key=lambda row: (row["status"] == "passed", row["status"] == "skipped", row["nodeid"]))
+    updated = time.strftime("%Y-%m-%d %H:%M:%S")
+    _write_atomic(os.path.join(directory, "summary.json"),
+                  json.dumps({"final": final, "updated": updated, "totals": counts, "tests": ordered}, indent=1))
+
+    table = "\n".join(
+        f'<tr><td>{html.escape(row["nodeid"])}</td>'
+        f'<td class="status" style="color:{STATUS_COLOURS.get(row["status"], "#000")}">{row["status"]}</td>'
+        f'<td>{row["duration"]:.2f}s</td><td><pre>{html.escape(row["message"])}</pre></td></tr>'
+        for row in ordered
+    )
+    _write_atomic(os.path.join(directory, "summary.html"), HTML_TEMPLATE.format(
+        totals=" &middot; ".join(f"{count} {status}" for status, count in counts.items() if count),
+        duration=sum(row["duration"] for row in rows),
+        updated=updated,
+        state="" if final else " (run in progress)",
+        rows=table,
+    ))
+
+
+def merge_worker_reports(directory=SUMMARY_DIR):
+    """Combine worker-*/results.jsonl files into one results.jsonl + summary (parallel runner)."""
+    rows = {}
+    for path in sorted(glob.glob(os.path.join(directory, "worker-*", "results.jsonl"))):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    row = json.loads(line)
+                    rows[row["nodeid"]] = row
+        shutil.rmtree(os.path.dirname(path), ignore_errors=True)
+    if not rows:
+        return
+    with open(os.path.join(directory, "results.jsonl"), "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(row) + "\n" for row in rows.values())
+    write_summary(list(rows.values()), directory)
+    logger.info(f"Merged {len(rows)} worker results into {os.path.join(directory, 'summary.html')}")
@@ -0,0 +1,139 @@
+# common/screenshots.py
+import os
+import re
+import time
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from config.config import SCREENSHOT_DIR, SCREENSHOT_MODE
+from common.sharding import artifact_dir
+
+# Initialize logger for screenshots module
+logger = logging.getLogger(__name__)
+
+SCREENSHOT_MODES = ("viewport", "element", "full")
+
+
+def current_test_slug():
+    """Filesystem-safe name of the running test (from PYTEST_CURRENT_TEST), or 'session' outside tests."""
+    current = os.environ.get("PYTEST_CURRENT_TEST", "")
+    # "tests/test_full flow.py::test_x[param] (call)" -> "test_x_param"
+    name = current.split("::")[-1].rsplit(" (", 1)[0] if current else "session"
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_")[:80] or "session"
+
+
+class ScreenshotWriter:
+    """
+    Background writer for failure screenshots:
+    - The caller only pays for the capture round-trip (the browser encodes the PNG); hashing and
+      disk writes run on a single worker thread
+    - Identical frames (same sha256) are written once; later duplicates resolve to the first file
+    - Files are named <test>__<label>__<seq>.png, so repeated failures never overwrite each other
+    """
+
+    def __init__(self, directory=SCREENSHOT_DIR):
+        self.directory = directory
+        self._executor = None
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._by_hash = {}
+        self.stats = {"captured": 0, "written": 0, "deduplicated": 0, "bytes_written": 0, "capture_seconds": 0.0}
+
+    def _next_path(self, label):
+        with self._lock:
+            self._sequence += 1
+            sequence = self._sequence
+        label = re.sub(r"[^A-Za-z0-9_.-]+", "_", os.path.splitext(label)[0]).strip("_")[:120]
+        return os.path.join(artifact_dir(self.directory), f"{current_test_slug()}__{label}__{sequence:04d}.png")
+
+    def _write(self, data, path):
+        digest = hashlib.sha256(data).hexdigest()
+        existing = self._by_hash.get(digest)
+        if existing is not None:
+            self.stats["deduplicated"] += 1
+            logger.info(f"Screenshot identical to {existing}, skipped writing {path}")
+            return existing
+        with open(path, "wb") as f:
+            f.write(data)
+        self._by_hash[digest] = path
+        self.stats["written"] += 1
+        self.stats["bytes_written"] += len(data)
+        return path
+
+    def submit(self, data, label, capture_seconds=0.0):
+        """
+        Queue PNG bytes for writing.
+        :return: Future resolving to the stored file path (the first file for duplicate frames)
+        """
+        path = self._next_path(label)
+        with self._lock:
+            self.stats["captured"] += 1
+            self.stats["capture_seconds"] += capture_seconds
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshot-writer")
+            return self._executor.submit(self._write, data, path)
+
+    def flush(self):
+        """Wait for queued writes to finish (the writer restarts on the next submit)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def summary(self):
+        """One-line summary for the run summary."""
+        if not self.stats["captured"]:
+            return ""
+        mean_ms = self.stats["capture_seconds"] / self.stats["captured"] * 1000
+        return (
+            f"captured={self.stats['captured']} written={self.stats['written']} "
+            f"deduplicated={self.stats['deduplicated']} bytes={self.stats['bytes_written']} mean_capture={mean_ms:.0f}ms"
+        )
+
+
+# Shared writer for sync and async page objects
+writer = ScreenshotWriter()
+
+
+def capture_options(mode):
+    """Playwright screenshot kwargs for a capture mode."""
+    if mode not in SCREENSHOT_MODES:
+        raise ValueError(f"Unknown screenshot mode: {mode} (expected one of {SCREENSHOT_MODES})")
+    return {"full_page": mode == "full", "type": "png"}
+
+
+def capture(page, label, mode=None, locator=None):
+    """
+    Capture a screenshot from a sync Playwright page and hand it to the background writer.
+    :param mode: "viewport" (default, config.SCREENSHOT_MODE), "element" (clipped to locator) or "full"
+    :return: Future resolving to the stored file path
+    """
+    mode = mode or SCREENSHOT_MODE
+    start = time.perf_counter()
+    data = None
+    if mode == "element" and locator is not None:
+        try:
+            data = locator.first.screenshot(type="png", timeout=3000)
+        except Exception as e:
+            # The element is often what failed to appear; fall back to the viewport
+            logger.info(f"Element screenshot unavailable, capturing viewport instead. Error: {str(e)}")
+    if data is None:
+        data = page.screenshot(**capture_options("viewport" if mode == "element" else mode))
+    return writer.submit(data, label, time.perf_counter() - start)
+
+
+async def capture_async(page, label, mode=None, locator=None):
+    """asyncio twin of capture()."""
+    mode = mode or SCREENSHOT_MODE
+    start = time.perf_counter()
+    data = None
+    if mode == "element" and locator is not None:
+        try:
+            data = await locator.first.screenshot(type="png", timeout=3000)
+        except Exception as e:
+            # The element is often what failed to appear; fall back to the viewport
+            logger.info(f"Element screenshot unavailable, capturing viewport instead. Error: {str(e)}")
+    if data is None:
+        data = await page.screenshot(**capture_options("viewport" if mode == "element" else mode))
+    return writer.submit(data, label, time.perf_counter() - start)
@@ -0,0 +1,115 @@
+# common/session_state.py
+import os
+import json
+import time
+import hashlib
+import logging
+from config.config import TEST_URL, USERNAME, PASSWORD, STATE_DIR, STATE_TTL
+from common.wait_policy import policy as wait_policy
+
+# Initialize logger for session state module
+logger = logging.getLogger(__name__)
+
+# Where a successful login lands (wait_for_url pattern, also the WaitPolicy history key)
+INVENTORY_URL = "**/inventory.html"
+
+
+def state_file(username=USERNAME, password=PASSWORD):
+    """
+    Return the cache file path for a user's authenticated storage_state:
+    - One file per user and target site
+    - Password is part of the key so changed credentials never reuse a stale session
+    """
+    key = hashlib.sha1(f"{TEST_URL}|{password}".encode("utf-8")).hexdigest()[:10]
+    return os.path.join(STATE_DIR, f"{username}_{key}.json")
+
+
+def load_state(username=USERNAME, password=PASSWORD, ttl=STATE_TTL):
+    """
+    Return the cached storage_state path if it is still usable, otherwise None:
+    - File must exist and be younger than the TTL (seconds)
+    - No cookie in the state may expire within the TTL window
+    - Unreadable/corrupt files are invalidated
+    """
+    path = state_file(username, password)
+    if not os.path.exists(path):
+        return None
+
+    if time.time() - os.path.getmtime(path) > ttl:
+        logger.info(f"Cached session state expired for username: {username}")
+        invalidate_state(username, password)
+        return None
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        logger.warning(f"Cached session state unreadable for username: {username}")
+        invalidate_state(username, password)
+        return None
+
+    # Session cookies report expires=-1; only real expiry timestamps are checked
+    now = time.time()
+    for cookie in state.get("cookies", []):
+        expires = cookie.get("expires", -1)
+        if 0 < expires < now + 5:
+            logger.info(f"Cached session cookie expired for username: {username}")
+            invalidate_state(username, password)
+            return None
+
+    return path
+
+
+def save_state(context, username=USERNAME, password=PASSWORD):
+    """Persist the authenticated storage_state of a browser context to the cache."""
+    os.makedirs(STATE_DIR, exist_ok=True)
+    path = state_file(username, password)
+
+    # Write to a temp file first so concurrent readers never see a partial file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    context.storage_state(path=tmp_path)
+    os.replace(tmp_path, path)
+
+    logger.info(f"Session state cached for username: {username}")
+    return path
+
+
+def invalidate_state(username=USERNAME, password=PASSWORD):
+    """Remove the cached storage_state for a user (no-op if not cached)."""
+    try:
+        os.remove(state_file(username, password))
+    except FileNotFoundError:
+        pass
+
+
+def wait_for_inventory(page):
+    """Wait for the post-login redirect to inventory.html (timeout learned by the shared WaitPolicy)."""
+    timeout = wait_policy.timeout_for(INVENTORY_URL)
+    with wait_policy.track(INVENTORY_URL, timeout):
+        page.wait_for_url(INVENTORY_URL, timeout=timeout)
+
+
+def ensure_state(browser, username=USERNAME, password=PASSWORD, context_args=None):
+    """
+    Return a fresh storage_state path for a user, logging in via UI on a cold cache:
+    - Reuses the cached file when load_state() accepts it
+    - Otherwise logs in once in a throwaway context and caches the result
+    :param browser: Playwright Browser instance
+    :param context_args: Optional - extra arguments for browser.new_context()
+    """
+    path = load_state(username, password)
+    if path:
+        logger.info(f"Reusing cached session state for username: {username}")
+        return path
+
+    from common.login_common import login_common
+
+    context = browser.new_context(**(context_args or {}))
+    try:
+        page = context.new_page()
+        page.goto(TEST_URL)
+        login_common(page, username, password)
+        wait_for_inventory(page)
+        return save_state(context, username, password)
+    finally:
+        context.close()
@@ -0,0 +1,98 @@
+# common/sharding.py
+import os
+import json
+import heapq
+import shutil
+import logging
+from config.config import DURATIONS_FILE
+
+# Initialize logger for sharding module
+logger = logging.getLogger(__name__)
+
+# Environment variable carrying the worker index (set by common.parallel_runner)
+WORKER_ENV = "SAUCEDEMO_WORKER"
+
+# Fallback weight for tests without a recorded duration (seconds)
+DEFAULT_DURATION = 10.0
+
+
+def worker_id():
+    """Return the current worker index as a string, or None when running serially."""
+    return os.environ.get(WORKER_ENV) or None
+
+
+def artifact_dir(base):
+    """
+    Return (and create) the artifact directory for the current process:
+    - Serial run: the base directory itself
+    - Parallel run: base/worker-<id>, so workers never write the same file
+    """
+    worker = worker_id()
+    path = os.path.join(base, f"worker-{worker}") if worker is not None else base
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def load_durations(path=DURATIONS_FILE):
+    """Load recorded test durations ({nodeid: seconds}); empty dict if none recorded."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_durations(durations, path=DURATIONS_FILE):
+    """Merge new durations into the recorded file (newer measurements win)."""
+    if not durations:
+        return
+    merged = load_durations(path)
+    merged.update(durations)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(merged, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def assign_shards(nodeids, durations, num_shards):
+    """
+    Split test node ids across shards using longest-processing-time-first:
+    - Tests are sorted by recorded duration (longest first, unknown = average)
+    - Each test goes to the currently least-loaded shard
+    - Deterministic for the same inputs, so every worker computes the same split
+    :return: List of node id lists, one per shard
+    """
+    known = [durations[n] for n in nodeids if n in durations]
+    fallback = sum(known) / len(known) if known else DEFAULT_DURATION
+
+    weighted = sorted(((durations.get(n, fallback), n) for n in nodeids), key=lambda x: (-x[0], x[1]))
+    shards = [[] for _ in range(num_shards)]
+    loads = [(0.0, index) for index in range(num_shards)]
+    heapq.heapify(loads)
+    for duration, nodeid in weighted:
+        load, index = heapq.heappop(loads)
+        shards[index].append(nodeid)
+        heapq.heappush(loads, (load + duration, index))
+    return shards
+
+
+def merge_worker_dirs(base, prefix=True):
+    """
+    Merge base/worker-*/ subdirectories back into base:
+    - prefix=True: files are renamed worker-<id>_<name> so the source worker stays visible
+    - prefix=False: names are kept (Allure results reference attachments by file name)
+    - Existing top-level files (e.g. environment.properties) are never overwritten
+    """
+    if not os.path.isdir(base):
+        return
+    for worker_dir in sorted(os.listdir(base)):
+        source = os.path.join(base, worker_dir)
+        if not worker_dir.startswith("worker-") or not os.path.isdir(source):
+            continue
+        for name in os.listdir(source):
+            target = os.path.join(base, f"{worker_dir}_{name}" if prefix else name)
+            if os.path.exists(target):
+                logger.warning(f"Skipping merge of {os.path.join(source, name)}: target exists")
+                continue
+            shutil.move(os.path.join(source, name), target)
+        shutil.rmtree(source, ignore_errors=True)
@@ -0,0 +1,141 @@
+# common/state_seed.py
+import json
+import time
+import uuid
+import logging
+from urllib.parse import urljoin, urlsplit
+from config.config import TEST_URL, USERNAME
+from common.clearcart import CART_STORAGE_KEY
+from pages.base_page import BasePage
+from pages.snapshot import attribute, integer, price, rows
+
+# Initialize logger for state seeding module
+logger = logging.getLogger(__name__)
+
+# Session cookie checked by every session page (public site and stand-in) and its lifetime
+SESSION_COOKIE = "session-username"
+SESSION_SECONDS = 600
+
+# Init script seeding the cart once per page: each seed has its own sessionStorage guard,
+# so later navigations (and clicks changing the cart) are never overwritten by it
+SEED_SCRIPT = """
+((seed) => {
+    if (location.origin !== seed.origin) return;
+    const guard = "saucedemo-seed-" + seed.token;
+    try {
+        if (sessionStorage.getItem(guard)) return;
+        sessionStorage.setItem(guard, "1");
+        localStorage.setItem(seed.key, seed.value);
+    } catch (e) {}
+})(%s);
+"""
+
+# What the UI shows for the cart (read in one evaluate()):
+# badge on every session page, remove buttons on inventory.html, item rows on cart.html
+CART_UI_FIELDS = {
+    "count": integer(".shopping_cart_badge"),
+    "inventory": rows('[data-test="inventory-item"]', action=attribute("button", "data-test")),
+    "cart": rows(".cart_item", name=".inventory_item_name", price=price(".inventory_item_price")),
+}
+
+
+def origin():
+    """Scheme://host:port of the target site (key of its localStorage)."""
+    parts = urlsplit(TEST_URL)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def cart_ids(products):
+    """Product ids in cart order, from CatalogItems or plain ids."""
+    ids = [product if isinstance(product, int) else product.id for product in products]
+    if any(item_id is None for item_id in ids):
+        raise ValueError(f"Cannot seed products without a catalogue id: {list(products)}")
+    return ids
+
+
+def session_cookie(username=USERNAME):
+    """The session cookie the site sets on login, valid for SESSION_SECONDS."""
+    return {
+        "name": SESSION_COOKIE,
+        "value": username,
+        "domain": urlsplit(TEST_URL).hostname,
+        "path": "/",
+        "expires": time.time() + SESSION_SECONDS,
+        "httpOnly": False,
+        "secure": False,
+        "sameSite": "Lax",
+    }
+
+
+def seeded_state(products=None, username=USERNAME):
+    """
+    storage_state for browser.new_context(): logged-in session (and optionally a cart)
+    in place before the first navigation, without the login form.
+    :param products: Optional - CatalogItems or ids to put in the cart (None leaves localStorage alone)
+    """
+    state = {"cookies": [session_cookie(username)], "origins": []}
+    if products is not None:
+        state["origins"].append({
+            "origin": origin(),
+            "localStorage": [{"name": CART_STORAGE_KEY, "value": json.dumps(cart_ids(products))}],
+        })
+    return state
+
+
+def add_cart_seed(context, products):
+    """
+    Seed the cart of a context's next document via add_init_script (one-shot per page),
+    so the first navigation already renders it; no page needs to be open yet.
+    """
+    context.add_init_script(SEED_SCRIPT % json.dumps({
+        "origin": origin(),
+        "token": uuid.uuid4().hex,
+        "key": CART_STORAGE_KEY,
+        "value": json.dumps(cart_ids(products)),
+    }))
+
+
+def seed_page(page, products=(), username=USERNAME, path="inventory.html"):
+    """
+    Seed an already-open page (shared journey page): session cookie and cart are written
+    directly, then one navigation to `path` renders them.
+    1. Refresh the session cookie
+    2. Open the site first if the page is elsewhere (localStorage is per origin)
+    3. Replace the stored cart and navigate to `path`
+    :return: The page, on `path`
+    """
+    page.context.add_cookies([session_cookie(username)])
+    if not page.url.startswith(origin()):
+        page.goto(TEST_URL)
+    page.evaluate("([key, value]) => localStorage.setItem(key, value)", [CART_STORAGE_KEY, json.dumps(cart_ids(products))])
+    page.goto(urljoin(TEST_URL, path))
+    logger.info(f"Seeded cart {cart_ids(products)} for {username} and opened {path}")
+    return page
+
+
+def assert_seeded_cart(page, products):
+    """
+    Check that the UI shows exactly the seeded cart:
+    - localStorage holds the seeded ids
+    - Cart badge shows the item count (absent for an empty cart)
+    - inventory.html: remove buttons for exactly the seeded products
+    - cart.html: exactly the seeded names/prices
+    :param products: CatalogItems that were seeded
+    :raises AssertionError: On any mismatch
+    """
+    stored = json.loads(page.evaluate(f"() => localStorage.getItem('{CART_STORAGE_KEY}')") or "[]")
+    assert sorted(stored) == sorted(cart_ids(products)), \
+        f"Stored cart mismatch: Expected ids={cart_ids(products)}, Actual={stored}"
+
+    ui = BasePage(page).snapshot(CART_UI_FIELDS)
+    expected_count = len(products) or None
+    assert ui.count == expected_count, f"Cart badge mismatch: Expected={expected_count}, Actual={ui.count}"
+
+    if ui.inventory:
+        in_cart = sorted(row.action[len("remove-"):] for row in ui.inventory if (row.action or "").startswith("remove-"))
+        expected = sorted(product.slug for product in products)
+        assert in_cart == expected, f"Inventory shows {in_cart} in the cart, seeded {expected}"
+    if ui.cart or page.url.endswith("cart.html"):
+        shown = sorted((row.name, row.price) for row in ui.cart)
+        expected = sorted((product.name, product.price) for product in products)
+        assert shown == expected, f"Cart page shows {shown}, seeded {expected}"
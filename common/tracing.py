@@ -0,0 +1,141 @@
+# common/tracing.py
+import os
+import json
+import time
+import logging
+from contextlib import contextmanager
+from config.config import TRACE_MODE, TRACE_GRANULARITY, TRACE_DIR, TRACE_KEEP
+from common.sharding import artifact_dir
+from common.screenshots import current_test_slug
+
+# Initialize logger for tracing module
+logger = logging.getLogger(__name__)
+
+TRACE_MODES = ("off", "retain-on-failure")
+
+# tracing.start() options per capture granularity (cheapest first)
+GRANULARITY_OPTIONS = {
+    "actions": {"screenshots": False, "snapshots": False, "sources": False},
+    "snapshots": {"screenshots": False, "snapshots": True, "sources": False},
+    "full": {"screenshots": True, "snapshots": True, "sources": True},
+}
+
+
+class TraceRecorder:
+    """
+    Retain-on-failure Playwright tracing:
+    - Tracing starts once per browser context; every test records its own chunk (start_chunk),
+      so the buffered trace never holds more than one test's events
+    - Passed test: stop_chunk() without a path discards the chunk, nothing is serialised
+    - Failed test: the chunk is written as a trace zip and attached to Allure
+    - Ring-buffer retention: only the newest `keep` trace files stay on disk
+    - Per-test overhead (chunk start + stop/discard/save time) is recorded for the run summary
+    """
+
+    def __init__(self, mode=TRACE_MODE, granularity=TRACE_GRANULARITY, directory=TRACE_DIR, keep=TRACE_KEEP):
+        if mode not in TRACE_MODES:
+            raise ValueError(f"Unknown trace mode {mode!r}, expected one of {TRACE_MODES}")
+        if granularity not in GRANULARITY_OPTIONS:
+            raise ValueError(f"Unknown trace granularity {granularity!r}, expected one of {tuple(GRANULARITY_OPTIONS)}")
+        self.mode = mode
+        self.granularity = granularity
+        self.directory = directory
+        self.keep = keep
+        self.per_test = {}
+        self.saved = []
+        self._started = set()
+
+    @property
+    def enabled(self):
+        return self.mode != "off"
+
+    def _ensure_started(self, context):
+        if id(context) in self._started:
+            return
+        context.tracing.start(**GRANULARITY_OPTIONS[self.granularity])
+        self._started.add(id(context))
+        context.on("close", lambda _: self._started.discard(id(context)))
+
+    def _trim(self, directory):
+        """Drop the oldest trace files beyond `keep`."""
+        traces = sorted(
+            (os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(".zip")),
+            key=os.path.getmtime,
+        )
+        for path in traces[:max(0, len(traces) - self.keep)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _attach(self, path):
+        try:
+            import allure
+            allure.attach.file(path, name="Playwright trace", extension="zip")
+        except Exception as e:
+            logger.warning(f"Failed to attach trace {path} to Allure. Error: {str(e)}")
+
+    @contextmanager
+    def capture(self, request, context):
+        """
+        Record one test's trace chunk around a fixture's yield:
+        - The outcome comes from the rep_call attribute set by pytest_runtest_makereport
+        - Errors in setup/teardown count as failures (no rep_call)
+        """
+        if not self.enabled:
+            yield None
+            return
+        start = time.perf_counter()
+        try:
+            self._ensure_started(context)
+            context.tracing.start_chunk(title=request.node.nodeid)
+        except Exception as e:
+            logger.warning(f"Tracing unavailable for {request.node.nodeid}. Error: {str(e)}")
+            yield None
+            return
+        overhead = time.perf_counter() - start
+        yield context
+
+        rep_call = getattr(request.node, "rep_call", None)
+        failed = rep_call is None or rep_call.failed
+        start = time.perf_counter()
+        path, size = None, 0
+        try:
+            if failed:
+                directory = artifact_dir(self.directory)
+                path = os.path.join(directory, f"{current_test_slug()}__{len(self.saved) + 1}.zip")
+                context.tracing.stop_chunk(path=path)
+                size = os.path.getsize(path)
+                self.saved.append(path)
+                self._trim(directory)
+            else:
+                context.tracing.stop_chunk()
+        except Exception as e:
+            logger.warning(f"Failed to stop trace chunk for {request.node.nodeid}. Error: {str(e)}")
+            path = None
+        overhead += time.perf_counter() - start
+        self.per_test[request.node.nodeid] = {"overhead_ms": round(overhead * 1000, 1), "retained": path is not None, "bytes": size}
+        if path:
+            logger.info(f"Trace for failed test saved to {path}")
+            self._attach(path)
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"mode": self.mode, "granularity": self.granularity, "tests": self.per_test}, f, indent=2)
+        return path
+
+    def summary(self):
+        """One-line summary for the run summary: mean/max overhead per test and retained traces."""
+        if not self.per_test:
+            return ""
+        overheads = [entry["overhead_ms"] for entry in self.per_test.values()]
+        retained = [entry for entry in self.per_test.values() if entry["retained"]]
+        return (
+            f"granularity={self.granularity} tests={len(overheads)} mean_overhead={sum(overheads) / len(overheads):.0f}ms "
+            f"max_overhead={max(overheads):.0f}ms retained={len(retained)} "
+            f"({sum(entry['bytes'] for entry in retained) / (1024 * 1024):.1f}MB)"
+        )
+
+
+# Process-wide recorder used by the fixtures
+recorder = TraceRecorder()
@@ -0,0 +1,167 @@
+# common/wait_policy.py
+import os
+import json
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from playwright.sync_api import TimeoutError
+from config.config import (
+    TIMEOUT, ADAPTIVE_WAITS, WAIT_HISTORY_FILE, WAIT_HISTORY_SAMPLES,
+    WAIT_MIN_SAMPLES, WAIT_TIMEOUT_FACTOR, WAIT_MIN_TIMEOUT_MS, WAIT_ABSENT_SHARE,
+)
+from common.action_timing import percentile
+
+# Initialize logger for wait policy module
+logger = logging.getLogger(__name__)
+
+
+class WaitPolicy:
+    """
+    Per-selector timeouts learned from how long waits actually took:
+    - timeout_for(selector) = clamp(p99 of recorded waits * factor, min_timeout_ms, default_ms)
+      once a selector has min_samples recordings; the configured default before that
+    - A wait that times out is recorded at its full timeout, so a selector that is genuinely
+      slower than its history widens its own budget on the next run
+    - Waits where absence is a valid answer (find_elements) record absent outcomes as None;
+      a selector absent in at least absent_share of its samples is capped at min_timeout_ms for
+      such waits, so an element that is usually missing (remove buttons of an empty cart) fails fast
+    - History persists in WAIT_HISTORY_FILE (last max_samples per selector); parallel workers
+      save their new samples to a per-worker file, merged by the parallel runner (merge_history)
+    """
+
+    def __init__(self, path=WAIT_HISTORY_FILE, default_ms=TIMEOUT * 1000, enabled=ADAPTIVE_WAITS,
+                 factor=WAIT_TIMEOUT_FACTOR, min_timeout_ms=WAIT_MIN_TIMEOUT_MS,
+                 min_samples=WAIT_MIN_SAMPLES, max_samples=WAIT_HISTORY_SAMPLES, absent_share=WAIT_ABSENT_SHARE):
+        self.path = path
+        self.default_ms = default_ms
+        self.enabled = enabled
+        self.factor = factor
+        self.min_timeout_ms = min_timeout_ms
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.absent_share = absent_share
+        self.history = None  # selector -> recent wait durations (ms, None = absent), loaded lazily
+        self.new_samples = {}
+        self.timeouts = {}
+        self.absent = {}
+        self.recorded = 0
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self.history is not None:
+            return
+        self.history = {}
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.history = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable wait history {self.path}. Error: {str(e)}")
+
+    def timeout_for(self, selector, absence_ok=False):
+        """
+        Timeout (ms) to use for a wait on selector.
+        The mostly-absent cap only applies when the caller accepts absence (absence_ok=True);
+        waits that expect the element use the learned timeout of its present samples.
+        """
+        if not self.enabled or not isinstance(selector, str):
+            return self.default_ms
+        with self._lock:
+            self._load()
+            samples = self.history.get(selector, [])
+        if len(samples) < self.min_samples:
+            return self.default_ms
+        waits = sorted(sample for sample in samples if sample is not None)
+        if absence_ok and len(samples) - len(waits) >= self.absent_share * len(samples):
+            return int(self.min_timeout_ms)
+        if not waits:
+            return self.default_ms
+        learned = percentile(waits, 0.99) * self.factor
+        return int(min(self.default_ms, max(self.min_timeout_ms, learned)))
+
+    def record(self, selector, elapsed_ms, timed_out=False):
+        """
+        Add one observed wait (timed-out waits are recorded at their full timeout;
+        elapsed_ms=None records a valid absence).
+        """
+        if not isinstance(selector, str):
+            return
+        if elapsed_ms is not None:
+            elapsed_ms = round(elapsed_ms, 1)
+        with self._lock:
+            self._load()
+            samples = self.history.setdefault(selector, [])
+            samples.append(elapsed_ms)
+            del samples[:-self.max_samples]
+            self.new_samples.setdefault(selector, []).append(elapsed_ms)
+            self.recorded += 1
+            if timed_out:
+                self.timeouts[selector] = self.timeouts.get(selector, 0) + 1
+            if elapsed_ms is None:
+                self.absent[selector] = self.absent.get(selector, 0) + 1
+
+    @contextmanager
+    def track(self, selector, timeout_ms, absence_ok=False):
+        """
+        Time the wrapped wait and record it.
+        Playwright TimeoutErrors count as timed out; with absence_ok=True (absence is a valid
+        answer, e.g. find_elements on an empty cart) they are recorded as absent instead, which
+        caps the selector's timeout once it is mostly absent (see timeout_for).
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except TimeoutError:
+            # Same class as playwright.async_api.TimeoutError, so async waits are covered too
+            self.record(selector, None if absence_ok else timeout_ms, timed_out=not absence_ok)
+            raise
+        self.record(selector, (time.perf_counter() - start) * 1000)
+
+    def save(self, path=None):
+        """
+        Merge this run's samples into the history file (atomic replace).
+        :param path: Target file instead of the history file (per-worker file in parallel runs)
+        """
+        with self._lock:
+            if not self.new_samples:
+                return
+            merge_history(self.new_samples, path or self.path, self.max_samples)
+            self.new_samples = {}
+
+    def summary(self):
+        """One-line summary for the run summary."""
+        if not self.recorded and not self.absent:
+            return ""
+        learned = sum(1 for selector in (self.history or {}) if self.timeout_for(selector) != self.default_ms)
+        return (
+            f"waits={self.recorded} selectors_tracked={len(self.history or {})} learned_timeouts={learned} "
+            f"waits_timed_out={sum(self.timeouts.values())} absent={sum(self.absent.values())}"
+        )
+
+
+def load_history(path):
+    """Load a wait history file ({selector: [ms | None]}); empty dict if missing or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def merge_history(new_samples, path=WAIT_HISTORY_FILE, max_samples=WAIT_HISTORY_SAMPLES):
+    """Append new samples to the history file, keeping the last max_samples per selector."""
+    if not new_samples:
+        return
+    merged = load_history(path)
+    for selector, samples in new_samples.items():
+        merged[selector] = (merged.get(selector, []) + samples)[-max_samples:]
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(merged, f)
+    os.replace(tmp_path, path)
+
+
+# Shared policy for sync and async page objects and fixtures
+policy = WaitPolicy()
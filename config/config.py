@@ -1,9 +1,218 @@
+import os
+import json
+import dataclasses
+from types import MappingProxyType
+from functools import lru_cache
+from dataclasses import dataclass, field
+from dotenv import dotenv_values
 
-TIMEOUT = 30
-FIRSTNAME = "1"
-LASTNAME = "2"
-POSTALCODE = "3"
-TEST_URL = "https://www.saucedemo.com/"
-USERNAME = "standard_user"
+# Settings are loaded once, from (highest precedence first):
+# 1. Environment variables SAUCEDEMO_<NAME>, e.g. SAUCEDEMO_TIMEOUT=45 (TRACE_MODE: SAUCEDEMO_TRACE)
+# 2. config/.env (python-dotenv format) with the same variable names
+# 3. The defaults below
+# Lists/dicts take JSON (dicts become read-only mappings, so Settings stays immutable); booleans accept 1/0, true/false, yes/no, on/off.
+# Modules keep importing plain names (from config.config import TIMEOUT): they resolve to the
+# frozen Settings object through the module-level __getattr__ at the bottom of this file.
+ENV_PREFIX = "SAUCEDEMO_"
+ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+# Settings whose environment variable is not simply ENV_PREFIX + name
+ENV_ALIASES = {"TRACE_MODE": "SAUCEDEMO_TRACE"}
 
-PASSWORD = "secret_sauce"
+TRUE_VALUES = ("1", "true", "yes", "on")
+FALSE_VALUES = ("0", "false", "no", "off")
+
+
+@dataclass(frozen=True)
+class Settings:
+    TIMEOUT: int = 30
+    FIRSTNAME: str = "1"
+    LASTNAME: str = "2"
+    POSTALCODE: str = "3"
+
+    # Target site: "remote" (public saucedemo) or "local" (bundled stand-in, see standin/)
+    # Overridable per run via the SAUCEDEMO_TARGET environment variable
+    TARGET: str = "remote"
+    REMOTE_URL: str = "https://www.saucedemo.com/"
+    LOCAL_HOST: str = "127.0.0.1"
+    LOCAL_PORT: int = 8765
+    USERNAME: str = "standard_user"
+
+    PASSWORD: str = "secret_sauce"
+
+    # Authenticated storage_state cache reused by login_fixture
+    STATE_DIR: str = ".auth-saucedemo"
+    STATE_TTL: int = 540  # seconds (saucedemo session cookie lives for 10 minutes)
+
+    # Inventory catalogue scraped once and cached for product-matrix parametrization
+    CATALOG_FILE: str = ".catalog-saucedemo.json"
+    CATALOG_TTL: int = 86400  # seconds
+
+    # Warm, logged-in contexts reused by login_fixture (0 disables pooling)
+    CONTEXT_POOL_SIZE: int = 2
+    CONTEXT_MAX_USES: int = 20  # recycle a context after this many tests
+
+    # Browser profile: "default" (stock Chromium launch) or "lean" (see common/browser_profile.py)
+    BROWSER_PROFILE: str = "default"
+    LEAN_VIEWPORT: MappingProxyType = field(default_factory=lambda: MappingProxyType({"width": 1024, "height": 640}))
+    # Contexts whose JS heap grows past this are recycled instead of reused
+    CONTEXT_MEMORY_BUDGET_MB: int = 64
+    # Last measured contexts per GB for each profile (before/after comparison in the run summary)
+    CONTEXT_MEMORY_FILE: str = ".context-memory-saucedemo.json"
+
+    # Artifact directories (parallel workers write into worker-<id> subdirectories)
+    LOG_DIR: str = "logs-saucedemo"
+    SCREENSHOT_DIR: str = "screenshots-saucedemo"
+    ALLURE_DIR: str = "allure-results-saucedemo"
+
+    # Allure results streamed while tests run (compact JSON, attachments deduplicated by content hash,
+    # text attachments of at least ALLURE_COMPRESS_MIN_KB stored gzipped; 0 disables compression)
+    ALLURE_STREAMING: bool = True
+    ALLURE_COMPRESS_MIN_KB: int = 64
+
+    # Incremental run summary (results.jsonl + summary.json/html), refreshed at most every SUMMARY_FLUSH_SECONDS
+    SUMMARY_DIR: str = "reports"
+    SUMMARY_FLUSH_SECONDS: int = 2
+
+    # Failure traces: "retain-on-failure" (per-test trace chunks, kept only for failed tests) or "off"
+    # Granularity: "actions" (cheapest), "snapshots" (DOM snapshots) or "full" (+ screencast frames and sources)
+    TRACE_MODE: str = "retain-on-failure"
+    TRACE_GRANULARITY: str = "snapshots"
+    TRACE_DIR: str = "traces-saucedemo"
+    TRACE_KEEP: int = 20  # newest failure traces kept per worker
+
+    # Failure screenshots: "viewport" (default), "element" (clipped to the failing element) or "full" (full page)
+    SCREENSHOT_MODE: str = "viewport"
+
+    # Logging: "text" or "jsonl" (JSON lines keyed by test id); files rotate at LOG_MAX_MB keeping LOG_BACKUPS
+    LOG_FORMAT: str = "text"
+    LOG_MAX_MB: int = 20
+    LOG_BACKUPS: int = 5
+
+    # Recorded per-test durations used for longest-first sharding
+    DURATIONS_FILE: str = ".test-durations-saucedemo.json"
+
+    # Per-test page-object dependencies recorded at runtime, used by --changed-since test selection
+    DEPENDENCY_INDEX: bool = True
+    DEPENDENCY_INDEX_FILE: str = ".test-deps-saucedemo.json"
+
+    # Opt back into the explicit wait_for_selector + action sequence in BasePage
+    LEGACY_WAITS: bool = False
+
+    # Adaptive waits: per-selector timeout = p99 of recorded waits * WAIT_TIMEOUT_FACTOR,
+    # clamped to [WAIT_MIN_TIMEOUT_MS, TIMEOUT]; TIMEOUT applies until WAIT_MIN_SAMPLES exist.
+    # Off by default: waits are still recorded, so the history can be checked before opting in
+    ADAPTIVE_WAITS: bool = False
+    WAIT_HISTORY_FILE: str = ".wait-history-saucedemo.json"
+    WAIT_HISTORY_SAMPLES: int = 200  # most recent waits kept per selector
+    WAIT_MIN_SAMPLES: int = 20
+    WAIT_TIMEOUT_FACTOR: int = 3
+    WAIT_MIN_TIMEOUT_MS: int = 2000
+    # Absence-tolerant waits (find_elements) on selectors found absent in at least this share of samples
+    # wait WAIT_MIN_TIMEOUT_MS at most
+    WAIT_ABSENT_SHARE: float = 0.5
+
+    # Network routing installed by the page fixtures
+    NETWORK_ROUTING: bool = True
+    # Third-party requests aborted before they leave the browser (regular expressions on the URL)
+    BLOCKED_URL_PATTERNS: tuple = (
+        r"google-analytics\.com",
+        r"googletagmanager\.com",
+        r"doubleclick\.net",
+        r"backtrace\.io",
+        r"optimizely\.com",
+        r"hotjar\.com",
+        r"segment\.(io|com)",
+        r"facebook\.(com|net)/tr",
+        r"/collect\?",
+    )
+    # Static assets served from the content-addressed on-disk cache (fills on first fetch)
+    CACHED_ASSET_PATTERN: str = r"\.(css|js|png|jpe?g|gif|svg|webp|ico|woff2?|ttf|otf)(\?.*)?$"
+    ASSET_CACHE_DIR: str = ".asset-cache-saucedemo"
+    ASSET_CACHE_MAX_MB: int = 256
+
+    # clearcart() default: "fast" (reset client-side cart state in one step) or "click" (per-item remove clicks)
+    CLEAR_CART_MODE: str = "fast"
+
+    # Load mode (common/load_runner.py): default run length, live report interval and
+    # journeys allowed in flight per worker process (arrivals beyond it are counted as dropped)
+    LOAD_DURATION_SECONDS: int = 60
+    LOAD_REPORT_SECONDS: int = 5
+    LOAD_MAX_IN_FLIGHT: int = 32
+
+    # Step-level retries of BasePage actions (common/retry_policy.py): attempts per action,
+    # full-jitter backoff between STEP_RETRY_BASE_MS and STEP_RETRY_MAX_MS, retries allowed per test
+    STEP_RETRIES: bool = True
+    STEP_RETRY_ATTEMPTS: int = 3
+    STEP_RETRY_BASE_MS: int = 200
+    STEP_RETRY_MAX_MS: int = 2000
+    STEP_RETRY_BUDGET: int = 6
+
+    # Per-action timing of BasePage primitives (ring buffer size in calls); override with --action-timing=on/off
+    ACTION_TIMING: bool = False
+    ACTION_TIMING_BUFFER: int = 50000
+
+    @property
+    def TEST_URL(self):
+        """Base URL of the target site (derived from TARGET)."""
+        return f"http://{self.LOCAL_HOST}:{self.LOCAL_PORT}/" if self.TARGET == "local" else self.REMOTE_URL
+
+
+def _coerce(env_name, raw, default):
+    """Convert an environment string to the type of the setting's default."""
+    try:
+        if isinstance(default, bool):
+            value = raw.strip().lower()
+            if value not in TRUE_VALUES + FALSE_VALUES:
+                raise ValueError(f"expected one of {TRUE_VALUES + FALSE_VALUES}")
+            return value in TRUE_VALUES
+        if isinstance(default, int):
+            return int(raw)
+        if isinstance(default, float):
+            return float(raw)
+        if isinstance(default, (tuple, MappingProxyType)):
+            value = json.loads(raw)
+            mapping = isinstance(default, MappingProxyType)
+            if not isinstance(value, (list, dict)) or isinstance(value, dict) != mapping:
+                raise ValueError(f"expected a JSON {'object' if mapping else 'list'}")
+            return MappingProxyType(value) if mapping else tuple(value)
+        return raw
+    except ValueError as e:
+        raise ValueError(f"Invalid value for {env_name}: {raw!r} ({str(e)})") from None
+
+
+def load_settings(environ=None, env_file=ENV_FILE):
+    """
+    Build Settings from defaults, overlaid with the .env file and then the environment.
+    :param environ: Mapping used instead of os.environ (tests)
+    :param env_file: Path of the .env file (ignored when missing)
+    :raises ValueError: If a variable cannot be converted to its setting's type
+    """
+    defaults = Settings()
+    sources = {key: value for key, value in dotenv_values(env_file).items() if value is not None} if os.path.exists(env_file) else {}
+    sources.update(os.environ if environ is None else environ)
+    overrides = {}
+    for setting in dataclasses.fields(Settings):
+        env_name = ENV_ALIASES.get(setting.name, ENV_PREFIX + setting.name)
+        if env_name in sources:
+            overrides[setting.name] = _coerce(env_name, sources[env_name], getattr(defaults, setting.name))
+    return dataclasses.replace(defaults, **overrides)
+
+
+@lru_cache(maxsize=None)
+def get_settings():
+    """The process-wide Settings, loaded on first use."""
+    return load_settings()
+
+
+def __getattr__(name):
+    # Module attributes (TIMEOUT, TEST_URL, ...) resolve to the cached Settings
+    if name.isupper():
+        try:
+            return getattr(get_settings(), name)
+        except AttributeError:
+            pass
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | {setting.name for setting in dataclasses.fields(Settings)} | {"TEST_URL"})
@@ -1,53 +1,506 @@
 import pytest
 import os
+import json
 import logging
-from datetime import datetime
+import warnings
+from urllib.parse import urljoin
+from config.config import TEST_URL, USERNAME, PASSWORD, LOG_DIR, TARGET, LOCAL_HOST, LOCAL_PORT, NETWORK_ROUTING, ACTION_TIMING, CONTEXT_POOL_SIZE, BROWSER_PROFILE, DEPENDENCY_INDEX, ALLURE_STREAMING, SUMMARY_DIR
+from common.sharding import artifact_dir, worker_id, load_durations, save_durations, assign_shards
+from common.logger_config import defer_logging, configure_logging, shutdown_logging
 
-# Global logging configuration for test execution
-def setup_logging():
-    log_dir = "logs-saucedemo"
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+# Global logging for test execution (queued, batched writer; one file per worker).
+# Records are buffered until the first test starts (pytest_runtest_setup), so collection-only
+# runs never open a log file
+logger = defer_logging()
 
-    log_file = os.path.join(log_dir, f"test_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+# Recorded test durations for this run (setup + call + teardown), keyed by node id
+test_durations = {}
 
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.INFO)
+# Node ids that failed this run (always re-selected by --changed-since)
+failed_tests = set()
 
-    if root_logger.hasHandlers():
-        root_logger.handlers.clear()
+# Components reporting in the run summary: title -> object with a summary() method
+run_summary = {}
 
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
-    stream_handler = logging.StreamHandler()
-    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+# Incremental results report (common/run_report.py), created in pytest_configure
+run_report = None
 
-    file_handler.setFormatter(formatter)
-    stream_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(stream_handler)
+# Product catalogue for the product matrix, read once per session from the cache file (pytest_generate_tests)
+catalog = None
 
-    return root_logger
+# Command line options for sharded execution (set by common.parallel_runner)
+def pytest_addoption(parser):
+    group = parser.getgroup("saucedemo", "Saucedemo parallel sharding")
+    group.addoption("--shard-id", type=int, default=0, help="Index of the shard to run (0-based)")
+    group.addoption("--num-shards", type=int, default=1, help="Total number of shards")
+    group.addoption("--action-timing", choices=["on", "off"], default=None,
+                    help="Record per-action BasePage timings (default: config.ACTION_TIMING)")
+    group.addoption("--refresh-catalog", action="store_true", default=False,
+                    help="Scrape the product catalogue before collection (collection otherwise only reads the cache)")
+    group.addoption("--changed-since", metavar="REF", default=None,
+                    help="Only run tests whose recorded page-object dependencies changed since a git ref "
+                         "(\"last\" = commit of the last recorded run)")
 
-logger = setup_logging()
+# Explicit catalogue refresh before collection; a failed scrape fails the run instead of shrinking the matrix
+def pytest_sessionstart(session):
+    if session.config.getoption("--refresh-catalog"):
+        from common.catalog import refresh_catalog
+        refresh_catalog()
+
+# Incremental selection (--changed-since), then keep only this shard's tests, split longest-first
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--changed-since"):
+        select_changed_tests(config, items)
+
+    num_shards = config.getoption("--num-shards")
+    if num_shards <= 1:
+        return
+
+    shard_id = config.getoption("--shard-id")
+    shards = assign_shards([item.nodeid for item in items], load_durations(), num_shards)
+    selected_ids = set(shards[shard_id])
+
+    selected = [item for item in items if item.nodeid in selected_ids]
+    deselected = [item for item in items if item.nodeid not in selected_ids]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+    logger.info(f"Shard {shard_id}/{num_shards}: running {len(selected)} of {len(selected) + len(deselected)} tests")
+
+def select_changed_tests(config, items):
+    """Deselect tests whose recorded dependencies are untouched by the diff (common/dependency_index.py)."""
+    from common.dependency_index import LAST_RUN_REF, load_index, analyse_changes, select_tests
+
+    index = load_index()
+    ref = config.getoption("--changed-since")
+    if ref == LAST_RUN_REF:
+        ref = index["commit"]
+    if not ref:
+        logger.warning("No recorded run to diff against, running every test")
+        return
+    try:
+        change = analyse_changes(ref)
+    except Exception as e:
+        logger.warning(f"Diff against {ref} failed, running every test. Error: {str(e)}")
+        return
+    selected, deselected = select_tests(items, index, change)
+    if change.run_all:
+        logger.info(f"Running every test ({change.run_all})")
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+    logger.info(f"Changed since {ref[:12]}: running {len(selected)} of {len(selected) + len(deselected)} tests")
+
+def pytest_runtest_logreport(report):
+    test_durations[report.nodeid] = test_durations.get(report.nodeid, 0.0) + report.duration
+    if report.failed:
+        failed_tests.add(report.nodeid)
+    if run_report is not None:
+        run_report.add_report(report)
+
+# Attribute page-object symbols touched during a test (setup, call, teardown) to its node id
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    from common.dependency_index import recorder
+    recorder.start(item.nodeid)
+    yield
+    recorder.stop()
+
+# Symbols touched while shared (session/module-scoped) fixtures set up, e.g. login and the
+# context pool, are dependencies of every test rather than of the test that happened to trigger them
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    if fixturedef.scope == "function":
+        yield
+        return
+    from common.dependency_index import recorder
+    with recorder.session_scope():
+        yield
+
+# Persist durations: workers write their own file, merged by the parallel runner
+def pytest_sessionfinish(session):
+    # Drain queued failure screenshots before artifacts are collected
+    from common.screenshots import writer
+    from common.wait_policy import policy
+    from common.retry_policy import policy as retry_policy
+    writer.flush()
+    # Persist observed wait durations for the next run's learned timeouts (workers: own file, merged by the runner)
+    policy.save(os.path.join(artifact_dir(LOG_DIR), "wait_history.json") if worker_id() is not None else None)
+    if retry_policy.by_selector:
+        retry_policy.write_json(os.path.join(artifact_dir(LOG_DIR), "retry_stats.json"))
+    from common.tracing import recorder as trace_recorder
+    if trace_recorder.per_test:
+        trace_recorder.write_json(os.path.join(artifact_dir(LOG_DIR), "trace_overhead.json"))
+
+    if worker_id() is not None:
+        save_durations(test_durations, os.path.join(artifact_dir(LOG_DIR), "durations.json"))
+    else:
+        save_durations(test_durations)
+
+# Cart clearing timings per mode (fast vs click), screenshot, wait and retry counters, reported when used;
+# trylast: allure-pytest has registered its results writer by then, so it can be swapped for the streaming one;
+# nothing runs (or gets imported) for --collect-only
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    global run_report
+    if config.option.collectonly:
+        return
+    from common.clearcart import timings
+    from common.screenshots import writer
+    from common.wait_policy import policy
+    from common.retry_policy import policy as retry_policy
+    from common.tracing import recorder as trace_recorder
+    run_summary["Cart clearing"] = timings
+    run_summary["Screenshots"] = writer
+    run_summary["Adaptive waits"] = policy
+    run_summary["Step retries"] = retry_policy
+    run_summary["Failure traces"] = trace_recorder
+
+    from common.run_report import IncrementalReport
+    run_report = IncrementalReport(artifact_dir(SUMMARY_DIR))
+    run_summary["Run report"] = run_report
+    if ALLURE_STREAMING:
+        from common.allure_stream import install
+        streaming = install(config)
+        if streaming is not None:
+            run_summary["Allure results"] = streaming
+
+# Open the log file and start the writer when the first test starts (no-op afterwards)
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    configure_logging()
+
+# Final run report refresh; flush queued log records once pytest is done with the session
+def pytest_unconfigure(config):
+    if run_report is not None:
+        run_report.close()
+    shutdown_logging()
+
+# Print component summaries (network routing, ...) at the end of the run
+def pytest_terminal_summary(terminalreporter):
+    if not run_summary:
+        return
+    lines = [(title, component.summary()) for title, component in run_summary.items()]
+    lines = [(title, summary) for title, summary in lines if summary]
+    if not lines:
+        return
+    terminalreporter.section("saucedemo run summary")
+    for title, summary in lines:
+        terminalreporter.write_line(f"{title}: {summary}")
+
+# Runtime page-object dependency recording, merged into the index after the run
+@pytest.fixture(scope="session", autouse=True)
+def dependency_recording():
+    if not DEPENDENCY_INDEX:
+        yield None
+        return
+
+    from common.dependency_index import recorder, save_index, write_worker_index
+    recorder.install()
+    yield recorder
+    recorder.uninstall()
+
+    if worker_id() is not None:
+        write_worker_index(recorder.dependencies, failed_tests, os.path.join(artifact_dir(LOG_DIR), "dependencies.json"),
+                           session=recorder.session)
+    else:
+        save_index(recorder.dependencies, failed_tests, session=recorder.session)
+
+# Per-action BasePage timings: hot-path table written as JSON and attached to Allure
+@pytest.fixture(scope="session", autouse=True)
+def action_timing(pytestconfig):
+    option = pytestconfig.getoption("--action-timing")
+    if not (option == "on" or (option is None and ACTION_TIMING)):
+        yield None
+        return
+
+    import allure
+    from common import action_timing as timing
+    timing.install()
+    run_summary["Action timing"] = timing.recorder
+    yield timing.recorder
+    timing.uninstall()
+
+    report_path = timing.recorder.write_json(os.path.join(artifact_dir(LOG_DIR), "action_timings.json"))
+    allure.attach.file(report_path, name="BasePage action timings", attachment_type=allure.attachment_type.JSON)
+
+# Session-wide request routing (blocked third parties + static asset cache); None when disabled
+@pytest.fixture(scope="session")
+def network_router():
+    if not NETWORK_ROUTING:
+        yield None
+        return
+
+    from common.network import AssetCache, NetworkRouter
+    router = NetworkRouter(cache=AssetCache())
+    run_summary["Network routing"] = router
+    yield router
+    router.cache.evict()
+    router.write_stats(os.path.join(artifact_dir(LOG_DIR), "network_stats.json"))
+
+# Browser profile (config.BROWSER_PROFILE / SAUCEDEMO_BROWSER_PROFILE): "lean" adds trimmed Chromium
+# launch args, a small reduced-motion viewport and animation-free CSS on top of pytest-playwright's options
+@pytest.fixture(scope="session")
+def browser_type_launch_args(browser_type_launch_args):
+    from common.browser_profile import launch_args
+    logger.info(f"Browser profile: {BROWSER_PROFILE}")
+    return launch_args(browser_type_launch_args)
+
+@pytest.fixture(scope="session")
+def browser_context_args(browser_context_args):
+    from common.browser_profile import context_args
+    return context_args(browser_context_args)
+
+# Setup applied to every context the fixtures create (profile CSS + network routing)
+@pytest.fixture(scope="session")
+def prepare_context(network_router):
+    from common.browser_profile import prepare_context as apply_profile
+
+    def _prepare(context):
+        apply_profile(context)
+        if network_router:
+            network_router.install(context)
+
+    return _prepare
+
+# Per-context memory budget and contexts-per-GB figure (baseline taken before any pooled context exists)
+@pytest.fixture(scope="session")
+def memory_monitor(browser):
+    from common.browser_profile import ContextMemoryMonitor
+    monitor = ContextMemoryMonitor()
+    monitor.set_baseline()
+    run_summary["Context memory"] = monitor
+    yield monitor
+    monitor.save()
+
+# Retain-on-failure tracing (config.TRACE_MODE): one trace chunk per test, saved only if it failed
+@pytest.fixture(scope="session")
+def trace_recorder():
+    from common.tracing import recorder
+    return recorder
 
 # Playwright page fixture (auto-manages browser, context, and page)
 @pytest.fixture(scope="function")
-def page(page):
-    yield page
+def page(page, prepare_context, trace_recorder, pytestconfig, request):
+    prepare_context(page.context)
+    # pytest-playwright's own --tracing already traces this context
+    if pytestconfig.getoption("--tracing") != "off":
+        yield page
+        return
+    with trace_recorder.capture(request, page.context):
+        yield page
+
+# Local stand-in of saucedemo (config.TARGET / SAUCEDEMO_TARGET=local); no-op for the public site
+@pytest.fixture(scope="session", autouse=True)
+def local_site():
+    if TARGET != "local":
+        yield None
+        return
+
+    from standin.server import ensure_running
+    server = ensure_running(LOCAL_HOST, LOCAL_PORT)
+    logger.info(f"Saucedemo stand-in available at {TEST_URL}")
+    yield server
+    if server is not None:
+        server.stop()
+
+# Session-scoped login: each user logs in via UI at most once per state TTL
+@pytest.fixture(scope="session")
+def login_state(browser, browser_context_args, local_site):
+    """
+    Return a callable resolving (username, password) to a cached storage_state file:
+    - Cold cache: logs in via UI once and saves the authenticated state
+    - Warm cache: returns the saved file without touching the browser
+    """
+    from common.session_state import ensure_state
+
+    def _login_state(username=USERNAME, password=PASSWORD):
+        return ensure_state(browser, username, password, browser_context_args)
+
+    return _login_state
+
+# Session-wide pool of warm contexts logged in as the default user
+@pytest.fixture(scope="session")
+def context_pool(browser, browser_context_args, login_state, prepare_context, memory_monitor):
+    if CONTEXT_POOL_SIZE <= 0:
+        yield None
+        return
+
+    from common.context_pool import ContextPool
+    pool = ContextPool(
+        browser,
+        login_state,
+        context_args=browser_context_args,
+        prepare=prepare_context,
+        memory_monitor=memory_monitor,
+    )
+    pool.warm()
+    run_summary["Context pool"] = pool
+    yield pool
+    pool.close()
 
 # Reusable login fixture for Saucedemo tests
+# - Default credentials: warm context checked out from context_pool
+# - Overridden credentials (indirect parametrization: (username, password)) or @pytest.mark.fresh_context:
+#   fresh context seeded from the cached session
 @pytest.fixture(scope="function")
-def login_fixture(page):
-    page.goto("https://www.saucedemo.com/")
-    logger.info("Navigated to saucedemo login page")
-
+def login_fixture(browser, browser_context_args, login_state, prepare_context, context_pool, trace_recorder, request):
     from common.login_common import login_common
-    login_common(page)
+    from common.session_state import invalidate_state, save_state, wait_for_inventory
+    from common.wait_policy import policy as wait_policy
+    from pages.login_page import LoginPage
+
+    username, password = getattr(request, "param", (USERNAME, PASSWORD))
+    if context_pool is not None and (username, password) == (USERNAME, PASSWORD) \
+            and request.node.get_closest_marker("fresh_context") is None:
+        pooled = context_pool.acquire()
+        logger.info("Login fixture checked out a warm context from the pool")
+        with trace_recorder.capture(request, pooled.context):
+            yield pooled.page
+        # Failed (or errored) tests never hand their context to the next test
+        rep_call = getattr(request.node, "rep_call", None)
+        context_pool.release(pooled, failed=rep_call is None or rep_call.failed)
+        return
+
+    context = browser.new_context(**browser_context_args, storage_state=login_state(username, password))
+    # A failing setup step must not leak the context for the rest of the session
+    try:
+        prepare_context(context)
+        page = context.new_page()
+
+        # Land directly on the inventory page with the seeded session
+        page.goto(urljoin(TEST_URL, "inventory.html"))
+        logger.info("Navigated to saucedemo inventory page with cached session")
+
+        # The site bounces rejected sessions back to the login form
+        landing = f"{LoginPage.homepage_title}, {LoginPage.login_btn}"
+        landing_timeout = wait_policy.timeout_for(landing)
+        with wait_policy.track(landing, landing_timeout):
+            page.wait_for_selector(landing, timeout=landing_timeout)
+        if not page.is_visible(LoginPage.homepage_title):
+            logger.warning(f"Cached session rejected for username: {username}, falling back to UI login")
+            invalidate_state(username, password)
+            page.goto(TEST_URL)
+            login_common(page, username, password)
+            wait_for_inventory(page)
+            save_state(context, username, password)
+    except Exception:
+        context.close()
+        raise
 
-    # Wait for successful login redirect
-    page.wait_for_url("**/inventory.html", timeout=30000)
     logger.info("Login fixture executed successfully")
-    return page
+    with trace_recorder.capture(request, context):
+        yield page
+    context.close()
+
+# One logged-in page per worker shared by all product-matrix journeys (one login, one inventory load)
+@pytest.fixture(scope="session")
+def journey_page(browser, browser_context_args, login_state, prepare_context, context_pool):
+    if context_pool is not None:
+        pooled = context_pool.acquire()
+        yield pooled.page
+        # Not handed back for reuse: its cart/navigation state belongs to the journeys
+        context_pool.release(pooled, failed=True)
+        return
+
+    context = browser.new_context(**browser_context_args, storage_state=login_state())
+    try:
+        prepare_context(context)
+        page = context.new_page()
+        page.goto(urljoin(TEST_URL, "inventory.html"))
+    except Exception:
+        context.close()
+        raise
+    yield page
+    context.close()
+
+# Per-journey reset of the shared page: fresh session cookies, empty cart, back on inventory.html
+@pytest.fixture(scope="function")
+def shop(journey_page, login_state, trace_recorder, request):
+    from common.clearcart import clearcart
+
+    # Long runs can outlive the site's session cookie; reseeding is one round-trip
+    with open(login_state(), encoding="utf-8") as f:
+        journey_page.context.add_cookies(json.load(f).get("cookies", []))
+    clearcart(journey_page, mode="fast")
+    with trace_recorder.capture(request, journey_page.context):
+        yield journey_page
+
+# Cart preconditions without UI clicks (common/state_seed.py): cart_with(products=[...], path=..., username=...)
+# returns a page showing exactly that cart
+# - Default: the worker's shared journey page; cookie + cart written in place, then one navigation
+# - @pytest.mark.fresh_context: a new context that starts logged in (seeded cookie, no login form)
+#   with the cart injected by an init script before the first navigation
+@pytest.fixture(scope="function")
+def cart_with(browser, browser_context_args, prepare_context, trace_recorder, request):
+    from common.state_seed import seeded_state, add_cart_seed, seed_page
+
+    if request.node.get_closest_marker("fresh_context") is None:
+        page = request.getfixturevalue("journey_page")
+
+        def _cart_with(products=(), path="inventory.html", username=USERNAME):
+            return seed_page(page, products, username, path)
+
+        with trace_recorder.capture(request, page.context):
+            yield _cart_with
+        return
+
+    context = browser.new_context(**browser_context_args, storage_state=seeded_state())
+    try:
+        prepare_context(context)
+        page = context.new_page()
+    except Exception:
+        context.close()
+        raise
+
+    def _cart_with(products=(), path="inventory.html", username=USERNAME):
+        if username != USERNAME:
+            context.add_cookies(seeded_state(username=username)["cookies"])
+        add_cart_seed(context, products)
+        page.goto(urljoin(TEST_URL, path))
+        return page
+
+    with trace_recorder.capture(request, context):
+        yield _cart_with
+    context.close()
+
+# Product-matrix parametrization from the scraped inventory catalogue (common/catalog.py):
+# - "product": every catalogue item
+# - "cart_products": multi-item carts (pairs + the full catalogue)
+# The catalogue (or a failed attempt to load it) is reused by every parametrized test function
+def pytest_generate_tests(metafunc):
+    global catalog
+    if "product" not in metafunc.fixturenames and "cart_products" not in metafunc.fixturenames:
+        return
+
+    # Cache file only: collection never launches a browser. A missing cache leaves empty
+    # parameter sets and fails the run once such tests are selected (pytest_collection_finish);
+    # a stale one is used with a warning
+    from common.catalog import load_catalog, multi_item_carts, REFRESH_HINT
+    if catalog is None:
+        catalog = load_catalog(ttl=float("inf")) or []
+        if not catalog:
+            warnings.warn(pytest.PytestWarning(f"No product catalogue cached for {TEST_URL}: {REFRESH_HINT}"))
+        elif load_catalog() is None:
+            warnings.warn(pytest.PytestWarning(f"Product catalogue cache is older than CATALOG_TTL: {REFRESH_HINT}"))
+
+    if "product" in metafunc.fixturenames:
+        metafunc.parametrize("product", catalog, ids=[item.slug for item in catalog])
+    if "cart_products" in metafunc.fixturenames:
+        carts = multi_item_carts(catalog)
+        metafunc.parametrize("cart_products", carts, ids=["+".join(str(item.id) for item in cart) for cart in carts])
+
+# A run that selects product-matrix tests without a catalogue would pass while testing 0 products:
+# fail it instead (after -k/-m/--changed-since deselection; --collect-only only warns)
+def pytest_collection_finish(session):
+    if catalog or session.config.option.collectonly:
+        return
+    from common.catalog import REFRESH_HINT
+    unparametrized = [item.nodeid for item in session.items
+                      if {"product", "cart_products"} & set(getattr(item, "fixturenames", ()))]
+    if unparametrized:
+        raise pytest.UsageError(f"{len(unparametrized)} selected product-matrix tests have no product catalogue "
+                                f"for {TEST_URL} (e.g. {unparametrized[0]}): {REFRESH_HINT}")
 
 # Pytest hook to capture test results (pass/fail)
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
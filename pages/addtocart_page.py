@@ -1,9 +1,11 @@
 import logging
 from pages.base_page import BasePage
+from pages.flow import step
+from pages.snapshot import price, integer, attribute, rows
 
-# Page Object for Add to Cart functionality (follows POM design pattern)
-class AddToCartPage(BasePage):
-    # Initialize logger for AddToCartPage class
+# Locators + add-to-cart flow shared by AddToCartPage and AsyncAddToCartPage (pages/async_pages.py)
+class AddToCartFlow:
+    # Initialize logger for add-to-cart page objects
     logger = logging.getLogger(__name__)
 
     # ------------------------------
@@ -23,56 +25,80 @@ class AddToCartPage(BasePage):
 
     # Add to cart button (corrected: By.ID → By.XPATH for data-test attribute)
     product_add_cart = '//button[@data-test="add-to-cart"]'
+
+    # Remove button that replaces add-to-cart once the item is in the cart
+    product_remove_cart = '//button[@data-test="remove"]'
     
     # Shopping cart item count badge (only visible when cart has items)
     cart_count = '.shopping_cart_badge'
 
+    # Inventory list cards (bulk reads)
+    inventory_items = '[data-test="inventory-item"]'
+
+    # Inventory list add/remove buttons for any product (format with CatalogItem.slug)
+    product_add_btn = '[data-test="add-to-cart-{slug}"]'
+    product_remove_btn = '[data-test="remove-{slug}"]'
+
     # ------------------------------
-    # Core Add to Cart Action (encapsulated)
+    # Snapshot field maps (pages/snapshot.py): each is read in one evaluate() round-trip
     # ------------------------------
-    def add_to_cart(self):
+    # First product's name/price on the inventory list
+    first_product_fields = {"name": product01_name, "price": price(products01_price)}
+    # Cart badge (None when the cart is empty)
+    cart_fields = {"count": integer(cart_count)}
+    # Cart badge + every inventory card (button data-test is "remove-<slug>" once in the cart)
+    inventory_fields = {
+        "count": integer(cart_count),
+        "items": rows(
+            inventory_items,
+            name='[data-test="inventory-item-name"]',
+            price=price('[data-test="inventory-item-price"]'),
+            action=attribute("button", "data-test"),
+        ),
+    }
+
+    # ------------------------------
+    # Core Add to Cart Flow (shared sync/async steps)
+    # ------------------------------
+    def add_to_cart_flow(self):
         """
-        Execute complete add-to-cart flow for the first inventory item:
+        Add-to-cart steps for the first inventory item:
         1. Validates product list is loaded
-        2. Captures original product name/price from inventory list
+        2. Captures original product name/price (Decimal) from inventory list in one snapshot
         3. Navigates to product detail page
         4. Clicks add-to-cart button
-        5. Calculates updated cart count (handles empty cart edge case)
-        6. Returns product info + updated cart count for validation
+        5. Waits for the add to register and reads the cart count without waiting
+        6. Returns product info + cart count after the add for validation
         
         :return: Dictionary with product name, price, and updated cart count
         :raises Exception: Propagates errors for test case failure handling
         """
         try:
-            # Wait for product list to load and capture original product name
-            self.wait_elem_visible(self.product01_name)
-            product_original_name = self.page.text_content(self.product01_name).strip()
-            
-            # Capture original product price from inventory list
-            product_original_price = self.page.text_content(self.products01_price).strip()
+            # Wait for product list to load and capture original product name/price (one snapshot)
+            yield step("wait_elem_visible", self.product01_name)
+            product_original = yield step("snapshot", self.first_product_fields)
             
             # Navigate to product detail page (click product name)
-            self.elem_click(self.product01_name)
+            yield step("elem_click", self.product01_name)
 
             # Wait for detail page to load and click add-to-cart button
-            self.wait_elem_visible(self.product_detail_name)
-            self.elem_click(self.product_add_cart)
+            yield step("wait_elem_visible", self.product_detail_name)
+            yield step("elem_click", self.product_add_cart)
 
-            # Handle edge case: cart count badge missing (empty cart)
-            try:
-                product_original_num = int(self.page.text_content(self.cart_count).strip())
-            except Exception:
-                # Cart was empty before add-to-cart (default count = 0)
-                product_original_num = 0  
+            # Wait for the button to flip to "Remove" (add registered), then read the badge
+            # without waiting: a missing badge is a valid answer (empty cart), not a 30s stall
+            yield step("wait_elem_visible", self.product_remove_cart)
+            # The badge already includes the new item; a missing badge means the add did not register (0)
+            cart_num = (yield step("snapshot", self.cart_fields)).count or 0
 
             # Log successful add-to-cart operation
             self.logger.info("Add to cart operation completed successfully")
             
-            # Compile product info (updated cart count = original + 1)
+            # Compile product info (cart count as read after the add)
             product_original_info = {
-                "original_name": product_original_name,
-                "original_price": product_original_price,
-                "original_num": product_original_num + 1  # Increment count post-add
+                "original_name": product_original.name,
+                "original_price": product_original.price,
+                "original_num": cart_num
             }
             
             # Return product info for validation in test cases
@@ -82,3 +108,82 @@ class AddToCartPage(BasePage):
             # Log detailed failure with context (error level for troubleshooting)
             self.logger.error(f"Add to cart operation failed. Error: {str(e)}")
             raise e 
+
+    def add_product_to_cart_flow(self, product):
+        """
+        Add-to-cart steps for any catalogue product, straight from the inventory list:
+        1. Clicks the product's add-to-cart button
+        2. Waits for the button to flip to "Remove" (add registered)
+        3. Reads the cart count without waiting
+        
+        :param product: CatalogItem (common/catalog.py)
+        :return: Dictionary with product name, price, and updated cart count
+        :raises Exception: Propagates errors for test case failure handling
+        """
+        try:
+            yield step("elem_click", self.product_add_btn.format(slug=product.slug))
+            yield step("wait_elem_visible", self.product_remove_btn.format(slug=product.slug))
+
+            cart_num = (yield step("snapshot", self.cart_fields)).count or 0
+
+            self.logger.info(f"Added {product.name} to cart (cart count: {cart_num})")
+            return {"name": product.name, "price": product.price, "count": cart_num}
+
+        except Exception as e:
+            self.logger.error(f"Add to cart failed for {product.name}. Error: {str(e)}")
+            raise e
+
+    def add_products_to_cart_flow(self, products):
+        """
+        Bulk add-to-cart in one inventory pass (no detail page navigation):
+        1. Reads the current cart count without waiting
+        2. Clicks the inventory add-to-cart button of every product
+        3. Waits for the last product's button to flip to "Remove"
+        4. Verifies the cart badge and reads name/price of all added products in one snapshot
+        
+        :param products: CatalogItems (common/catalog.py) to add, in order
+        :return: Dictionary with "items" ([{"name", "price" (Decimal)}] in product order) and cart "count"
+        :raises AssertionError: If the cart count or any added product does not match
+        :raises ValueError: If products is empty
+        """
+        if not products:
+            raise ValueError("add_products_to_cart_flow needs at least one product")
+        try:
+            start_num = (yield step("snapshot", self.cart_fields)).count or 0
+
+            for product in products:
+                yield step("elem_click", self.product_add_btn.format(slug=product.slug))
+            yield step("wait_elem_visible", self.product_remove_btn.format(slug=products[-1].slug))
+
+            inventory = yield step("snapshot", self.inventory_fields)
+            cart_num = inventory.count or 0
+            if cart_num != start_num + len(products):
+                raise AssertionError(f"Cart count validation failed: Expected {start_num + len(products)}, Actual={cart_num}")
+
+            in_cart = {row.action[len("remove-"):]: row for row in inventory.items if (row.action or "").startswith("remove-")}
+            missing = [product.name for product in products if product.slug not in in_cart]
+            if missing:
+                raise AssertionError(f"Products not in cart after bulk add: {missing}")
+            items = [{"name": in_cart[product.slug].name, "price": in_cart[product.slug].price} for product in products]
+
+            self.logger.info(f"Bulk added {len(products)} products to cart (cart count: {cart_num})")
+            return {"items": items, "count": cart_num}
+
+        except Exception as e:
+            self.logger.error(f"Bulk add to cart failed. Error: {str(e)}")
+            raise e
+
+# Page Object for Add to Cart functionality (follows POM design pattern)
+class AddToCartPage(AddToCartFlow, BasePage):
+
+    def add_to_cart(self):
+        """Execute complete add-to-cart flow for the first inventory item (see add_to_cart_flow)."""
+        return self.run_flow(self.add_to_cart_flow())
+
+    def add_product_to_cart(self, product):
+        """Add any catalogue product from the inventory list (see add_product_to_cart_flow)."""
+        return self.run_flow(self.add_product_to_cart_flow(product))
+
+    def add_products_to_cart(self, products):
+        """Add several products in one inventory pass (see add_products_to_cart_flow)."""
+        return self.run_flow(self.add_products_to_cart_flow(products))
@@ -0,0 +1,144 @@
+import asyncio
+from common.screenshots import capture_async
+from common.wait_policy import policy
+from common.retry_policy import policy as retry_policy, click_state
+from pages.base_page import screenshot_slug, EXIST_TIMEOUT_MS
+from pages.flow import run_flow_async
+from pages.snapshot import SNAPSHOT_SCRIPT, normalize_spec, spec_payload, build_record
+from playwright.async_api import TimeoutError
+
+class AsyncBasePage:
+    """
+    asyncio twin of BasePage built on playwright.async_api.
+
+    Exposes the same primitives as coroutines, so the flow generators shared with the
+    sync page objects (pages/flow.py) run unchanged via run_flow().
+    """
+
+    def __init__(self, page):
+        """Initialize base page with an async Playwright page instance."""
+        self.page = page
+        self.wait_policy = policy
+        self.retry_policy = retry_policy
+        self.timeout = policy.default_ms  # Fallback when a selector has no wait history yet
+        self._locators = {}
+
+    def locator(self, selector):
+        """Return a cached Locator for a selector (Locator instances are returned as-is)."""
+        if not isinstance(selector, str):
+            return selector
+        locator = self._locators.get(selector)
+        if locator is None:
+            locator = self._locators[selector] = self.page.locator(selector)
+        return locator
+
+    async def wait_elem_visible(self, selector, timeout=None):
+        """Wait for an element to be visible on the page."""
+        timeout = timeout or self.wait_policy.timeout_for(selector)
+
+        async def attempt():
+            with self.wait_policy.track(selector, timeout):
+                await self.locator(selector).first.wait_for(state="visible", timeout=timeout)
+        try:
+            await self.retry_policy.call_async(selector, attempt)
+        except TimeoutError:
+            await self.queue_screen_shot(f"elem_timeout_{screenshot_slug(selector)}.png", selector=selector)
+            raise TimeoutError(f"Element visibility timeout: {selector}")
+
+    async def elem_clickable(self, selector, timeout=None):
+        """Wait for an element to be ready for interaction (visible & enabled)."""
+        timeout = timeout or self.wait_policy.timeout_for(selector)
+
+        async def attempt():
+            with self.wait_policy.track(selector, timeout):
+                await self.locator(selector).first.wait_for(state="visible", timeout=timeout)
+        try:
+            await self.retry_policy.call_async(selector, attempt)
+        except TimeoutError:
+            await self.queue_screen_shot(f"elem_clickable_timeout_{screenshot_slug(selector)}.png", selector=selector)
+            raise TimeoutError(f"Element not interactable: {selector}")
+
+    async def elem_click(self, selector, timeout=None, expected_url=None):
+        """Click an element; retried only if never dispatched (see BasePage.elem_click)."""
+        timeout = timeout or self.wait_policy.timeout_for(selector)
+        url_before = self.page.url
+
+        async def attempt():
+            with self.wait_policy.track(selector, timeout):
+                await self.locator(selector).first.click(timeout=timeout)
+        try:
+            await self.retry_policy.call_async(selector, attempt,
+                                               state=lambda error: click_state(error, url_before, self.page.url, expected_url))
+        except TimeoutError:
+            await self.queue_screen_shot(f"elem_clickable_timeout_{screenshot_slug(selector)}.png", selector=selector)
+            raise TimeoutError(f"Element not interactable: {selector}")
+
+    async def elem_input(self, selector, text, timeout=None):
+        """Clear and fill input field with specified text."""
+        timeout = timeout or self.wait_policy.timeout_for(selector)
+
+        async def attempt():
+            with self.wait_policy.track(selector, timeout):
+                await self.locator(selector).first.fill(text, timeout=timeout)
+        try:
+            await self.retry_policy.call_async(selector, attempt)
+        except TimeoutError:
+            await self.queue_screen_shot(f"elem_timeout_{screenshot_slug(selector)}.png", selector=selector)
+            raise TimeoutError(f"Element visibility timeout: {selector}")
+
+    async def elem_text(self, selector, timeout=None):
+        """Return the stripped text content of the first matching element."""
+        timeout = timeout or self.wait_policy.timeout_for(selector)
+
+        async def attempt():
+            with self.wait_policy.track(selector, timeout):
+                return ((await self.locator(selector).first.text_content(timeout=timeout)) or "").strip()
+        return await self.retry_policy.call_async(selector, attempt)
+
+    async def elem_count(self, selector):
+        """Number of matching elements right now (non-waiting; 0 is a valid answer)."""
+        return await self.locator(selector).count()
+
+    async def eval_all(self, selector, expression, arg=None):
+        """Evaluate a JS function over all matching elements in one round-trip (non-waiting)."""
+        return await self.retry_policy.call_async(selector, lambda: self.locator(selector).evaluate_all(expression, arg))
+
+    async def snapshot(self, fields):
+        """Read a declarative field map in one evaluate() round-trip (see BasePage.snapshot)."""
+        spec = normalize_spec(fields)
+        raw = await self.retry_policy.call_async(f"snapshot({', '.join(spec)})", lambda: self.page.evaluate(SNAPSHOT_SCRIPT, spec_payload(spec)))
+        return build_record(spec, raw)
+
+    async def run_flow(self, flow):
+        """Execute a shared flow generator against this page object's primitives."""
+        return await run_flow_async(self, flow)
+
+    async def save_screen_shot(self, filename, mode=None, selector=None):
+        """Capture a screenshot and return the saved file path (see BasePage.save_screen_shot)."""
+        return await asyncio.wrap_future(await self.queue_screen_shot(filename, mode=mode, selector=selector))
+
+    async def queue_screen_shot(self, filename, mode=None, selector=None):
+        """Non-blocking save_screen_shot (see BasePage.queue_screen_shot); returns a concurrent Future."""
+        locator = self.locator(selector) if selector is not None else None
+        return await capture_async(self.page, filename, mode=mode, locator=locator)
+
+    async def is_element_exist(self, selector, timeout=EXIST_TIMEOUT_MS):
+        """Check if element exists in DOM within a short timeout (ms; 0 = non-waiting count() check)."""
+        if not timeout:
+            return await self.elem_count(selector) > 0
+        try:
+            await self.locator(selector).first.wait_for(state="attached", timeout=timeout)
+            return True
+        except TimeoutError:
+            return False
+
+    async def find_elements(self, selector, timeout=None):
+        """Return list of matching ElementHandles (empty list if none found; see BasePage.find_elements)."""
+        timeout = timeout or self.wait_policy.timeout_for(selector, absence_ok=True)
+        locator = self.locator(selector)
+        try:
+            with self.wait_policy.track(selector, timeout, absence_ok=True):
+                await locator.first.wait_for(state="visible", timeout=timeout)
+            return await locator.element_handles()
+        except TimeoutError:
+            return []
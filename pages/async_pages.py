@@ -0,0 +1,45 @@
+from pages.async_base_page import AsyncBasePage
+from pages.login_page import LoginFlow
+from pages.addtocart_page import AddToCartFlow
+from pages.checkout_page import CheckoutFlow
+from pages.clear_product_page import ClearProductFlow
+from config.config import USERNAME, PASSWORD, FIRSTNAME, LASTNAME, POSTALCODE
+
+# asyncio page objects: locators and flow steps come from the shared *Flow classes,
+# so these stay in lockstep with LoginPage/AddToCartPage/CheckoutPage/ClearProductPage
+
+class AsyncLoginPage(LoginFlow, AsyncBasePage):
+
+    async def login(self, username=USERNAME, password=PASSWORD):
+        """Execute complete login flow and validate success."""
+        return await self.run_flow(self.login_flow(username, password))
+
+class AsyncAddToCartPage(AddToCartFlow, AsyncBasePage):
+
+    async def add_to_cart(self):
+        """Execute complete add-to-cart flow for the first inventory item."""
+        return await self.run_flow(self.add_to_cart_flow())
+
+    async def add_product_to_cart(self, product):
+        """Add any catalogue product from the inventory list."""
+        return await self.run_flow(self.add_product_to_cart_flow(product))
+
+    async def add_products_to_cart(self, products):
+        """Add several products in one inventory pass."""
+        return await self.run_flow(self.add_products_to_cart_flow(products))
+
+class AsyncCheckoutPage(CheckoutFlow, AsyncBasePage):
+
+    async def checkout(self, firstname=FIRSTNAME, lastname=LASTNAME, postalcode=POSTALCODE):
+        """Execute complete checkout flow from cart to order review."""
+        return await self.run_flow(self.checkout_flow(firstname, lastname, postalcode))
+
+    async def checkout_items(self, firstname=FIRSTNAME, lastname=LASTNAME, postalcode=POSTALCODE):
+        """Execute checkout and return every order review row."""
+        return await self.run_flow(self.checkout_items_flow(firstname, lastname, postalcode))
+
+class AsyncClearProductPage(ClearProductFlow, AsyncBasePage):
+
+    async def clear_product_from_cart(self, slug=None):
+        """Execute flow to remove Sauce Labs Backpack (or product `slug`) from cart."""
+        return await self.run_flow(self.clear_product_from_cart_flow(slug))
@@ -1,54 +1,174 @@
-import os
-from config.config import TIMEOUT
+import re
+from config.config import LEGACY_WAITS
+from common.screenshots import capture
+from common.wait_policy import policy
+from common.retry_policy import policy as retry_policy, click_state
+from pages.flow import run_flow
+from pages.snapshot import SNAPSHOT_SCRIPT, normalize_spec, spec_payload, build_record
 from playwright.sync_api import TimeoutError
 
+# Default attached-wait of is_element_exist (ms)
+EXIST_TIMEOUT_MS = 3000
+
 class BasePage:
-    """Base class for all page objects, providing common Playwright actions."""
-    
-    def __init__(self, page):
+    """
+    Base class for all page objects, providing common Playwright actions.
+
+    Actions run on cached Locator objects, so each action is a single auto-waiting
+    round-trip to the browser. legacy_waits=True (or config.LEGACY_WAITS) restores the
+    previous explicit wait_for_selector + action sequence.
+
+    Timeouts come from the shared WaitPolicy (common/wait_policy.py): per-selector values
+    learned from previous runs, config.TIMEOUT until enough history exists. An explicit
+    timeout argument always wins.
+
+    Transient action failures are retried in place by the shared RetryPolicy
+    (common/retry_policy.py); clicks only when the click was never dispatched.
+
+    Page flows are generators of Steps (pages/flow.py) shared with AsyncBasePage;
+    run_flow() executes them against these synchronous primitives.
+    """
+
+    def __init__(self, page, legacy_waits=None):
         """Initialize base page with Playwright page instance."""
         self.page = page
-        self.timeout = TIMEOUT * 1000  # Convert to milliseconds for Playwright
+        self.wait_policy = policy
+        self.retry_policy = retry_policy
+        self.timeout = policy.default_ms  # Fallback when a selector has no wait history yet
+        self.legacy_waits = LEGACY_WAITS if legacy_waits is None else legacy_waits
+        self._locators = {}
+
+    def locator(self, selector):
+        """Return a cached Locator for a selector (Locator instances are returned as-is)."""
+        if not isinstance(selector, str):
+            return selector
+        locator = self._locators.get(selector)
+        if locator is None:
+            locator = self._locators[selector] = self.page.locator(selector)
+        return locator
 
     def wait_elem_visible(self, selector, timeout=None):
         """Wait for an element to be visible on the page."""
-        timeout = timeout or self.timeout
+        timeout = timeout or self.wait_policy.timeout_for(selector)
+
+        def attempt():
+            with self.wait_policy.track(selector, timeout):
+                if self.legacy_waits and isinstance(selector, str):
+                    self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+                else:
+                    self.locator(selector).first.wait_for(state="visible", timeout=timeout)
         try:
-            self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+            self.retry_policy.call(selector, attempt)
         except TimeoutError:
-            screenshot_name = f"elem_timeout_{selector.replace('/', '_')}.png"
-            self.save_screen_shot(screenshot_name)
+            self.queue_screen_shot(f"elem_timeout_{screenshot_slug(selector)}.png", selector=selector)
             raise TimeoutError(f"Element visibility timeout: {selector}")
 
     def elem_clickable(self, selector, timeout=None):
         """Wait for an element to be ready for interaction (visible & enabled)."""
-        timeout = timeout or self.timeout
+        timeout = timeout or self.wait_policy.timeout_for(selector)
+
+        def attempt():
+            with self.wait_policy.track(selector, timeout):
+                if self.legacy_waits and isinstance(selector, str):
+                    self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+                else:
+                    self.locator(selector).first.wait_for(state="visible", timeout=timeout)
         try:
-            self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+            self.retry_policy.call(selector, attempt)
         except TimeoutError:
-            screenshot_name = f"elem_clickable_timeout_{selector.replace('/', '_')}.png"
-            self.save_screen_shot(screenshot_name)
+            self.queue_screen_shot(f"elem_clickable_timeout_{screenshot_slug(selector)}.png", selector=selector)
             raise TimeoutError(f"Element not interactable: {selector}")
 
-    def elem_click(self, selector, timeout=None):
-        """Click an element after ensuring it is ready."""
-        timeout = timeout or self.timeout
-        self.elem_clickable(selector, timeout)
-        self.page.click(selector)
+    def elem_click(self, selector, timeout=None, expected_url=None):
+        """
+        Click an element (the click itself waits until it is visible, stable and enabled).
+        A failed click is repeated only if it was never dispatched, and counts as done only if
+        Playwright reported it done or the page navigated to expected_url (regex), see
+        common.retry_policy.click_state.
+        """
+        timeout = timeout or self.wait_policy.timeout_for(selector)
+        if self.legacy_waits and isinstance(selector, str):
+            self.elem_clickable(selector, timeout)
+            self.page.click(selector)
+            return
+        url_before = self.page.url
+
+        def attempt():
+            with self.wait_policy.track(selector, timeout):
+                self.locator(selector).first.click(timeout=timeout)
+        try:
+            self.retry_policy.call(selector, attempt,
+                                   state=lambda error: click_state(error, url_before, self.page.url, expected_url))
+        except TimeoutError:
+            self.queue_screen_shot(f"elem_clickable_timeout_{screenshot_slug(selector)}.png", selector=selector)
+            raise TimeoutError(f"Element not interactable: {selector}")
 
     def elem_input(self, selector, text, timeout=None):
         """Clear and fill input field with specified text."""
-        timeout = timeout or self.timeout
-        self.wait_elem_visible(selector, timeout)
-        self.page.fill(selector, text)
-
-    def save_screen_shot(self, filename):
-        """Capture and save full page screenshot to screenshots directory."""
-        if not os.path.exists("screenshots"):
-            os.makedirs("screenshots")
-        file_path = os.path.join("screenshots", filename)
-        self.page.screenshot(path=file_path, full_page=True)
-        return file_path
+        timeout = timeout or self.wait_policy.timeout_for(selector)
+        if self.legacy_waits and isinstance(selector, str):
+            self.wait_elem_visible(selector, timeout)
+            self.page.fill(selector, text)
+            return
+
+        def attempt():
+            with self.wait_policy.track(selector, timeout):
+                self.locator(selector).first.fill(text, timeout=timeout)
+        try:
+            self.retry_policy.call(selector, attempt)
+        except TimeoutError:
+            self.queue_screen_shot(f"elem_timeout_{screenshot_slug(selector)}.png", selector=selector)
+            raise TimeoutError(f"Element visibility timeout: {selector}")
+
+    def elem_text(self, selector, timeout=None):
+        """Return the stripped text content of the first matching element."""
+        timeout = timeout or self.wait_policy.timeout_for(selector)
+
+        def attempt():
+            with self.wait_policy.track(selector, timeout):
+                return (self.locator(selector).first.text_content(timeout=timeout) or "").strip()
+        return self.retry_policy.call(selector, attempt)
+
+    def elem_count(self, selector):
+        """Number of matching elements right now (non-waiting; 0 is a valid answer)."""
+        return self.locator(selector).count()
+
+    def eval_all(self, selector, expression, arg=None):
+        """Evaluate a JS function over all matching elements in one round-trip (non-waiting)."""
+        return self.retry_policy.call(selector, lambda: self.locator(selector).evaluate_all(expression, arg))
+
+    def snapshot(self, fields):
+        """
+        Read a declarative field map in one evaluate() round-trip (non-waiting; see pages/snapshot.py).
+        :param fields: {name: selector | text()/price()/integer()/attribute()/count()/rows() field}
+        :return: Immutable namedtuple record (prices as Decimal, repeated values/rows as tuples)
+        """
+        spec = normalize_spec(fields)
+        # Re-read when a navigation destroys the execution context mid-evaluate
+        raw = self.retry_policy.call(f"snapshot({', '.join(spec)})", lambda: self.page.evaluate(SNAPSHOT_SCRIPT, spec_payload(spec)))
+        return build_record(spec, raw)
+
+    def run_flow(self, flow):
+        """Execute a shared flow generator against this page object's primitives."""
+        return run_flow(self, flow)
+
+    def save_screen_shot(self, filename, mode=None, selector=None):
+        """
+        Capture a screenshot and return the saved file path (waits for the background writer).
+        Files land in the (per-worker) screenshots directory as <test>__<filename>__<seq>.png.
+        :param mode: "viewport", "element" (clipped to selector) or "full"; defaults to config.SCREENSHOT_MODE
+        :return: Stored file path (the first file for duplicate frames)
+        """
+        return self.queue_screen_shot(filename, mode=mode, selector=selector).result()
+
+    def queue_screen_shot(self, filename, mode=None, selector=None):
+        """
+        Non-blocking save_screen_shot: capture and queue the PNG for the background writer
+        (common/screenshots.py); used by the timeout diagnostics.
+        :return: Future resolving to the stored file path
+        """
+        locator = self.locator(selector) if selector is not None else None
+        return capture(self.page, filename, mode=mode, locator=locator)
 
     def open_new_tab(self, selector):
         """Click an element that opens a new tab and switch to it."""
@@ -56,19 +176,38 @@ class BasePage:
             self.elem_click(selector)
         return popup_info.value
 
-    def is_element_exist(self, selector):
-        """Check if element exists in DOM within a short timeout."""
+    def is_element_exist(self, selector, timeout=EXIST_TIMEOUT_MS):
+        """
+        Check if element exists in DOM within a short timeout (ms, default 3000).
+        timeout=0 is a non-waiting count() check for places where absence is a valid outcome
+        (same as elem_count(selector) > 0).
+        """
+        if not timeout:
+            return self.elem_count(selector) > 0
         try:
-            self.page.wait_for_selector(selector, state="attached", timeout=3000)
+            self.locator(selector).first.wait_for(state="attached", timeout=timeout)
             return True
         except TimeoutError:
             return False
 
     def find_elements(self, selector, timeout=None):
-        """Return list of matching elements (empty list if none found)."""
-        timeout = timeout or self.timeout
+        """
+        Return list of matching ElementHandles (empty list if none found).
+        Use locator(selector).all() for re-resolving Locators instead of handles.
+        """
+        timeout = timeout or self.wait_policy.timeout_for(selector, absence_ok=True)
+        locator = self.locator(selector)
         try:
-            self.page.wait_for_selector(selector, timeout=timeout)
-            return self.page.query_selector_all(selector)
+            with self.wait_policy.track(selector, timeout, absence_ok=True):
+                if self.legacy_waits and isinstance(selector, str):
+                    self.page.wait_for_selector(selector, timeout=timeout)
+                else:
+                    locator.first.wait_for(state="visible", timeout=timeout)
+            return locator.element_handles()
         except TimeoutError:
             return []
+
+
+def screenshot_slug(selector):
+    """Build a filesystem-safe name fragment from a selector string or Locator."""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", str(selector)).strip("_")[:120]
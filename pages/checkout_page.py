@@ -1,11 +1,12 @@
 from pages.base_page import BasePage
+from pages.flow import step
+from pages.snapshot import price, rows
 from config.config import FIRSTNAME, LASTNAME, POSTALCODE
 import logging
 
-# Page Object for Checkout Flow (follows POM design pattern)
-# Encapsulates all checkout-related elements and actions
-class CheckoutPage(BasePage):
-    # Initialize logger for CheckoutPage class
+# Locators + checkout flow shared by CheckoutPage and AsyncCheckoutPage (pages/async_pages.py)
+class CheckoutFlow:
+    # Initialize logger for checkout page objects
     logger = logging.getLogger(__name__)
 
     # ------------------------------
@@ -32,56 +33,48 @@ class CheckoutPage(BasePage):
     # Order review page - product name/price elements (final validation)
     product_order_name = ".inventory_item_name"
     product_order_price = ".inventory_item_price"
+    # Order review page - every item row (read in bulk) and the item total
+    order_item_rows = ".cart_item"
+    order_subtotal = ".summary_subtotal_label"
+
+    # Order review snapshot (pages/snapshot.py): all rows + item total in one evaluate()
+    order_summary_fields = {
+        "items": rows(order_item_rows, name=product_order_name, price=price(product_order_price)),
+        "subtotal": price(order_subtotal),
+    }
 
     # ------------------------------
-    # Core Checkout Action (encapsulated)
+    # Core Checkout Flow (shared sync/async steps)
     # ------------------------------
-    def checkout(self, firstname=FIRSTNAME, lastname=LASTNAME, postalcode=POSTALCODE):
+    def checkout_flow(self, firstname=FIRSTNAME, lastname=LASTNAME, postalcode=POSTALCODE):
         """
-        Execute complete checkout flow from cart to order review:
+        Checkout steps from cart to order review:
         1. Navigates to shopping cart page
         2. Validates cart items are loaded
         3. Clicks checkout button to enter personal info step
         4. Enters shipping information (defaults from config, overridable)
         5. Submits info and navigates to order review page
-        6. Captures final product info for validation
-        7. Returns product name/price dict for assertion
+        6. Reads all order rows in one evaluation and validates them against the item total
+        7. Returns first product name/price (+ all rows under "items") for assertion
         
         :param firstname: Optional - custom first name (defaults to config.FIRSTNAME)
         :param lastname: Optional - custom last name (defaults to config.LASTNAME)
         :param postalcode: Optional - custom postal code (defaults to config.POSTALCODE)
-        :return: Dictionary with final product name and price
+        :return: Dictionary with final product name and price, plus "items" (all rows)
         :raises Exception: Propagates errors for test case failure handling
         """
         try:
-            # Step 1: Navigate to shopping cart page
-            self.elem_click(self.shopping_cart_btn)
-            
-            # Step 2: Wait for cart items to load (validation before checkout)
-            self.wait_elem_visible(self.product_cart_name)
-            self.wait_elem_visible(self.product_cart_price)
+            # Steps 1-5: Cart -> checkout info -> order review
+            yield from self.submit_checkout_info_steps(firstname, lastname, postalcode)
             
-            # Step 3: Initiate checkout process
-            self.elem_click(self.checkout_btn)
+            # Step 6: Capture and validate all order rows (one DOM evaluation)
+            order_items = yield from self.read_order_items_steps()
             
-            # Step 4: Enter personal shipping information
-            self.elem_input(self.first_name_field, firstname)
-            self.elem_input(self.last_name_field, lastname)
-            self.elem_input(self.postal_code_field, postalcode)
-            
-            # Step 5: Submit info and proceed to order review
-            self.elem_click(self.continue_btn)
-            
-            # Step 6: Capture final product info for validation
-            self.wait_elem_visible(self.product_order_name)
-            product_final_name = self.page.text_content(self.product_order_name).strip()  # Fixed typo: product_cart_name → product_order_name
-            self.wait_elem_visible(self.product_order_price)
-            product_final_price = self.page.text_content(self.product_order_price).strip()  # Fixed typo: fianl → final
-            
-            # Compile product info for test case assertions
+            # Compile product info for test case assertions (first row + all rows)
             product_info = {
-                "name": product_final_name,
-                "price": product_final_price
+                "name": order_items[0]["name"],
+                "price": order_items[0]["price"],
+                "items": order_items
             }
             
             # Log successful checkout flow
@@ -92,3 +85,76 @@ class CheckoutPage(BasePage):
             # Log detailed failure with context (error level for troubleshooting)
             self.logger.error(f"Checkout flow failed. Error: {str(e)} | Used postal code: {postalcode}")
             raise e  # Re-raise to notify test case of failure
+
+    def submit_checkout_info_steps(self, firstname, lastname, postalcode):
+        """Shared steps 1-5 of the checkout flows (cart page -> order review page)."""
+        # Step 1: Navigate to shopping cart page
+        yield step("elem_click", self.shopping_cart_btn)
+        
+        # Step 2: Wait for cart items to load (validation before checkout)
+        yield step("wait_elem_visible", self.product_cart_name)
+        yield step("wait_elem_visible", self.product_cart_price)
+        
+        # Step 3: Initiate checkout process
+        yield step("elem_click", self.checkout_btn, expected_url=r"/checkout-step-one\.html")
+        
+        # Step 4: Enter personal shipping information
+        yield step("elem_input", self.first_name_field, firstname)
+        yield step("elem_input", self.last_name_field, lastname)
+        yield step("elem_input", self.postal_code_field, postalcode)
+        
+        # Step 5: Submit info and proceed to order review
+        yield step("elem_click", self.continue_btn, expected_url=r"/checkout-step-two\.html")
+
+    def read_order_items_steps(self):
+        """
+        Read all order review rows in one snapshot and validate them:
+        - At least one row, every row with a name and a price
+        - Sum of row prices equals the page's "Item total" (when shown)
+        :return: List of {"name", "price" (Decimal)} dicts in order review order
+        :raises AssertionError: On empty/malformed rows or item total mismatch
+        """
+        yield step("wait_elem_visible", self.product_order_name)
+        summary = yield step("snapshot", self.order_summary_fields)
+
+        if not summary.items:
+            raise AssertionError("Order review shows no items")
+        for item in summary.items:
+            if not item.name or item.price is None:
+                raise AssertionError(f"Malformed order review row: {item}")
+        rows_total = sum(item.price for item in summary.items)
+        if summary.subtotal is not None and rows_total != summary.subtotal:
+            raise AssertionError(f"Order rows add up to ${rows_total}, page shows item total ${summary.subtotal}")
+        return [{"name": item.name, "price": item.price} for item in summary.items]
+
+    def checkout_items_flow(self, firstname=FIRSTNAME, lastname=LASTNAME, postalcode=POSTALCODE):
+        """
+        Checkout steps for carts with any number of items:
+        1. Same cart -> checkout info -> order review steps as checkout_flow
+        2. Reads and validates every order review row in one evaluation
+        
+        :return: List of {"name", "price"} dicts in order review order
+        :raises Exception: Propagates errors for test case failure handling
+        """
+        try:
+            yield from self.submit_checkout_info_steps(firstname, lastname, postalcode)
+            order_items = yield from self.read_order_items_steps()
+
+            self.logger.info(f"Checkout flow completed successfully with {len(order_items)} items")
+            return order_items
+
+        except Exception as e:
+            self.logger.error(f"Checkout flow failed. Error: {str(e)} | Used postal code: {postalcode}")
+            raise e
+
+# Page Object for Checkout Flow (follows POM design pattern)
+# Encapsulates all checkout-related elements and actions
+class CheckoutPage(CheckoutFlow, BasePage):
+
+    def checkout(self, firstname=FIRSTNAME, lastname=LASTNAME, postalcode=POSTALCODE):
+        """Execute complete checkout flow from cart to order review (see checkout_flow)."""
+        return self.run_flow(self.checkout_flow(firstname, lastname, postalcode))
+
+    def checkout_items(self, firstname=FIRSTNAME, lastname=LASTNAME, postalcode=POSTALCODE):
+        """Execute checkout and return every order review row (see checkout_items_flow)."""
+        return self.run_flow(self.checkout_items_flow(firstname, lastname, postalcode))
@@ -1,10 +1,10 @@
 import logging
 from pages.base_page import BasePage
+from pages.flow import step
 
-# Page Object for Cart Clearing Functionality (follows POM design pattern)
-# Encapsulates elements and actions to remove items from shopping cart
-class ClearProductPage(BasePage):
-    # Initialize logger for ClearProductPage class
+# Locators + remove-from-cart flow shared by ClearProductPage and AsyncClearProductPage (pages/async_pages.py)
+class ClearProductFlow:
+    # Initialize logger for cart clearing page objects
     logger = logging.getLogger(__name__)
 
     # ------------------------------
@@ -18,38 +18,49 @@ class ClearProductPage(BasePage):
     shopping_cart_btn = '.shopping_cart_link'
     # Remove button for specific product (Sauce Labs Backpack)
     remove_btn = "#remove-sauce-labs-backpack"
+    # Remove button for any product (format with CatalogItem.slug)
+    remove_product_btn = '[data-test="remove-{slug}"]'
 
     # ------------------------------
-    # Core Cart Clearing Action (encapsulated)
+    # Core Cart Clearing Flow (shared sync/async steps)
     # ------------------------------
-    def clear_product_from_cart(self):  # Renamed: clearproductpage → clear_product_from_cart (PEP 8 compliance)
+    def clear_product_from_cart_flow(self, slug=None):
         """
-        Execute flow to remove specific product (Sauce Labs Backpack) from cart:
+        Steps to remove specific product (Sauce Labs Backpack, or the product with `slug`) from cart:
         1. Opens sidebar menu
         2. Navigates back to inventory page (reset context)
         3. Navigates to shopping cart page
         4. Clicks remove button for target product
         5. Logs success/failure with context
         
+        :param slug: Optional - CatalogItem.slug of the product to remove (defaults to the backpack)
         :raises Exception: Propagates errors for test case failure handling
         """
         try:
             # Step 1: Open sidebar menu
-            self.elem_click(self.menu_btn)
+            yield step("elem_click", self.menu_btn)
             
             # Step 2: Navigate back to inventory page (reset navigation context)
-            self.elem_click(self.all_items_btn)
+            yield step("elem_click", self.all_items_btn)
             
             # Step 3: Navigate to shopping cart page
-            self.elem_click(self.shopping_cart_btn)
+            yield step("elem_click", self.shopping_cart_btn)
             
             # Step 4: Remove target product from cart
-            self.elem_click(self.remove_btn)
+            yield step("elem_click", self.remove_product_btn.format(slug=slug) if slug else self.remove_btn)
             
             # Log successful cart clearing
-            self.logger.info("Successfully removed Sauce Labs Backpack from shopping cart")
+            self.logger.info(f"Successfully removed {slug or 'Sauce Labs Backpack'} from shopping cart")
         
         except Exception as e:
             # Log detailed failure (error level for troubleshooting) + re-raise exception
             self.logger.error(f"Failed to remove product from cart. Error: {str(e)}")
             raise e
+
+# Page Object for Cart Clearing Functionality (follows POM design pattern)
+# Encapsulates elements and actions to remove items from shopping cart
+class ClearProductPage(ClearProductFlow, BasePage):
+
+    def clear_product_from_cart(self, slug=None):  # Renamed: clearproductpage → clear_product_from_cart (PEP 8 compliance)
+        """Execute flow to remove Sauce Labs Backpack (or product `slug`) from cart (see clear_product_from_cart_flow)."""
+        return self.run_flow(self.clear_product_from_cart_flow(slug))
@@ -0,0 +1,45 @@
+from collections import namedtuple
+
+# One page-object primitive call requested by a flow, e.g. step("elem_click", selector)
+Step = namedtuple("Step", ["action", "args", "kwargs"])
+
+
+def step(action, *args, **kwargs):
+    """Build a Step naming a BasePage/AsyncBasePage primitive and its arguments."""
+    return Step(action, args, kwargs)
+
+
+def run_flow(page_object, flow):
+    """
+    Drive a flow generator with a synchronous page object:
+    - Each yielded Step is executed as page_object.<action>(*args, **kwargs)
+    - The primitive's return value is sent back into the generator
+    - Exceptions are thrown back into the generator, so flows keep their own try/except logging
+    :return: The generator's return value
+    """
+    result, error = None, None
+    while True:
+        try:
+            pending = flow.throw(error) if error is not None else flow.send(result)
+        except StopIteration as stop:
+            return stop.value
+        result, error = None, None
+        try:
+            result = getattr(page_object, pending.action)(*pending.args, **pending.kwargs)
+        except Exception as e:
+            error = e
+
+
+async def run_flow_async(page_object, flow):
+    """Drive a flow generator with an asyncio page object (same contract as run_flow)."""
+    result, error = None, None
+    while True:
+        try:
+            pending = flow.throw(error) if error is not None else flow.send(result)
+        except StopIteration as stop:
+            return stop.value
+        result, error = None, None
+        try:
+            result = await getattr(page_object, pending.action)(*pending.args, **pending.kwargs)
+        except Exception as e:
+            error = e
@@ -1,8 +1,10 @@
 from pages.base_page import BasePage
+from pages.flow import step
 from config.config import USERNAME, PASSWORD
 import logging
 
-class LoginPage(BasePage):
+# Locators + login flow shared by LoginPage and AsyncLoginPage (pages/async_pages.py)
+class LoginFlow:
     logger = logging.getLogger(__name__)
 
     # Element locators (CSS selector format for Playwright)
@@ -11,20 +13,26 @@ class LoginPage(BasePage):
     login_btn = "#login-button"
     homepage_title = ".app_logo"
 
-    def login(self, username=USERNAME, password=PASSWORD):
-        """Execute complete login flow and validate success."""
+    def login_flow(self, username=USERNAME, password=PASSWORD):
+        """Login steps: fill credentials, submit, validate and return the homepage title text."""
         try:
-            self.elem_input(self.account_input, username)
-            self.elem_input(self.pwd_input, password)
-            self.elem_click(self.login_btn)
-            
+            yield step("elem_input", self.account_input, username)
+            yield step("elem_input", self.pwd_input, password)
+            yield step("elem_click", self.login_btn, expected_url=r"/inventory\.html")
+
             # Verify login success
-            self.wait_elem_visible(self.homepage_title)
+            yield step("wait_elem_visible", self.homepage_title)
             self.logger.info(f"Login successful for username: {username}")
-            
+
             # Get and return element text for assertion
-            return self.page.text_content(self.homepage_title).strip()
+            return (yield step("elem_text", self.homepage_title))
 
         except Exception as e:
             self.logger.error(f"Login failed for username: {username}. Error: {str(e)}")
             raise e
+
+class LoginPage(LoginFlow, BasePage):
+
+    def login(self, username=USERNAME, password=PASSWORD):
+        """Execute complete login flow and validate success."""
+        return self.run_flow(self.login_flow(username, password))
@@ -0,0 +1,141 @@
+import re
+from collections import namedtuple
+from decimal import Decimal, InvalidOperation
+
+# One field of a snapshot spec: what to read (kind) from which selector
+# - kind: "text" | "price" | "int" | "attr" | "count" | "rows"
+# - many: read every match (tuple) instead of the first one
+# - row: nested spec read relative to each match (kind="rows")
+Field = namedtuple("Field", ["selector", "kind", "many", "attr", "row"])
+
+
+def text(selector, many=False):
+    """Stripped textContent of the first match (None if absent), or of every match."""
+    return Field(selector, "text", many, None, None)
+
+
+def price(selector, many=False):
+    """Money value as Decimal ("$29.99", "Item total: $29.99" -> Decimal("29.99"))."""
+    return Field(selector, "price", many, None, None)
+
+
+def integer(selector, many=False):
+    """Integer value of the text (e.g. the cart badge); None if absent."""
+    return Field(selector, "int", many, None, None)
+
+
+def attribute(selector, name, many=False):
+    """Attribute value of the first match (None if absent), or of every match."""
+    return Field(selector, "attr", many, name, None)
+
+
+def count(selector):
+    """Number of matches (0 is a valid answer)."""
+    return Field(selector, "count", True, None, None)
+
+
+def rows(selector, **fields):
+    """One record per match, with fields read relative to that element."""
+    return Field(selector, "rows", True, None, {name: _as_field(value) for name, value in fields.items()})
+
+
+# Reads the whole spec in one evaluate. Selectors are CSS, or XPath when they start with
+# "//" / "xpath=" (Playwright engine syntax such as text= or >> is not supported here).
+SNAPSHOT_SCRIPT = """
+spec => {
+    const query = (root, selector, all) => {
+        let xpath = selector.startsWith('xpath=') ? selector.slice(6) : (selector.startsWith('//') ? selector : null);
+        if (xpath !== null) {
+            if (root !== document && xpath.startsWith('/')) xpath = '.' + xpath;
+            const result = document.evaluate(xpath, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            const nodes = [];
+            for (let i = 0; i < (all ? result.snapshotLength : Math.min(1, result.snapshotLength)); i++) nodes.push(result.snapshotItem(i));
+            return nodes;
+        }
+        const css = selector.startsWith('css=') ? selector.slice(4) : selector;
+        return all ? Array.from(root.querySelectorAll(css)) : [root.querySelector(css)].filter(Boolean);
+    };
+    const read = (root, field) => {
+        const nodes = query(root, field.selector, field.many);
+        if (field.kind === 'count') return nodes.length;
+        if (field.kind === 'rows') return nodes.map(node => extract(node, field.row));
+        const value = node => field.kind === 'attr' ? node.getAttribute(field.attr) : node.textContent.trim();
+        return field.many ? nodes.map(value) : (nodes.length ? value(nodes[0]) : null);
+    };
+    const extract = (root, fields) => {
+        const record = {};
+        for (const name of Object.keys(fields)) record[name] = read(root, fields[name]);
+        return record;
+    };
+    return extract(document, spec);
+}
+"""
+
+
+def parse_price(value):
+    """Decimal amount in a price text ("$1,029.99" -> Decimal("1029.99")); None if there is none."""
+    match = re.search(r"-?\d[\d,]*(?:\.\d+)?", value or "")
+    if not match:
+        return None
+    try:
+        return Decimal(match.group(0).replace(",", ""))
+    except InvalidOperation:
+        return None
+
+
+def _as_field(value):
+    return value if isinstance(value, Field) else text(value)
+
+
+def normalize_spec(fields):
+    """Spec map with plain selector strings expanded to text fields."""
+    return {name: _as_field(value) for name, value in fields.items()}
+
+
+def spec_payload(spec):
+    """JSON-serialisable form of a normalized spec, passed to SNAPSHOT_SCRIPT."""
+    return {
+        name: {
+            "selector": field.selector, "kind": field.kind, "many": field.many, "attr": field.attr,
+            "row": spec_payload(field.row) if field.row else None,
+        }
+        for name, field in spec.items()
+    }
+
+
+_record_types = {}
+
+
+def _record_type(names):
+    record_type = _record_types.get(names)
+    if record_type is None:
+        record_type = _record_types[names] = namedtuple("Snapshot", names)
+    return record_type
+
+
+def _scalar(kind, value):
+    if value is None:
+        return None
+    if kind == "price":
+        return parse_price(value)
+    if kind == "int":
+        digits = re.search(r"-?\d+", value)
+        return int(digits.group(0)) if digits else None
+    return value
+
+
+def build_record(spec, raw):
+    """Convert raw evaluate() output into an immutable namedtuple (lists become tuples)."""
+    values = []
+    for name, field in spec.items():
+        value = raw[name]
+        if field.kind == "rows":
+            value = tuple(build_record(field.row, row) for row in value)
+        elif field.kind == "count":
+            pass
+        elif field.many:
+            value = tuple(_scalar(field.kind, item) for item in value)
+        else:
+            value = _scalar(field.kind, value)
+        values.append(value)
+    return _record_type(tuple(spec))(*values)
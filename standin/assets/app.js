@@ -0,0 +1,268 @@
+/* Client-side behaviour of the saucedemo stand-in.
+ * Cart contents live in localStorage["cart-contents"] (same contract as the public site);
+ * every change is mirrored to the server's per-session store via POST /api/cart.
+ */
+(function () {
+  "use strict";
+
+  var CART_KEY = "cart-contents";
+  var TAB_KEY = "standin-tab";
+  var SESSION_COOKIE = "session-username";
+  var SESSION_MINUTES = 10;
+  var CATALOG = window.__STANDIN__.catalog;
+  var USERS = window.__STANDIN__.users;
+  var LOCKED_OUT = window.__STANDIN__.lockedOut;
+  var PASSWORD = window.__STANDIN__.password;
+  var TAX_RATE_PERCENT = window.__STANDIN__.taxRatePercent;
+
+  function readCart() {
+    try {
+      var items = JSON.parse(localStorage.getItem(CART_KEY) || "[]");
+      return Array.isArray(items) ? items.filter(function (id) { return CATALOG[id]; }) : [];
+    } catch (e) {
+      return [];
+    }
+  }
+
+  function tabId() {
+    var id = sessionStorage.getItem(TAB_KEY);
+    if (!id) {
+      id = Math.random().toString(36).slice(2) + Date.now().toString(36);
+      sessionStorage.setItem(TAB_KEY, id);
+    }
+    return id;
+  }
+
+  function mirror(items) {
+    try {
+      fetch("/api/cart", {
+        method: "POST",
+        keepalive: true,
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ tab: tabId(), items: items })
+      });
+    } catch (e) {
+      /* Mirroring is best-effort; localStorage stays the source of truth */
+    }
+  }
+
+  function writeCart(items) {
+    localStorage.setItem(CART_KEY, JSON.stringify(items));
+    mirror(items);
+    render();
+  }
+
+  function addToCart(id) {
+    var items = readCart();
+    if (items.indexOf(id) < 0) {
+      items.push(id);
+    }
+    writeCart(items);
+  }
+
+  function removeFromCart(id) {
+    writeCart(readCart().filter(function (item) { return item !== id; }));
+  }
+
+  function formatPrice(cents) {
+    return "$" + (cents / 100).toFixed(2);
+  }
+
+  function element(tag, attrs, text) {
+    var node = document.createElement(tag);
+    Object.keys(attrs || {}).forEach(function (key) { node.setAttribute(key, attrs[key]); });
+    if (text !== undefined) {
+      node.textContent = text;
+    }
+    return node;
+  }
+
+  function renderBadge(items) {
+    var link = document.querySelector(".shopping_cart_link");
+    if (!link) {
+      return;
+    }
+    var badge = link.querySelector(".shopping_cart_badge");
+    if (!items.length) {
+      if (badge) {
+        badge.remove();
+      }
+      return;
+    }
+    if (!badge) {
+      badge = element("span", { "class": "shopping_cart_badge", "data-test": "shopping-cart-badge" });
+      link.appendChild(badge);
+    }
+    badge.textContent = String(items.length);
+  }
+
+  function renderToggleButtons(items) {
+    var buttons = document.querySelectorAll("button[data-item-id]");
+    Array.prototype.forEach.call(buttons, function (button) {
+      var id = Number(button.getAttribute("data-item-id"));
+      var slug = CATALOG[id].slug;
+      var detail = button.hasAttribute("data-detail");
+      var inCart = items.indexOf(id) >= 0;
+      var name = inCart ? (detail ? "remove" : "remove-" + slug) : (detail ? "add-to-cart" : "add-to-cart-" + slug);
+      button.id = name;
+      button.setAttribute("name", name);
+      button.setAttribute("data-test", name);
+      button.className = "btn " + (inCart ? "btn_secondary" : "btn_primary") + " btn_small btn_inventory";
+      button.textContent = inCart ? "Remove" : "Add to cart";
+    });
+  }
+
+  function cartRow(id, withRemove) {
+    var product = CATALOG[id];
+    var row = element("div", { "class": "cart_item", "data-test": "inventory-item" });
+    row.appendChild(element("div", { "class": "cart_quantity", "data-test": "item-quantity" }, "1"));
+    var label = element("div", { "class": "cart_item_label" });
+    var link = element("a", { "href": "/inventory-item.html?id=" + id, "id": "item_" + id + "_title_link" });
+    link.appendChild(element("div", { "class": "inventory_item_name", "data-test": "inventory-item-name" }, product.name));
+    label.appendChild(link);
+    var pricebar = element("div", { "class": "item_pricebar" });
+    pricebar.appendChild(element("div", { "class": "inventory_item_price", "data-test": "inventory-item-price" }, formatPrice(product.cents)));
+    if (withRemove) {
+      var removeId = "remove-" + product.slug;
+      pricebar.appendChild(element("button", {
+        "class": "btn btn_secondary btn_small cart_button", "id": removeId, "name": removeId,
+        "data-test": removeId, "data-remove-id": String(id)
+      }, "Remove"));
+    }
+    label.appendChild(pricebar);
+    row.appendChild(label);
+    return row;
+  }
+
+  function renderCartList(items, withRemove) {
+    var list = document.querySelector(".cart_list");
+    if (!list) {
+      return;
+    }
+    Array.prototype.slice.call(list.querySelectorAll(".cart_item")).forEach(function (row) { row.remove(); });
+    items.forEach(function (id) { list.appendChild(cartRow(id, withRemove)); });
+  }
+
+  function renderSummary(items) {
+    var subtotal = document.querySelector(".summary_subtotal_label");
+    if (!subtotal) {
+      return;
+    }
+    var cents = items.reduce(function (sum, id) { return sum + CATALOG[id].cents; }, 0);
+    var tax = Math.round(cents * TAX_RATE_PERCENT / 100);
+    subtotal.textContent = "Item total: " + formatPrice(cents);
+    document.querySelector(".summary_tax_label").textContent = "Tax: " + formatPrice(tax);
+    document.querySelector(".summary_total_label").textContent = "Total: " + formatPrice(cents + tax);
+  }
+
+  function render() {
+    var items = readCart();
+    var page = document.body.getAttribute("data-page");
+    renderBadge(items);
+    renderToggleButtons(items);
+    if (page === "cart") {
+      renderCartList(items, true);
+    } else if (page === "overview") {
+      renderCartList(items, false);
+      renderSummary(items);
+    }
+  }
+
+  function showError(message) {
+    var container = document.querySelector(".error-message-container");
+    container.innerHTML = "";
+    container.classList.add("error");
+    container.appendChild(element("h3", { "data-test": "error" }, message));
+  }
+
+  function setSessionCookie(username) {
+    var expires = new Date(Date.now() + SESSION_MINUTES * 60 * 1000).toUTCString();
+    document.cookie = SESSION_COOKIE + "=" + username + "; expires=" + expires + "; path=/";
+  }
+
+  function bindLogin() {
+    var form = document.getElementById("login_form");
+    var denied = new URLSearchParams(window.location.search).get("denied");
+    if (denied) {
+      showError("Epic sadface: You can only access '" + denied + "' when you are logged in.");
+    }
+    form.addEventListener("submit", function (event) {
+      event.preventDefault();
+      var username = document.getElementById("user-name").value;
+      var password = document.getElementById("password").value;
+      if (!username) {
+        showError("Epic sadface: Username is required");
+      } else if (!password) {
+        showError("Epic sadface: Password is required");
+      } else if (USERS.indexOf(username) < 0 || password !== PASSWORD) {
+        showError("Epic sadface: Username and password do not match any user in this service");
+      } else if (LOCKED_OUT.indexOf(username) >= 0) {
+        showError("Epic sadface: Sorry, this user has been locked out.");
+      } else {
+        setSessionCookie(username);
+        window.location.href = "/inventory.html";
+      }
+    });
+  }
+
+  function bindCheckoutInfo() {
+    document.getElementById("checkout_info_form").addEventListener("submit", function (event) {
+      event.preventDefault();
+      var fields = [["first-name", "First Name"], ["last-name", "Last Name"], ["postal-code", "Postal Code"]];
+      for (var i = 0; i < fields.length; i++) {
+        if (!document.getElementById(fields[i][0]).value) {
+          showError("Error: " + fields[i][1] + " is required");
+          return;
+        }
+      }
+      window.location.href = "/checkout-step-two.html";
+    });
+  }
+
+  function bindClicks() {
+    document.addEventListener("click", function (event) {
+      var target = event.target.closest("button, a");
+      if (!target) {
+        return;
+      }
+      if (target.hasAttribute("data-item-id")) {
+        var id = Number(target.getAttribute("data-item-id"));
+        if (readCart().indexOf(id) >= 0) {
+          removeFromCart(id);
+        } else {
+          addToCart(id);
+        }
+      } else if (target.hasAttribute("data-remove-id")) {
+        removeFromCart(Number(target.getAttribute("data-remove-id")));
+      } else if (target.hasAttribute("data-href")) {
+        window.location.href = target.getAttribute("data-href");
+      } else if (target.id === "react-burger-menu-btn") {
+        document.querySelector(".bm-menu-wrap").hidden = false;
+      } else if (target.id === "react-burger-cross-btn") {
+        document.querySelector(".bm-menu-wrap").hidden = true;
+      } else if (target.id === "reset_sidebar_link") {
+        event.preventDefault();
+        writeCart([]);
+      } else if (target.id === "logout_sidebar_link") {
+        event.preventDefault();
+        document.cookie = SESSION_COOKIE + "=; expires=Thu, 01 Jan 1970 00:00:00 GMT; path=/";
+        window.location.href = "/";
+      } else if (target.id === "finish") {
+        localStorage.setItem(CART_KEY, "[]");
+        mirror([]);
+        window.location.href = "/checkout-complete.html";
+      }
+    });
+  }
+
+  var page = document.body.getAttribute("data-page");
+  if (page === "login") {
+    bindLogin();
+    return;
+  }
+  if (page === "checkout-info") {
+    bindCheckoutInfo();
+  }
+  bindClicks();
+  render();
+})();
@@ -0,0 +1,37 @@
+# standin/catalog.py
+"""Product catalogue and user accounts served by the local saucedemo stand-in."""
+from collections import namedtuple
+
+# id/slug/name/price mirror the public site so locators and assertions carry over unchanged
+Product = namedtuple("Product", ["id", "slug", "name", "price", "description"])
+
+PRODUCTS = [
+    Product(4, "sauce-labs-backpack", "Sauce Labs Backpack", "29.99",
+            "carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising style with unequaled laptop and tablet protection."),
+    Product(0, "sauce-labs-bike-light", "Sauce Labs Bike Light", "9.99",
+            "A red light isn't the desired state in testing but it sure helps when riding your bike at night. Water-resistant with 3 lighting modes, 1 AAA battery included."),
+    Product(1, "sauce-labs-bolt-t-shirt", "Sauce Labs Bolt T-Shirt", "15.99",
+            "Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, 100% ringspun combed cotton, heather gray with red bolt."),
+    Product(5, "sauce-labs-fleece-jacket", "Sauce Labs Fleece Jacket", "49.99",
+            "It's not every day that you come across a midweight quarter-zip fleece jacket capable of handling everything from a relaxing day outdoors to a busy day at the office."),
+    Product(2, "sauce-labs-onesie", "Sauce Labs Onesie", "7.99",
+            "Rib snap infant onesie for the junior automation engineer in development. Reinforced 3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel."),
+    Product(3, "test.allthethings()-t-shirt-(red)", "Test.allTheThings() T-Shirt (Red)", "15.99",
+            "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to automate a few tests. Super-soft and comfy ringspun combed cotton."),
+]
+
+PRODUCTS_BY_ID = {product.id: product for product in PRODUCTS}
+
+# Accepted passwords and per-user login errors (same contract as the public site)
+PASSWORD = "secret_sauce"
+USERS = [
+    "standard_user",
+    "locked_out_user",
+    "problem_user",
+    "performance_glitch_user",
+    "error_user",
+    "visual_user",
+]
+LOCKED_OUT_USERS = ["locked_out_user"]
+
+TAX_RATE = "0.08"
@@ -0,0 +1,236 @@
+# standin/pages.py
+"""
+Pre-rendered documents of the saucedemo stand-in.
+
+Every document is built once at import time; cart-dependent parts (badge, add/remove
+buttons, cart and overview rows) are rendered client-side from localStorage by
+assets/app.js, exactly like the public site keeps its cart client-side.
+"""
+import os
+import json
+from decimal import Decimal
+from html import escape
+from standin.catalog import PRODUCTS, PRODUCTS_BY_ID, USERS, LOCKED_OUT_USERS, PASSWORD, TAX_RATE
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+# Distinct colours for the generated product images
+IMAGE_COLOURS = ["#e2231a", "#3ddc91", "#132322", "#18583a", "#f5bf42", "#484c55"]
+
+
+def _client_config():
+    """Inline bootstrap data for app.js (catalogue, accepted users, tax rate)."""
+    return json.dumps({
+        "catalog": {
+            product.id: {"slug": product.slug, "name": product.name, "cents": int(Decimal(product.price) * 100)}
+            for product in PRODUCTS
+        },
+        "users": USERS,
+        "lockedOut": LOCKED_OUT_USERS,
+        "password": PASSWORD,
+        "taxRatePercent": int(Decimal(TAX_RATE) * 100),
+    })
+
+
+def _document(page, title, body):
+    return (
+        "<!DOCTYPE html><html lang=\"en\"><head><meta charset=\"utf-8\">"
+        f"<title>{escape(title)}</title>"
+        "<link rel=\"stylesheet\" href=\"/static/css/style.css\"></head>"
+        f"<body data-page=\"{page}\"><div id=\"root\">{body}</div>"
+        f"<script>window.__STANDIN__ = {_client_config()};</script>"
+        "<script src=\"/static/js/app.js\"></script></body></html>"
+    ).encode("utf-8")
+
+
+def _header(secondary_title):
+    return (
+        "<div id=\"page_wrapper\" class=\"page_wrapper\"><div id=\"contents_wrapper\">"
+        "<div class=\"primary_header\" data-test=\"primary-header\">"
+        "<div id=\"menu_button_container\"><div class=\"bm-burger-button\">"
+        "<button type=\"button\" id=\"react-burger-menu-btn\">Open Menu</button></div>"
+        "<div class=\"bm-menu-wrap\" hidden><nav class=\"bm-item-list\">"
+        "<a id=\"inventory_sidebar_link\" class=\"bm-item menu-item\" data-test=\"inventory-sidebar-link\" href=\"/inventory.html\">All Items</a>"
+        "<a id=\"about_sidebar_link\" class=\"bm-item menu-item\" data-test=\"about-sidebar-link\" href=\"https://saucelabs.com/\">About</a>"
+        "<a id=\"logout_sidebar_link\" class=\"bm-item menu-item\" data-test=\"logout-sidebar-link\" href=\"/\">Logout</a>"
+        "<a id=\"reset_sidebar_link\" class=\"bm-item menu-item\" data-test=\"reset-sidebar-link\" href=\"#\">Reset App State</a>"
+        "</nav><button type=\"button\" id=\"react-burger-cross-btn\">Close Menu</button></div></div>"
+        "<div class=\"header_label\"><div class=\"app_logo\">Swag Labs</div></div>"
+        "<div id=\"shopping_cart_container\" class=\"shopping_cart_container\">"
+        "<a class=\"shopping_cart_link\" data-test=\"shopping-cart-link\" href=\"/cart.html\"></a></div>"
+        "</div>"
+        f"<div class=\"header_secondary_container\"><span class=\"title\" data-test=\"title\">{escape(secondary_title)}</span></div>"
+    )
+
+
+_FOOTER = "</div></div>"
+
+
+def _toggle_button(product, detail=False):
+    """Add-to-cart button; app.js flips id/label to the remove variant when the item is in the cart."""
+    name = "add-to-cart" if detail else f"add-to-cart-{product.slug}"
+    detail_attr = " data-detail" if detail else ""
+    return (
+        f"<button class=\"btn btn_primary btn_small btn_inventory\" id=\"{escape(name)}\" name=\"{escape(name)}\" "
+        f"data-test=\"{escape(name)}\" data-item-id=\"{product.id}\"{detail_attr}>Add to cart</button>"
+    )
+
+
+def login_page():
+    body = (
+        "<div class=\"login_logo\">Swag Labs</div>"
+        "<div class=\"login_wrapper\"><div class=\"login_wrapper-inner\"><div id=\"login_button_container\" class=\"form_column\">"
+        "<div class=\"login-box\"><form id=\"login_form\">"
+        "<div class=\"form_group\"><input class=\"input_error form_input\" placeholder=\"Username\" type=\"text\" "
+        "data-test=\"username\" id=\"user-name\" name=\"user-name\" autocorrect=\"off\" autocapitalize=\"none\"></div>"
+        "<div class=\"form_group\"><input class=\"input_error form_input\" placeholder=\"Password\" type=\"password\" "
+        "data-test=\"password\" id=\"password\" name=\"password\" autocorrect=\"off\" autocapitalize=\"none\"></div>"
+        "<div class=\"error-message-container\"></div>"
+        "<input type=\"submit\" class=\"submit-button btn_action\" data-test=\"login-button\" id=\"login-button\" name=\"login-button\" value=\"Login\">"
+        "</form></div></div></div></div>"
+    )
+    return _document("login", "Swag Labs", body)
+
+
+def inventory_page():
+    items = []
+    for product in PRODUCTS:
+        link = f"/inventory-item.html?id={product.id}"
+        items.append(
+            "<div class=\"inventory_item\" data-test=\"inventory-item\">"
+            f"<div class=\"inventory_item_img\"><a href=\"{link}\" id=\"item_{product.id}_img_link\">"
+            f"<img alt=\"{escape(product.name)}\" class=\"inventory_item_img\" src=\"/static/media/{escape(product.slug)}.svg\"></a></div>"
+            "<div class=\"inventory_item_description\" data-test=\"inventory-item-description\"><div class=\"inventory_item_label\">"
+            f"<a href=\"{link}\" id=\"item_{product.id}_title_link\" data-test=\"item-{product.id}-title-link\">"
+            f"<div class=\"inventory_item_name \" data-test=\"inventory-item-name\">{escape(product.name)}</div></a>"
+            f"<div class=\"inventory_item_desc\" data-test=\"inventory-item-desc\">{escape(product.description)}</div></div>"
+            f"<div class=\"pricebar\"><div class=\"inventory_item_price\" data-test=\"inventory-item-price\">${product.price}</div>"
+            f"{_toggle_button(product)}</div></div></div>"
+        )
+    body = (
+        _header("Products")
+        + "<div id=\"inventory_container\" class=\"inventory_container\" data-test=\"inventory-container\">"
+        + "<div class=\"inventory_list\" data-test=\"inventory-list\">" + "".join(items) + "</div></div>"
+        + _FOOTER
+    )
+    return _document("inventory", "Swag Labs", body)
+
+
+def inventory_item_page(product):
+    body = (
+        _header("")
+        + "<div class=\"inventory_details\" data-test=\"inventory-container\">"
+        + "<button class=\"btn btn_secondary back btn_large inventory_details_back_button\" id=\"back-to-products\" "
+        + "data-test=\"back-to-products\" data-href=\"/inventory.html\">Back to products</button>"
+        + "<div class=\"inventory_details_container\">"
+        + f"<img alt=\"{escape(product.name)}\" class=\"inventory_details_img\" src=\"/static/media/{escape(product.slug)}.svg\">"
+        + "<div class=\"inventory_details_desc_container\">"
+        + f"<div class=\"inventory_details_name large_size\" data-test=\"inventory-item-name\">{escape(product.name)}</div>"
+        + f"<div class=\"inventory_details_desc large_size\" data-test=\"inventory-item-desc\">{escape(product.description)}</div>"
+        + f"<div class=\"inventory_details_price\" data-test=\"inventory-item-price\">${product.price}</div>"
+        + _toggle_button(product, detail=True)
+        + "</div></div></div>"
+        + _FOOTER
+    )
+    return _document("inventory-item", "Swag Labs", body)
+
+
+def cart_page():
+    body = (
+        _header("Your Cart")
+        + "<div id=\"cart_contents_container\" class=\"cart_contents_container\"><div class=\"cart_list\" data-test=\"cart-list\">"
+        + "<div class=\"cart_quantity_label\">QTY</div><div class=\"cart_desc_label\">Description</div></div>"
+        + "<div class=\"cart_footer\">"
+        + "<button class=\"btn btn_secondary back btn_medium\" id=\"continue-shopping\" data-test=\"continue-shopping\" data-href=\"/inventory.html\">Continue Shopping</button>"
+        + "<button class=\"btn btn_action btn_medium checkout_button\" id=\"checkout\" data-test=\"checkout\" data-href=\"/checkout-step-one.html\">Checkout</button>"
+        + "</div></div>"
+        + _FOOTER
+    )
+    return _document("cart", "Swag Labs", body)
+
+
+def checkout_info_page():
+    body = (
+        _header("Checkout: Your Information")
+        + "<div id=\"checkout_info_container\" class=\"checkout_info_container\"><form id=\"checkout_info_form\"><div class=\"checkout_info\">"
+        + "<div class=\"form_group\"><input class=\"input_error form_input\" placeholder=\"First Name\" type=\"text\" data-test=\"firstName\" id=\"first-name\" name=\"firstName\"></div>"
+        + "<div class=\"form_group\"><input class=\"input_error form_input\" placeholder=\"Last Name\" type=\"text\" data-test=\"lastName\" id=\"last-name\" name=\"lastName\"></div>"
+        + "<div class=\"form_group\"><input class=\"input_error form_input\" placeholder=\"Zip/Postal Code\" type=\"text\" data-test=\"postalCode\" id=\"postal-code\" name=\"postalCode\"></div>"
+        + "<div class=\"error-message-container\"></div></div>"
+        + "<div class=\"checkout_buttons\">"
+        + "<button class=\"btn btn_secondary back btn_medium cart_cancel_link\" type=\"button\" id=\"cancel\" data-test=\"cancel\" data-href=\"/cart.html\">Cancel</button>"
+        + "<input type=\"submit\" class=\"submit-button btn btn_primary cart_button btn_action\" data-test=\"continue\" id=\"continue\" name=\"continue\" value=\"Continue\">"
+        + "</div></form></div>"
+        + _FOOTER
+    )
+    return _document("checkout-info", "Swag Labs", body)
+
+
+def checkout_overview_page():
+    body = (
+        _header("Checkout: Overview")
+        + "<div id=\"checkout_summary_container\" class=\"checkout_summary_container\">"
+        + "<div class=\"cart_list\" data-test=\"cart-list\"><div class=\"cart_quantity_label\">QTY</div><div class=\"cart_desc_label\">Description</div></div>"
+        + "<div class=\"summary_info\">"
+        + "<div class=\"summary_subtotal_label\" data-test=\"subtotal-label\"></div>"
+        + "<div class=\"summary_tax_label\" data-test=\"tax-label\"></div>"
+        + "<div class=\"summary_info_label summary_total_label\" data-test=\"total-label\"></div>"
+        + "<div class=\"cart_footer\">"
+        + "<button class=\"btn btn_secondary back btn_medium cart_cancel_link\" id=\"cancel\" data-test=\"cancel\" data-href=\"/inventory.html\">Cancel</button>"
+        + "<button class=\"btn btn_action btn_medium cart_button\" id=\"finish\" data-test=\"finish\">Finish</button>"
+        + "</div></div></div>"
+        + _FOOTER
+    )
+    return _document("overview", "Swag Labs", body)
+
+
+def checkout_complete_page():
+    body = (
+        _header("Checkout: Complete!")
+        + "<div id=\"checkout_complete_container\" class=\"checkout_complete_container\" data-test=\"checkout-complete-container\">"
+        + "<h2 class=\"complete-header\" data-test=\"complete-header\">Thank you for your order!</h2>"
+        + "<div class=\"complete-text\" data-test=\"complete-text\">Your order has been dispatched, and will arrive just as fast as the pony can get there!</div>"
+        + "<button class=\"btn btn_primary btn_small\" id=\"back-to-products\" data-test=\"back-to-products\" data-href=\"/inventory.html\">Back Home</button>"
+        + "</div>"
+        + _FOOTER
+    )
+    return _document("complete", "Swag Labs", body)
+
+
+def product_image(index, product):
+    """Small generated SVG standing in for the product photo."""
+    colour = IMAGE_COLOURS[index % len(IMAGE_COLOURS)]
+    return (
+        "<svg xmlns=\"http://www.w3.org/2000/svg\" width=\"240\" height=\"240\" viewBox=\"0 0 240 240\">"
+        f"<rect width=\"240\" height=\"240\" fill=\"{colour}\"/>"
+        f"<text x=\"120\" y=\"128\" font-size=\"14\" text-anchor=\"middle\" fill=\"#fff\">{escape(product.name)}</text></svg>"
+    ).encode("utf-8")
+
+
+def read_asset(name):
+    with open(os.path.join(ASSETS_DIR, name), "rb") as f:
+        return f.read()
+
+
+# Documents reachable without a session (everything else redirects to the login page)
+PUBLIC_DOCUMENTS = {"/": login_page(), "/index.html": login_page()}
+
+# Documents that require the session-username cookie
+SESSION_DOCUMENTS = {
+    "/inventory.html": inventory_page(),
+    "/cart.html": cart_page(),
+    "/checkout-step-one.html": checkout_info_page(),
+    "/checkout-step-two.html": checkout_overview_page(),
+    "/checkout-complete.html": checkout_complete_page(),
+}
+
+# Product detail documents, keyed by the ?id= query value
+ITEM_DOCUMENTS = {str(product_id): inventory_item_page(product) for product_id, product in PRODUCTS_BY_ID.items()}
+
+# Static assets: path -> (content type, body)
+STATIC_ASSETS = {
+    "/static/css/style.css": ("text/css; charset=utf-8", read_asset("style.css")),
+    "/static/js/app.js": ("application/javascript; charset=utf-8", read_asset("app.js")),
+}
+for _index, _product in enumerate(PRODUCTS):
+    STATIC_ASSETS[f"/static/media/{_product.slug}.svg"] = ("image/svg+xml", product_image(_index, _product))
@@ -0,0 +1,302 @@
+# standin/server.py
+"""
+Asyncio HTTP server standing in for https://www.saucedemo.com/.
+
+- Serves pre-rendered documents and static assets (standin/pages.py) over HTTP/1.1 keep-alive
+- Guards session pages on the session-username cookie, like the public site
+- Mirrors each tab's cart in memory (POST/GET /api/cart) for inspection and load accounting
+- Single event loop, no per-request rendering: sustains hundreds of concurrent browser contexts
+
+Usage: python -m standin.server [--host 127.0.0.1] [--port 8765]
+"""
+import sys
+import json
+import time
+import hashlib
+import asyncio
+import argparse
+import logging
+import socket
+import threading
+from collections import OrderedDict
+from urllib.parse import urlsplit, unquote, parse_qs
+from standin.catalog import PRODUCTS_BY_ID, USERS
+from standin import pages
+
+# Initialize logger for stand-in server module
+logger = logging.getLogger(__name__)
+
+SESSION_COOKIE = "session-username"
+
+# Upper bounds protecting the server under load tests
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 64 * 1024
+MAX_SESSIONS = 20000
+KEEP_ALIVE_TIMEOUT = 30
+
+REASONS = {200: "OK", 204: "No Content", 302: "Found", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 413: "Payload Too Large"}
+
+# Strong validators of the static assets (conditional GETs answer 304 while the content is unchanged)
+ASSET_ETAGS = {path: f'"{hashlib.sha256(payload).hexdigest()[:16]}"' for path, (_, payload) in pages.STATIC_ASSETS.items()}
+
+
+class CartStore:
+    """In-memory cart mirror per (username, tab) session with LRU eviction."""
+
+    def __init__(self, max_sessions=MAX_SESSIONS):
+        self.max_sessions = max_sessions
+        self._carts = OrderedDict()
+
+    def set(self, username, tab, items):
+        key = (username, tab)
+        self._carts[key] = [item for item in items if item in PRODUCTS_BY_ID]
+        self._carts.move_to_end(key)
+        while len(self._carts) > self.max_sessions:
+            self._carts.popitem(last=False)
+
+    def get(self, username, tab):
+        return self._carts.get((username, tab), [])
+
+    def __len__(self):
+        return len(self._carts)
+
+
+class StandinServer:
+    """Saucedemo stand-in bound to host:port; run with serve_forever() or start_in_thread()."""
+
+    def __init__(self, host="127.0.0.1", port=8765):
+        self.host = host
+        self.port = port
+        self.carts = CartStore()
+        self.requests_served = 0
+        self.open_connections = 0
+        self.started_at = None
+        self._server = None
+        self._loop = None
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}/"
+
+    async def start(self):
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, backlog=2048, reuse_address=True
+        )
+        # Port 0 means "pick a free port"; report the real one
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.started_at = time.time()
+        logger.info(f"Saucedemo stand-in listening on {self.url}")
+
+    async def serve_forever(self):
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def start_in_thread(self):
+        """Start the server on a daemon thread with its own event loop; returns once it is listening."""
+        ready = threading.Event()
+        errors = []
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            try:
+                self._loop.run_until_complete(self.start())
+            except OSError as e:
+                errors.append(e)
+                ready.set()
+                return
+            ready.set()
+            self._loop.run_forever()
+            self._server.close()
+            self._loop.run_until_complete(self._server.wait_closed())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="saucedemo-standin", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if errors:
+            raise errors[0]
+        return self
+
+    def stop(self):
+        """Stop a server started with start_in_thread()."""
+        if self._loop and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+
+    # ------------------------------
+    # HTTP handling
+    # ------------------------------
+    async def _handle_connection(self, reader, writer):
+        self.open_connections += 1
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    return
+                except asyncio.LimitOverrunError:
+                    await self._send(writer, 400, b"Request header too large", keep_alive=False)
+                    return
+                if len(head) > MAX_HEADER_BYTES:
+                    await self._send(writer, 400, b"Request header too large", keep_alive=False)
+                    return
+
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    await self._send(writer, 400, b"Malformed request line", keep_alive=False)
+                    return
+                headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                raw_length = headers.get("content-length") or "0"
+                # Digits only: int() would also take "-1", " 1_0" or non-ASCII digits
+                if not (raw_length.isascii() and raw_length.isdigit()):
+                    await self._send(writer, 400, b"Invalid Content-Length", keep_alive=False)
+                    return
+                length = int(raw_length)
+                if length > MAX_BODY_BYTES:
+                    await self._send(writer, 413, b"Payload too large", keep_alive=False)
+                    return
+                body = await reader.readexactly(length) if length else b""
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                status, response_headers, payload = self._route(method, target, headers, body)
+                self.requests_served += 1
+                await self._send(writer, status, payload, response_headers, keep_alive, head_only=method == "HEAD")
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            return
+        finally:
+            self.open_connections -= 1
+            writer.close()
+
+    @staticmethod
+    async def _send(writer, status, payload, headers=None, keep_alive=True, head_only=False):
+        lines = [f"HTTP/1.1 {status} {REASONS.get(status, 'OK')}", f"Content-Length: {len(payload)}",
+                 f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        for name, value in (headers or {}).items():
+            lines.append(f"{name}: {value}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (b"" if head_only else payload))
+        await writer.drain()
+
+    def _route(self, method, target, headers, body):
+        """Return (status, headers, payload) for one request."""
+        parts = urlsplit(target)
+        path = unquote(parts.path) or "/"
+        username = self._session_user(headers)
+
+        if path.startswith("/api/"):
+            return self._api(method, path, parts.query, username, body)
+        if method not in ("GET", "HEAD"):
+            return 405, {"Allow": "GET, HEAD"}, b"Method not allowed"
+
+        if path in pages.STATIC_ASSETS:
+            content_type, payload = pages.STATIC_ASSETS[path]
+            asset_headers = {"Content-Type": content_type, "Cache-Control": "public, max-age=86400", "ETag": ASSET_ETAGS[path]}
+            if headers.get("if-none-match") == ASSET_ETAGS[path]:
+                return 304, asset_headers, b""
+            return 200, asset_headers, payload
+        if path in pages.PUBLIC_DOCUMENTS:
+            return 200, self._document_headers(), pages.PUBLIC_DOCUMENTS[path]
+
+        if path in pages.SESSION_DOCUMENTS or path == "/inventory-item.html":
+            if username is None:
+                return 302, {"Location": f"/?denied={path}", "Cache-Control": "no-store"}, b""
+            if path == "/inventory-item.html":
+                item_id = parse_qs(parts.query).get("id", [""])[0]
+                document = pages.ITEM_DOCUMENTS.get(item_id)
+                if document is None:
+                    return 404, self._document_headers(), b"Item not found"
+                return 200, self._document_headers(), document
+            return 200, self._document_headers(), pages.SESSION_DOCUMENTS[path]
+
+        return 404, {"Content-Type": "text/plain; charset=utf-8"}, b"Not found"
+
+    def _api(self, method, path, query, username, body):
+        json_headers = {"Content-Type": "application/json", "Cache-Control": "no-store"}
+        if path == "/api/stats":
+            stats = {
+                "sessions": len(self.carts),
+                "requests_served": self.requests_served,
+                "open_connections": self.open_connections,
+                "uptime_seconds": round(time.time() - (self.started_at or time.time()), 1),
+            }
+            return 200, json_headers, json.dumps(stats).encode("utf-8")
+        if path != "/api/cart":
+            return 404, json_headers, b"{}"
+        if username is None:
+            return 400, json_headers, b'{"error": "not logged in"}'
+
+        if method == "POST":
+            try:
+                data = json.loads(body or b"{}")
+                tab, items = str(data["tab"]), [int(item) for item in data["items"]]
+            except (ValueError, KeyError, TypeError):
+                return 400, json_headers, b'{"error": "expected {tab, items}"}'
+            self.carts.set(username, tab, items)
+            return 204, {"Cache-Control": "no-store"}, b""
+        if method == "GET":
+            tab = parse_qs(query).get("tab", [""])[0]
+            return 200, json_headers, json.dumps({"items": self.carts.get(username, tab)}).encode("utf-8")
+        return 405, {"Allow": "GET, POST"}, b""
+
+    @staticmethod
+    def _document_headers():
+        return {"Content-Type": "text/html; charset=utf-8", "Cache-Control": "no-store"}
+
+    @staticmethod
+    def _session_user(headers):
+        """Return the logged-in username from the session-username cookie, or None."""
+        for pair in headers.get("cookie", "").split(";"):
+            name, _, value = pair.strip().partition("=")
+            if name == SESSION_COOKIE and value in USERS:
+                return value
+        return None
+
+def is_listening(host, port):
+    """Return True if something already accepts connections on host:port."""
+    try:
+        with socket.create_connection((host, port), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+def ensure_running(host="127.0.0.1", port=8765):
+    """
+    Start the stand-in on a background thread unless host:port is already served:
+    - Returns the started StandinServer (caller stops it), or None when reusing a running one
+    - Lets the parallel runner share one server across all pytest workers
+    """
+    if is_listening(host, port):
+        logger.info(f"Reusing saucedemo stand-in already listening on {host}:{port}")
+        return None
+    return StandinServer(host, port).start_in_thread()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local saucedemo stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    try:
+        asyncio.run(StandinServer(args.host, args.port).serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
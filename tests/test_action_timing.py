@@ -0,0 +1,80 @@
+import pytest
+from playwright.sync_api import TimeoutError
+from common.action_timing import ActionRecorder, percentile, install, uninstall, selector_key, INSTRUMENTED_METHODS
+
+# Ring-buffer action timings (common/action_timing.py); no browser needed
+
+
+def primitive(result=None, error=None):
+    def method(self, selector, *args, **kwargs):
+        if error:
+            raise error
+        return result
+    return method
+
+
+class FakePage:
+    """Class with every instrumented primitive; elem_click times out, find_elements finds nothing."""
+
+
+for name in INSTRUMENTED_METHODS:
+    setattr(FakePage, name, primitive(result=True))
+FakePage.elem_click = primitive(error=TimeoutError("Timeout 30000ms exceeded"))
+FakePage.find_elements = primitive(result=[])
+
+
+@pytest.mark.parametrize("fraction, expected", [(0.0, 1), (0.5, 5), (0.95, 10), (1.0, 10)])
+def test_percentile_nearest_rank(fraction, expected):
+    assert percentile(list(range(1, 11)), fraction) == expected
+
+def test_percentile_of_nothing():
+    assert percentile([], 0.5) == 0.0
+
+def test_ring_buffer_drops_oldest():
+    recorder = ActionRecorder(capacity=3)
+    for seconds in (1, 2, 3, 4, 5):
+        recorder.record("Page", "elem_click", "#btn", seconds, "ok")
+    assert recorder.dropped == 2
+    assert [entry[3] for entry in recorder.buffer] == [3, 4, 5]
+
+def test_aggregate_hottest_first():
+    recorder = ActionRecorder()
+    recorder.record("LoginPage", "elem_click", "#login", 0.010, "ok")
+    recorder.record("CartPage", "find_elements", ".cart_item", 0.300, "empty")
+    recorder.record("CartPage", "find_elements", ".cart_item", 0.100, "ok")
+    report = recorder.aggregate()
+    hottest = report["by_selector"][0]
+    assert (hottest["page_object"], hottest["selector"], hottest["calls"]) == ("CartPage", ".cart_item", 2)
+    assert hottest["total_ms"] == 400.0 and hottest["max_ms"] == 300.0
+    assert hottest["outcomes"] == {"empty": 1, "ok": 1}
+    assert [row["page_object"] for row in report["by_page_object"]] == ["CartPage", "LoginPage"]
+
+def test_install_records_outcomes_and_uninstall_restores():
+    recorder = ActionRecorder()
+    original = FakePage.__dict__["elem_click"]
+    install(FakePage, action_recorder=recorder)
+    install(FakePage, action_recorder=recorder)  # idempotent
+    page = FakePage()
+    with pytest.raises(TimeoutError):
+        page.elem_click("#missing")
+    assert page.find_elements(".cart_item") == []
+    assert page.wait_elem_visible("#title") is True
+    assert [(entry[1], entry[4]) for entry in recorder.buffer] == [
+        ("elem_click", "timeout"), ("find_elements", "empty"), ("wait_elem_visible", "ok"),
+    ]
+    uninstall(FakePage)
+    assert FakePage.__dict__["elem_click"] is original
+
+def test_selector_keys_are_stable():
+    class LocatorImpl:
+        _selector = "#inventory >> nth=0"
+
+    class Locator:
+        _impl_obj = LocatorImpl()
+
+        def __str__(self):
+            return "<Locator frame=<Frame url='https://www.saucedemo.com/inventory.html'> selector='#inventory >> nth=0'>"
+
+    assert selector_key("#btn") == "#btn"
+    assert selector_key({"count": ".shopping_cart_badge", "rows": ".cart_item"}) == "{count, rows}"
+    assert selector_key(Locator()) == "#inventory >> nth=0"
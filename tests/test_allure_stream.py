@@ -0,0 +1,65 @@
+import gzip
+import json
+import pytest
+from allure_commons import model2
+from allure_commons.model2 import Attachment
+from common.allure_stream import StreamingAllureLogger, COMPRESSED_TYPE
+
+# Streaming Allure results writer (common/allure_stream.py); no browser needed
+
+
+@pytest.fixture
+def allure_logger(tmp_path):
+    return StreamingAllureLogger(tmp_path / "allure", compress_min_kb=1)
+
+
+def result_with(*attachments, step_attachments=()):
+    step = model2.TestStepResult(name="step", attachments=list(step_attachments))
+    return model2.TestResult(uuid="u1", name="test", attachments=list(attachments), steps=[step])
+
+
+def written_result(allure_logger):
+    [path] = allure_logger._report_dir.glob("*-result.json")
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_identical_attachments_stored_once(allure_logger, tmp_path):
+    screenshot = tmp_path / "shot.png"
+    screenshot.write_bytes(b"\x89PNG same frame")
+    allure_logger.report_attached_file(str(screenshot), "a-attachment.png")
+    allure_logger.report_attached_data(b"\x89PNG same frame", "b-attachment.png")
+    allure_logger.report_result(result_with(
+        Attachment(name="first", source="a-attachment.png", type="image/png"),
+        step_attachments=[Attachment(name="second", source="b-attachment.png", type="image/png")],
+    ))
+    assert sorted(p.name for p in allure_logger._report_dir.glob("*attachment*")) == ["a-attachment.png"]
+    data = written_result(allure_logger)
+    assert data["steps"][0]["attachments"][0]["source"] == "a-attachment.png"
+    assert allure_logger.stats["deduplicated"] == 1
+
+def test_large_text_attachment_gzipped(allure_logger):
+    body = json.dumps({"rows": ["x" * 40] * 100})
+    allure_logger.report_attached_data(body, "t-attachment.json")
+    allure_logger.report_attached_data("small", "s-attachment.txt")
+    allure_logger.report_result(result_with(
+        Attachment(name="timings", source="t-attachment.json", type="application/json"),
+        Attachment(name="note", source="s-attachment.txt", type="text/plain"),
+    ))
+    with gzip.open(allure_logger._report_dir / "t-attachment.json.gz", "rt", encoding="utf-8") as f:
+        assert f.read() == body
+    assert (allure_logger._report_dir / "s-attachment.txt").read_text(encoding="utf-8") == "small"
+    timings, note = written_result(allure_logger)["attachments"]
+    assert (timings["source"], timings["type"]) == ("t-attachment.json.gz", COMPRESSED_TYPE)
+    assert (note["source"], note["type"]) == ("s-attachment.txt", "text/plain")
+    assert allure_logger.stats["compressed"] == 1
+
+def test_compression_disabled(tmp_path):
+    allure_logger = StreamingAllureLogger(tmp_path / "allure", compress_min_kb=0)
+    allure_logger.report_attached_data("x" * 4096, "t-attachment.txt")
+    assert [p.name for p in allure_logger._report_dir.iterdir()] == ["t-attachment.txt"]
+
+def test_result_written_compact_without_temp_files(allure_logger):
+    allure_logger.report_result(result_with())
+    [path] = allure_logger._report_dir.iterdir()
+    assert "\n" not in path.read_text(encoding="utf-8")
+    assert written_result(allure_logger)["name"] == "test"
@@ -0,0 +1,48 @@
+import pytest
+from config.config import load_settings, Settings
+
+# Settings loading (config/config.py): defaults < config/.env < environment; no browser needed
+
+
+@pytest.fixture
+def no_env_file(tmp_path):
+    return str(tmp_path / "missing.env")
+
+
+def test_defaults(no_env_file):
+    assert load_settings(environ={}, env_file=no_env_file) == Settings()
+
+@pytest.mark.parametrize("name, raw, expected", [
+    ("SAUCEDEMO_TIMEOUT", "45", 45),
+    ("SAUCEDEMO_STEP_RETRIES", "off", False),
+    ("SAUCEDEMO_WAIT_ABSENT_SHARE", "0.25", 0.25),
+    ("SAUCEDEMO_BLOCKED_URL_PATTERNS", '["ads\\\\.example"]', (r"ads\.example",)),
+    ("SAUCEDEMO_LEAN_VIEWPORT", '{"width": 800, "height": 600}', {"width": 800, "height": 600}),
+    ("SAUCEDEMO_TRACE", "off", "off"),
+])
+def test_environment_coerced_to_setting_type(no_env_file, name, raw, expected):
+    settings = load_settings(environ={name: raw}, env_file=no_env_file)
+    setting = "TRACE_MODE" if name == "SAUCEDEMO_TRACE" else name[len("SAUCEDEMO_"):]
+    assert getattr(settings, setting) == expected
+
+@pytest.mark.parametrize("name, raw", [
+    ("SAUCEDEMO_TIMEOUT", "soon"),
+    ("SAUCEDEMO_STEP_RETRIES", "maybe"),
+    ("SAUCEDEMO_LEAN_VIEWPORT", "[800, 600]"),
+])
+def test_invalid_values_name_the_variable(no_env_file, name, raw):
+    with pytest.raises(ValueError, match=name):
+        load_settings(environ={name: raw}, env_file=no_env_file)
+
+def test_environment_overrides_env_file(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("SAUCEDEMO_TARGET=local\nSAUCEDEMO_LOCAL_PORT=9000\n", encoding="utf-8")
+    settings = load_settings(environ={"SAUCEDEMO_LOCAL_PORT": "9100"}, env_file=str(env_file))
+    assert settings.TEST_URL == "http://127.0.0.1:9100/"
+
+def test_settings_are_immutable(no_env_file):
+    settings = load_settings(environ={"SAUCEDEMO_LEAN_VIEWPORT": '{"width": 800, "height": 600}'}, env_file=no_env_file)
+    with pytest.raises(TypeError):
+        settings.LEAN_VIEWPORT["width"] = 1
+    with pytest.raises(TypeError):
+        Settings().LEAN_VIEWPORT["width"] = 1
@@ -0,0 +1,91 @@
+import json
+import pytest
+from common import context_pool
+from common.context_pool import ContextPool
+from common.wait_policy import WaitPolicy
+
+# Context pool bookkeeping (common/context_pool.py) against fake contexts; no browser needed
+
+
+class FakePage:
+    def __init__(self, fail_wait=False):
+        self.url = "about:blank"
+        self.fail_wait = fail_wait
+        self.rendered = False
+
+    def goto(self, url):
+        self.url = url
+        self.rendered = False  # The logo appears only once the page has rendered
+
+    def wait_for_selector(self, selector, timeout=None):
+        if self.fail_wait:
+            raise RuntimeError("Timeout exceeded")
+        self.rendered = True
+
+    def is_visible(self, selector):
+        return self.rendered
+
+    def is_closed(self):
+        return False
+
+    def evaluate(self, script):
+        pass
+
+
+class FakeContext:
+    def __init__(self, page):
+        self.pages = [page]
+        self.page = page
+        self.closed = False
+
+    def new_page(self):
+        return self.page
+
+    def clear_cookies(self):
+        pass
+
+    def add_cookies(self, cookies):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, fail_wait=False):
+        self.fail_wait = fail_wait
+        self.contexts = []
+
+    def new_context(self, **kwargs):
+        self.contexts.append(FakeContext(FakePage(self.fail_wait)))
+        return self.contexts[-1]
+
+
+@pytest.fixture(autouse=True)
+def wait_policy(tmp_path, monkeypatch):
+    """Keep the fake waits out of the session's wait history."""
+    monkeypatch.setattr(context_pool, "wait_policy", WaitPolicy(path=str(tmp_path / "waits.json")))
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_text(json.dumps({"cookies": []}), encoding="utf-8")
+    return str(path)
+
+
+def test_failed_creation_closes_context(state_path):
+    browser = FakeBrowser(fail_wait=True)
+    pool = ContextPool(browser, lambda: state_path, size=1)
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+    assert [context.closed for context in browser.contexts] == [True]
+
+def test_release_waits_for_render_before_health_check(state_path):
+    browser = FakeBrowser()
+    pool = ContextPool(browser, lambda: state_path, size=1)
+    pooled = pool.acquire()
+    pool.release(pooled)
+    assert list(pool.idle) == [pooled]
+    assert pool.stats["recycled"] == 0
+    assert pool.acquire() is pooled
@@ -0,0 +1,152 @@
+import sys
+import subprocess
+import importlib
+import pytest
+from types import SimpleNamespace
+from common.dependency_index import (
+    DependencyRecorder, Change, analyse_changes, select_tests, save_index, load_index, spec_references,
+)
+
+# Dependency recording and --changed-since selection (common/dependency_index.py); no browser needed
+
+PAGE_SOURCE = '''
+class CartFlow:
+    cart_count = ".shopping_cart_badge"
+    order_rows = ".cart_item"
+    cart_fields = {"count": cart_count, "rows": [order_rows]}
+
+    def read_cart(self):
+        return self.cart_fields
+
+
+class CartPage(CartFlow):
+    pass
+'''
+
+CHECKOUT_SOURCE = '''
+class CheckoutFlow:
+    checkout_btn = "#checkout"
+    continue_btn = "#continue"
+
+    def checkout_flow(self):
+        return self.checkout_btn
+'''
+
+
+@pytest.fixture
+def page_module(tmp_path, monkeypatch):
+    """Throwaway page-object module, instrumented by a fresh recorder."""
+    (tmp_path / "deps_fake_page.py").write_text(PAGE_SOURCE, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = importlib.import_module("deps_fake_page")
+    recorder = DependencyRecorder()
+    recorder.install(modules=("deps_fake_page",))
+    yield module, recorder
+    recorder.uninstall()
+    sys.modules.pop("deps_fake_page", None)
+
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    """
+    Git repo with one committed page module: commit(path, source) commits a new file version,
+    changes(ref) runs analyse_changes inside the repo (paths are relative to the working directory).
+    """
+    (tmp_path / "pages").mkdir()
+    git = lambda *args: subprocess.run(["git", "-C", str(tmp_path), *args], check=True, capture_output=True)
+    git("init", "-q")
+    git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "--allow-empty", "-m", "root")
+
+    def commit(path, source):
+        (tmp_path / path).write_text(source, encoding="utf-8")
+        git("add", path)
+        git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", path)
+
+    def changes(ref):
+        with monkeypatch.context() as m:
+            m.chdir(tmp_path)
+            return analyse_changes(ref)
+    commit("pages/checkout_page.py", CHECKOUT_SOURCE)
+    return SimpleNamespace(commit=commit, changes=changes)
+
+
+def item(nodeid):
+    name = nodeid.split("::")[-1]
+    return SimpleNamespace(nodeid=nodeid, name=name, originalname=name.split("[")[0])
+
+
+def test_spec_references(page_module):
+    module, _ = page_module
+    assert spec_references(module.CartFlow)["cart_fields"] == {"cart_count", "order_rows"}
+
+def test_records_instance_and_class_reads(page_module):
+    module, recorder = page_module
+    recorder.start("test_instance")
+    assert module.CartPage().cart_count == ".shopping_cart_badge"
+    recorder.start("test_class")
+    assert module.CartPage.order_rows == ".cart_item"
+    recorder.stop()
+    assert recorder.dependencies == {
+        "test_instance": {"deps_fake_page:CartFlow.cart_count"},
+        "test_class": {"deps_fake_page:CartFlow.order_rows"},
+    }
+
+def test_spec_read_records_its_locators(page_module):
+    module, recorder = page_module
+    recorder.start("test_spec")
+    assert module.CartPage().read_cart() == {"count": ".shopping_cart_badge", "rows": [".cart_item"]}
+    recorder.stop()
+    assert recorder.dependencies["test_spec"] == {
+        "deps_fake_page:CartFlow.read_cart",
+        "deps_fake_page:CartFlow.cart_fields",
+        "deps_fake_page:CartFlow.cart_count",
+        "deps_fake_page:CartFlow.order_rows",
+    }
+
+def test_session_scope_and_uninstall(page_module):
+    module, recorder = page_module
+    with recorder.session_scope():
+        module.CartPage.cart_count
+    module.CartPage.order_rows  # outside tests and fixtures: not recorded
+    assert recorder.session == {"deps_fake_page:CartFlow.cart_count"}
+    recorder.uninstall()
+    assert module.CartFlow.__dict__["cart_count"] == ".shopping_cart_badge"
+
+def test_index_round_trip(tmp_path):
+    path = str(tmp_path / "deps.json")
+    save_index({"t::a": {"m:C.x"}}, {"t::a"}, path=path, commit="abc", session={"m:L.login_btn"})
+    save_index({"t::b": {"m:C.y"}}, set(), path=path, commit="def")
+    index = load_index(path)
+    assert index["tests"] == {"t::a": {"m:C.x"}, "t::b": {"m:C.y"}}
+    assert index["session"] == {"m:L.login_btn"}
+    assert index["failed"] == {"t::a"}
+    assert index["commit"] == "def"
+
+def test_select_tests():
+    index = {"tests": {"tests/t.py::a": {"m:C.x"}, "tests/t.py::b": {"m:C.y"}, "tests/t.py::c": {"m:C.z"}},
+             "session": {"m:L.login_btn"}, "failed": {"tests/t.py::c"}}
+    change = Change()
+    change.symbols = {"m:C.x"}
+    items = [item("tests/t.py::a"), item("tests/t.py::b"), item("tests/t.py::c"), item("tests/t.py::new")]
+    selected, deselected = select_tests(items, index, change)
+    assert [i.nodeid for i in selected] == ["tests/t.py::a", "tests/t.py::c", "tests/t.py::new"]
+    assert [i.nodeid for i in deselected] == ["tests/t.py::b"]
+
+    change.symbols = {"m:L.login_btn"}
+    selected, deselected = select_tests(items, index, change)
+    assert deselected == [] and "session-scoped" in change.run_all
+
+def test_diff_maps_members(git_repo):
+    git_repo.commit("pages/checkout_page.py", CHECKOUT_SOURCE.replace('"#continue"', '"#continue-new"') + "\n# comment only\n")
+    change = git_repo.changes("HEAD~1")
+    assert change.symbols == {"pages.checkout_page:CheckoutFlow.continue_btn"}
+    assert change.run_all is None
+
+def test_diff_of_login_page_runs_everything(git_repo):
+    git_repo.commit("pages/login_page.py", "class LoginFlow:\n    login_btn = '#login-button'\n")
+    git_repo.commit("pages/login_page.py", "class LoginFlow:\n    login_btn = '#login'\n")
+    assert "login" in git_repo.changes("HEAD~1").run_all
+
+def test_diff_of_unmapped_file_runs_everything(git_repo):
+    git_repo.commit("conftest.py", "X = 1\n")
+    assert "unmapped change: conftest.py" in git_repo.changes("HEAD~1").run_all
@@ -1,5 +1,6 @@
 import pytest
 import logging
+from common.screenshots import capture
 from pages.addtocart_page import AddToCartPage
 from pages.checkout_page import CheckoutPage
 
@@ -51,10 +52,10 @@ def test_end_to_end_checkout_flow(login_fixture):
         # Handle assertion failures separately (clearer error logging)
         logger.error(f"Checkout Flow Assertion Failed: {str(ae)}", exc_info=True)
         # Capture screenshot on assertion failure (for debugging)
-        driver.screenshot("checkout_assertion_failure.png")
+        capture(driver, "checkout_assertion_failure")
         raise ae
     except Exception as e:
         # Handle non-assertion errors (e.g., element not found, timeout)
         logger.error(f"Checkout Flow Execution Failed: {str(e)}", exc_info=True)
-        driver.screenshot("checkout_execution_failure.png")
+        capture(driver, "checkout_execution_failure")
         raise e
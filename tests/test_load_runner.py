@@ -0,0 +1,85 @@
+import json
+import random
+import importlib
+import pytest
+from config.config import TARGET
+
+# HDR-style latency histograms and load statistics (common/load_runner.py); no browser needed
+
+
+@pytest.fixture(scope="module")
+def load_runner():
+    """common.load_runner, imported without leaking its SAUCEDEMO_TARGET=local default into this session."""
+    with pytest.MonkeyPatch.context() as m:
+        m.setenv("SAUCEDEMO_TARGET", TARGET)
+        return importlib.import_module("common.load_runner")
+
+
+@pytest.fixture
+def histogram(load_runner):
+    return load_runner.LatencyHistogram()
+
+
+def test_small_values_stored_exactly(load_runner):
+    Histogram = load_runner.LatencyHistogram
+    for value in range(Histogram.SUB_BUCKETS):
+        assert Histogram.bucket_value(Histogram.bucket(value)) == value
+
+def test_bucket_round_trip_error_bounded(load_runner):
+    """Any value maps to a bucket whose midpoint is within 1/256 (~0.4%) of it, across 0 us .. 1000 s."""
+    Histogram = load_runner.LatencyHistogram
+    rng = random.Random(7)
+    values = [rng.randrange(1 << bits, 1 << (bits + 1)) for bits in range(8, 30) for _ in range(200)]
+    for value in values + [256, 511, 512, 1023, 1024, (1 << 30) - 1]:
+        index = Histogram.bucket(value)
+        midpoint = Histogram.bucket_value(index)
+        assert abs(midpoint - value) <= value / 256, value
+        assert Histogram.bucket(midpoint) == index
+
+def test_buckets_increase_with_value(load_runner):
+    Histogram = load_runner.LatencyHistogram
+    indices = [Histogram.bucket(value) for value in range(0, 1 << 16)]
+    assert indices == sorted(indices)
+
+def test_percentiles(histogram):
+    assert histogram.percentile(50) is None and histogram.mean() is None
+    for ms in range(1, 1001):
+        histogram.record(ms / 1000)
+    for pct, expected_ms in ((50, 500), (90, 900), (99, 990), (99.9, 999)):
+        assert histogram.percentile(pct) == pytest.approx(expected_ms, rel=1 / 256)
+    assert histogram.percentile(100) == 1000
+    assert histogram.mean() == pytest.approx(500.5)
+    assert (histogram.min_us, histogram.max_us, histogram.total) == (1000, 1_000_000, 1000)
+
+def test_percentile_never_exceeds_max(histogram):
+    histogram.record(0.1234567)
+    assert histogram.percentile(50) == histogram.percentile(100) == 123.456
+
+def test_stats_merge_across_snapshots(load_runner):
+    """Worker snapshots (drained per interval, sent as JSON) merge to the same stats as one recorder."""
+    rng = random.Random(3)
+    samples = [(rng.choice(("login", "checkout")), rng.expovariate(1 / 0.2)) for _ in range(2000)]
+    combined, merged = load_runner.LoadStats(), load_runner.LoadStats()
+    worker = load_runner.LoadStats()
+    for count, (step, seconds) in enumerate(samples, 1):
+        combined.record(step, seconds)
+        worker.record(step, seconds)
+        if count % 500 == 0:
+            worker.completed += 1
+            worker.record_error("checkout", TimeoutError())
+            merged.merge(json.loads(json.dumps(worker.drain())))
+    assert worker.drain()["steps"] == {}
+    for step in ("login", "checkout"):
+        expected, actual = combined.steps[step], merged.steps[step]
+        assert actual.counts == expected.counts
+        assert (actual.total, actual.sum_us, actual.min_us, actual.max_us) == \
+               (expected.total, expected.sum_us, expected.min_us, expected.max_us)
+        assert [actual.percentile(p) for p in (50, 99, 99.9)] == [expected.percentile(p) for p in (50, 99, 99.9)]
+    assert merged.completed == 4
+    assert merged.errors == {"checkout": {"TimeoutError": 4}}
+
+def test_error_rate(load_runner):
+    stats = load_runner.LoadStats()
+    assert stats.error_rate() == 0.0
+    stats.completed, stats.failed = 3, 1
+    assert stats.error_rate() == 0.25
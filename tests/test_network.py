@@ -0,0 +1,92 @@
+import pytest
+from common.network import AssetCache, NetworkRouter, is_fingerprinted
+
+# Static asset caching of the network router (common/network.py); no browser needed
+
+APP_JS = "http://127.0.0.1:8765/static/js/app.js"
+HASHED_JS = "https://www.saucedemo.com/static/js/main.018d2d1e.chunk.js"
+
+
+class FakeResponse:
+    def __init__(self, status, body=b"", headers=None):
+        self.status = status
+        self._body = body
+        self.headers = headers or {}
+
+    def body(self):
+        return self._body
+
+
+class FakeRoute:
+    """Route double: fetch() answers from a server callable(request headers) -> FakeResponse."""
+
+    def __init__(self, url, server):
+        self.request = type("Request", (), {"url": url, "method": "GET", "headers": {"accept": "*/*"}})()
+        self.server = server
+        self.fetched_with = None
+        self.fulfilled = None
+
+    def fetch(self, headers=None):
+        self.fetched_with = headers or dict(self.request.headers)
+        return self.server(self.fetched_with)
+
+    def fulfill(self, status=None, headers=None, body=None, response=None):
+        self.fulfilled = {"status": response.status if response else status, "body": body}
+
+    def fallback(self):
+        self.fulfilled = "fallback"
+
+
+@pytest.fixture
+def router(tmp_path):
+    return NetworkRouter(blocked_patterns=(), cache=AssetCache(root=str(tmp_path / "assets")))
+
+
+def serve(router, url, server):
+    route = FakeRoute(url, server)
+    router._serve_asset(route)
+    return route
+
+
+def etag_server(etag, body):
+    """Origin answering 304 when the client already has `etag`."""
+    def server(headers):
+        if headers.get("if-none-match") == etag:
+            return FakeResponse(304)
+        return FakeResponse(200, body, {"content-type": "application/javascript", "etag": etag})
+    return server
+
+
+def test_fingerprinted_urls():
+    assert is_fingerprinted(HASHED_JS)
+    assert is_fingerprinted("https://www.saucedemo.com/static/media/bike-light-1200x1500.37c843b0.jpg")
+    assert not is_fingerprinted(APP_JS)
+    assert not is_fingerprinted("http://127.0.0.1:8765/static/media/sauce-labs-backpack.svg")
+
+def test_unchanged_asset_revalidated_from_cache(router):
+    serve(router, APP_JS, etag_server('"v1"', b"one"))
+    route = serve(router, APP_JS, etag_server('"v1"', b"one"))
+    assert route.fetched_with["if-none-match"] == '"v1"'
+    assert route.fetched_with["accept"] == "*/*"
+    assert route.fulfilled == {"status": 200, "body": b"one"}
+    assert router.stats["revalidated"] == 1
+
+def test_edited_asset_never_served_stale(router):
+    serve(router, APP_JS, etag_server('"v1"', b"one"))
+    route = serve(router, APP_JS, etag_server('"v2"', b"two"))
+    assert route.fulfilled["body"] == b"two"
+    assert serve(router, APP_JS, etag_server('"v2"', b"two")).fulfilled["body"] == b"two"
+    assert router.stats["misses"] == 2 and router.stats["revalidated"] == 1
+
+def test_asset_without_validator_refetched(router):
+    server = lambda headers: FakeResponse(200, b"plain", {"content-type": "text/css"})
+    serve(router, APP_JS, server)
+    route = serve(router, APP_JS, server)
+    assert "if-none-match" not in route.fetched_with
+    assert router.stats["misses"] == 2 and router.stats["hits"] == 0
+
+def test_fingerprinted_asset_served_without_request(router):
+    serve(router, HASHED_JS, etag_server('"v1"', b"hashed"))
+    route = serve(router, HASHED_JS, lambda headers: pytest.fail("fingerprinted asset was re-requested"))
+    assert route.fulfilled == {"status": 200, "body": b"hashed"}
+    assert router.stats["hits"] == 1
@@ -0,0 +1,44 @@
+import pytest
+from common import parallel_runner
+
+# Parallel runner process handling (common/parallel_runner.py) with fake workers; no browser needed
+
+
+class FakeServer:
+    stopped = False
+
+    def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def local_target(monkeypatch, tmp_path):
+    """Runner targeting the stand-in, with artifacts under tmp_path and merging stubbed out."""
+    import standin.server
+    server = FakeServer()
+    monkeypatch.setattr(parallel_runner, "TARGET", "local")
+    monkeypatch.setattr(standin.server, "ensure_running", lambda host, port: server)
+    monkeypatch.setattr(parallel_runner, "LOG_DIR", str(tmp_path / "logs"))
+    return server
+
+
+def failing_popen(*args, **kwargs):
+    raise OSError("cannot spawn worker")
+
+
+def test_stand_in_stopped_when_spawning_fails(local_target, monkeypatch):
+    monkeypatch.setattr(parallel_runner, "get_catalog", lambda: [])
+    monkeypatch.setattr(parallel_runner.subprocess, "Popen", failing_popen)
+    with pytest.raises(OSError):
+        parallel_runner.run(2, [])
+    assert local_target.stopped
+
+def test_missing_catalogue_warns_loudly(local_target, monkeypatch, capsys):
+    def no_catalogue():
+        raise RuntimeError("site unreachable")
+    monkeypatch.setattr(parallel_runner, "get_catalog", no_catalogue)
+    monkeypatch.setattr(parallel_runner.subprocess, "Popen", failing_popen)
+    with pytest.raises(OSError):
+        parallel_runner.run(1, [])
+    assert "WARNING: no product catalogue available (site unreachable)" in capsys.readouterr().err
+    assert local_target.stopped
@@ -0,0 +1,63 @@
+import pytest
+import logging
+from pages.addtocart_page import AddToCartPage
+from pages.checkout_page import CheckoutPage
+from pages.clear_product_page import ClearProductPage
+
+# Initialize logger for test module
+logger = logging.getLogger(__name__)
+
+# Product-matrix journeys: "product" / "cart_products" are generated from the scraped
+# inventory catalogue (conftest.pytest_generate_tests). All journeys in a worker share one
+# logged-in page; the "shop" fixture empties the cart and returns to inventory between them, and
+# "cart_with" seeds a cart directly where adding items is only a precondition.
+
+@pytest.mark.cart
+def test_add_and_checkout_product(shop, product):
+    """
+    Single-product checkout for every catalogue item:
+    1. Add the product from the inventory list and validate cart count
+    2. Checkout and verify the order review shows exactly the catalogue name/price
+    """
+    logger.info(f"\n======= Product journey: {product.name} ======")
+    cart_info = AddToCartPage(shop).add_product_to_cart(product)
+    assert cart_info["count"] == 1, \
+        f"Cart count validation failed: Expected 1, Actual={cart_info['count']}"
+
+    order_items = CheckoutPage(shop).checkout_items()
+    assert order_items == [{"name": product.name, "price": product.price}], \
+        f"Order review mismatch for {product.name}: {order_items}"
+
+@pytest.mark.cart
+def test_remove_product_from_cart(cart_with, product):
+    """
+    Remove every catalogue item from the cart:
+    1. Start from a cart seeded with the product (no add-to-cart clicks, see cart_with)
+    2. Remove it from the cart page
+    3. Verify the remove button and the cart badge are gone
+    """
+    page = cart_with([product])
+
+    clear_page = ClearProductPage(page)
+    clear_page.clear_product_from_cart(product.slug)
+    assert clear_page.elem_count(clear_page.remove_product_btn.format(slug=product.slug)) == 0, \
+        f"{product.name} still listed in cart after removal"
+    assert clear_page.elem_count(AddToCartPage.cart_count) == 0, "Cart badge still visible after removal"
+
+@pytest.mark.cart
+def test_checkout_multi_item_cart(shop, cart_products):
+    """
+    Multi-item checkout:
+    1. Bulk add every product of the cart in one inventory pass (count verified once)
+    2. Validate the added names/prices against the catalogue
+    3. Verify the order review lists exactly those names/prices
+    """
+    cart_info = AddToCartPage(shop).add_products_to_cart(cart_products)
+    assert cart_info["count"] == len(cart_products), \
+        f"Cart count validation failed: Expected {len(cart_products)}, Actual={cart_info['count']}"
+    expected = [{"name": product.name, "price": product.price} for product in cart_products]
+    assert cart_info["items"] == expected, f"Cart mismatch: Expected={expected}, Actual={cart_info['items']}"
+
+    order_items = CheckoutPage(shop).checkout_items()
+    assert sorted(order_items, key=lambda item: item["name"]) == sorted(expected, key=lambda item: item["name"]), \
+        f"Order review mismatch: Expected={expected}, Actual={order_items}"
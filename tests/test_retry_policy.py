@@ -0,0 +1,85 @@
+import pytest
+from playwright.sync_api import Error, TimeoutError
+from common.retry_policy import (
+    RetryPolicy, is_transient, click_state, CLICK_APPLIED, CLICK_RETRY, CLICK_UNKNOWN,
+)
+
+# Step-level retry decisions (common/retry_policy.py); no browser needed
+
+LOGIN_URL = "https://www.saucedemo.com/"
+INVENTORY_URL = "https://www.saucedemo.com/inventory.html"
+
+
+def failing(*errors, result="done"):
+    """Action raising the given errors in turn, then returning result; counts its calls."""
+    calls = {"count": 0}
+
+    def action():
+        calls["count"] += 1
+        if calls["count"] <= len(errors):
+            raise errors[calls["count"] - 1]
+        return result
+    return action, calls
+
+
+@pytest.fixture
+def retry_policy():
+    return RetryPolicy(enabled=True, attempts=3, base_ms=0, max_ms=0, budget=10)
+
+
+def test_transient_errors():
+    assert is_transient(Error("Element is not attached to the DOM"))
+    assert is_transient(Error("<div> intercepts pointer events"))
+    assert not is_transient(Error("Target page, context or browser has been closed"))
+    assert not is_transient(Error("strict mode violation"))
+    assert not is_transient(ValueError("not attached to the DOM"))
+
+def test_timeouts_are_never_retried(retry_policy):
+    """A timeout already waited its full timeout: one attempt only, recorded once."""
+    assert not is_transient(TimeoutError("Timeout 30000ms exceeded"))
+    action, calls = failing(TimeoutError("Timeout 30000ms exceeded"))
+    with pytest.raises(TimeoutError):
+        retry_policy.call("#missing", action)
+    assert calls["count"] == 1
+    assert retry_policy.by_selector == {}
+
+def test_transient_error_retried_in_place(retry_policy):
+    action, calls = failing(Error("element was detached from the DOM"))
+    assert retry_policy.call("#btn", action) == "done"
+    assert calls["count"] == 2
+    assert retry_policy.by_selector["#btn"]["recovered"] == 1
+
+def test_retries_capped_per_action(retry_policy):
+    action, calls = failing(*[Error("element is not stable")] * 5)
+    with pytest.raises(Error):
+        retry_policy.call("#btn", action)
+    assert calls["count"] == retry_policy.attempts
+    assert retry_policy.by_selector["#btn"]["gave_up"] == 1
+
+@pytest.mark.parametrize("message, url_now, expected_url, state", [
+    ("click action done\n  waiting for scheduled navigations", LOGIN_URL, None, CLICK_APPLIED),
+    ("performing click action", INVENTORY_URL, r"/inventory\.html", CLICK_APPLIED),
+    # Navigated, but not where the caller expects (expired session, error page): never applied
+    ("performing click action", LOGIN_URL + "?expired", r"/inventory\.html", CLICK_UNKNOWN),
+    ("performing click action", INVENTORY_URL, None, CLICK_UNKNOWN),
+    ("waiting for element to be visible", INVENTORY_URL, None, CLICK_UNKNOWN),
+    ("waiting for element to be visible, enabled and stable", LOGIN_URL, None, CLICK_RETRY),
+    ("performing click action", LOGIN_URL, None, CLICK_UNKNOWN),
+])
+def test_click_state(message, url_now, expected_url, state):
+    assert click_state(Error(message), LOGIN_URL, url_now, expected_url) == state
+
+def test_click_on_unexpected_page_reraises(retry_policy):
+    """A click that failed while the page moved somewhere unexpected is not reported as success."""
+    error = Error("element is not stable\n  performing click action")
+    action, calls = failing(error)
+    with pytest.raises(Error):
+        retry_policy.call("#login-button", action, state=lambda e: click_state(e, LOGIN_URL, LOGIN_URL + "error.html"))
+    assert calls["count"] == 1
+    assert "#login-button" not in retry_policy.by_selector
+
+def test_applied_click_not_repeated(retry_policy):
+    action, calls = failing(Error("element is not stable\n  click action done"))
+    assert retry_policy.call("#login-button", action, state=lambda e: click_state(e, LOGIN_URL, LOGIN_URL)) is None
+    assert calls["count"] == 1
+    assert retry_policy.by_selector["#login-button"]["applied"] == 1
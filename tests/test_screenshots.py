@@ -0,0 +1,44 @@
+import os
+import pytest
+from common import screenshots
+from common.screenshots import ScreenshotWriter
+from pages.base_page import BasePage
+
+# Background screenshot writer (common/screenshots.py) and BasePage's screenshot API; no browser needed
+
+
+class FakePage:
+    def __init__(self, frame=b"\x89PNG frame"):
+        self.frame = frame
+
+    def screenshot(self, **options):
+        return self.frame
+
+    def locator(self, selector):
+        raise AssertionError("viewport captures need no locator")
+
+
+@pytest.fixture
+def writer(tmp_path, monkeypatch):
+    writer = ScreenshotWriter(directory=str(tmp_path / "shots"))
+    monkeypatch.setattr(screenshots, "writer", writer)
+    yield writer
+    writer.flush()
+
+
+def test_save_screen_shot_returns_the_path(writer):
+    path = BasePage(FakePage()).save_screen_shot("checkout_failure.png")
+    assert os.path.basename(path).endswith("__checkout_failure__0001.png")
+    with open(path, "rb") as f:
+        assert f.read() == b"\x89PNG frame"
+
+def test_queued_screenshot_returns_a_future(writer):
+    future = BasePage(FakePage()).queue_screen_shot("elem_timeout.png")
+    assert os.path.exists(future.result())
+
+def test_identical_frames_written_once(writer):
+    page = BasePage(FakePage())
+    first = page.save_screen_shot("a.png")
+    assert page.save_screen_shot("b.png") == first
+    assert BasePage(FakePage(b"\x89PNG other")).save_screen_shot("c.png") != first
+    assert (writer.stats["written"], writer.stats["deduplicated"]) == (2, 1)
@@ -0,0 +1,45 @@
+import pytest
+import logging
+from common.state_seed import assert_seeded_cart
+from pages.checkout_page import CheckoutPage
+
+# Initialize logger for test module
+logger = logging.getLogger(__name__)
+
+# Seeded-state journeys: carts are written straight into the app's client-side state
+# (cart_with fixture, common/state_seed.py); only the steps under test use the UI.
+
+@pytest.mark.cart
+def test_seeded_cart_matches_ui(cart_with, cart_products):
+    """
+    Seeded carts render like clicked ones:
+    1. Seed the cart and open inventory.html: badge and remove buttons match
+    2. Open cart.html with the same cart: rows show exactly the seeded names/prices
+    """
+    assert_seeded_cart(cart_with(cart_products), cart_products)
+    assert_seeded_cart(cart_with(cart_products, path="cart.html"), cart_products)
+
+@pytest.mark.cart
+def test_checkout_seeded_cart(cart_with, cart_products):
+    """
+    Checkout of a multi-item cart that was seeded instead of added via the UI:
+    1. Seed the cart (precondition only)
+    2. Checkout and verify the order review lists exactly the seeded names/prices
+    """
+    page = cart_with(cart_products)
+    expected = [{"name": product.name, "price": product.price} for product in cart_products]
+
+    order_items = CheckoutPage(page).checkout_items()
+    assert sorted(order_items, key=lambda item: item["name"]) == sorted(expected, key=lambda item: item["name"]), \
+        f"Order review mismatch: Expected={expected}, Actual={order_items}"
+
+@pytest.mark.cart
+@pytest.mark.fresh_context
+def test_seeded_cart_in_fresh_context(cart_with, product):
+    """
+    A new context seeded before its first navigation (no login form, no clicks)
+    lands on cart.html logged in and showing the product.
+    """
+    page = cart_with([product], path="cart.html")
+    assert page.url.endswith("cart.html"), f"Seeded session was rejected, landed on {page.url}"
+    assert_seeded_cart(page, [product])
@@ -0,0 +1,48 @@
+import json
+import pytest
+from common.sharding import assign_shards, save_durations, load_durations, merge_worker_dirs, artifact_dir, WORKER_ENV
+
+# Longest-first sharding and per-worker artifacts (common/sharding.py); no browser needed
+
+
+def test_longest_first_balances_load():
+    durations = {"a": 8, "b": 7, "c": 6, "d": 5, "e": 4}
+    shards = assign_shards(list(durations), durations, 2)
+    assert shards == [["a", "d", "e"], ["b", "c"]]
+    assert sorted(sum(durations[n] for n in shard) for shard in shards) == [13, 17]
+
+def test_unknown_tests_weigh_the_average():
+    shards = assign_shards(["new", "slow", "fast"], {"slow": 9, "fast": 1}, 2)
+    assert shards == [["slow"], ["new", "fast"]]
+
+def test_split_is_deterministic_and_complete():
+    nodeids = [f"tests/t.py::test_{i}" for i in range(7)]
+    shards = assign_shards(nodeids, {}, 3)
+    assert shards == assign_shards(list(reversed(nodeids)), {}, 3)
+    assert sorted(n for shard in shards for n in shard) == sorted(nodeids)
+    assert [len(shard) for shard in shards] == [3, 2, 2]
+
+def test_save_durations_merges(tmp_path):
+    path = str(tmp_path / "durations.json")
+    save_durations({"a": 1.0, "b": 2.0}, path=path)
+    save_durations({"b": 3.0}, path=path)
+    assert load_durations(path) == {"a": 1.0, "b": 3.0}
+    assert load_durations(str(tmp_path / "missing.json")) == {}
+
+def test_worker_artifacts_merged(tmp_path, monkeypatch):
+    base = str(tmp_path / "logs")
+    monkeypatch.setenv(WORKER_ENV, "1")
+    (tmp_path / "logs").mkdir()
+    (tmp_path / "logs" / "keep.log").write_text("top", encoding="utf-8")
+    with open(f"{artifact_dir(base)}/run.log", "w", encoding="utf-8") as f:
+        f.write("worker")
+    merge_worker_dirs(base)
+    assert sorted(p.name for p in (tmp_path / "logs").iterdir()) == ["keep.log", "worker-1_run.log"]
+
+@pytest.mark.parametrize("prefix, expected", [(True, "worker-0_result.json"), (False, "result.json")])
+def test_merge_prefix(tmp_path, prefix, expected):
+    worker_dir = tmp_path / "worker-0"
+    worker_dir.mkdir()
+    (worker_dir / "result.json").write_text(json.dumps({}), encoding="utf-8")
+    merge_worker_dirs(str(tmp_path), prefix=prefix)
+    assert [p.name for p in tmp_path.iterdir()] == [expected]
@@ -0,0 +1,39 @@
+import socket
+import pytest
+from standin.server import StandinServer, ASSET_ETAGS
+
+# Request parsing of the local stand-in (standin/server.py); no browser needed
+
+
+@pytest.fixture(scope="module")
+def standin():
+    server = StandinServer(port=0).start_in_thread()
+    yield server
+    server.stop()
+
+
+def raw_request(server, request):
+    """Send raw request bytes and return the status line of the response."""
+    with socket.create_connection((server.host, server.port), timeout=5) as sock:
+        sock.sendall(request)
+        return sock.makefile("rb").readline().decode("latin-1").strip()
+
+
+def test_serves_login_page(standin):
+    assert raw_request(standin, b"GET / HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n") == "HTTP/1.1 200 OK"
+
+@pytest.mark.parametrize("length", [b"abc", b"-1", b"1_0", b"\xb2", b"2 3"])
+def test_invalid_content_length_rejected(standin, length):
+    request = b"POST /api/cart HTTP/1.1\r\nHost: x\r\nContent-Length: " + length + b"\r\n\r\n{}"
+    assert raw_request(standin, request) == "HTTP/1.1 400 Bad Request"
+
+def test_oversized_body_rejected(standin):
+    request = b"POST /api/cart HTTP/1.1\r\nHost: x\r\nContent-Length: 99999999\r\n\r\n"
+    assert raw_request(standin, request) == "HTTP/1.1 413 Payload Too Large"
+
+def test_static_assets_revalidate_with_etag(standin):
+    response = raw_request(standin, b"GET /static/js/app.js HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n")
+    assert response == "HTTP/1.1 200 OK"
+    etag = ASSET_ETAGS["/static/js/app.js"].encode("latin-1")
+    request = b"GET /static/js/app.js HTTP/1.1\r\nHost: x\r\nIf-None-Match: " + etag + b"\r\nConnection: close\r\n\r\n"
+    assert raw_request(standin, request) == "HTTP/1.1 304 Not Modified"
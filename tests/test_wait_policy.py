@@ -0,0 +1,105 @@
+import json
+import pytest
+from playwright.sync_api import TimeoutError
+from common.wait_policy import WaitPolicy, load_history, merge_history
+
+# Learned per-selector timeouts (common/wait_policy.py); no browser needed
+
+
+@pytest.fixture
+def wait_policy(tmp_path):
+    return WaitPolicy(path=str(tmp_path / "waits.json"), default_ms=30000, enabled=True, factor=3,
+                      min_timeout_ms=2000, min_samples=5, max_samples=10, absent_share=0.5)
+
+
+def test_default_until_enough_samples(wait_policy):
+    for _ in range(4):
+        wait_policy.record("#btn", 100)
+    assert wait_policy.timeout_for("#btn") == 30000
+    wait_policy.record("#btn", 100)
+    assert wait_policy.timeout_for("#btn") == 2000
+
+@pytest.mark.parametrize("sample_ms, expected_ms", [
+    (100, 2000),      # p99 * factor below the floor
+    (1500, 4500),     # learned
+    (20000, 30000),   # capped at the configured default
+])
+def test_learned_timeout_clamped(wait_policy, sample_ms, expected_ms):
+    for _ in range(5):
+        wait_policy.record("#btn", sample_ms)
+    assert wait_policy.timeout_for("#btn") == expected_ms
+
+def test_history_keeps_latest_samples(wait_policy):
+    for _ in range(10):
+        wait_policy.record("#btn", 9000)
+    for _ in range(10):
+        wait_policy.record("#btn", 1000)
+    assert wait_policy.timeout_for("#btn") == 3000
+
+def test_disabled_and_locator_selectors_use_default(wait_policy):
+    for _ in range(5):
+        wait_policy.record("#btn", 100)
+    assert wait_policy.timeout_for(object()) == 30000
+    wait_policy.enabled = False
+    assert wait_policy.timeout_for("#btn") == 30000
+
+def test_disabled_by_default_but_still_recording(tmp_path):
+    wait_policy = WaitPolicy(path=str(tmp_path / "waits.json"), min_samples=1)
+    wait_policy.record("#btn", 100)
+    assert not wait_policy.enabled
+    assert wait_policy.timeout_for("#btn") == wait_policy.default_ms
+    assert wait_policy.new_samples == {"#btn": [100]}
+
+def test_timeout_recorded_at_full_timeout(wait_policy):
+    with pytest.raises(TimeoutError):
+        with wait_policy.track("#slow", 30000):
+            raise TimeoutError("Timeout 30000ms exceeded")
+    assert wait_policy.history["#slow"] == [30000]
+    assert wait_policy.timeouts == {"#slow": 1}
+
+def test_mostly_absent_selector_fails_fast(wait_policy):
+    """Valid absences (absence_ok) count towards the history and cap the timeout once they dominate."""
+    for _ in range(3):
+        with pytest.raises(TimeoutError):
+            with wait_policy.track("#remove", 30000, absence_ok=True):
+                raise TimeoutError("Timeout 30000ms exceeded")
+    wait_policy.record("#remove", 8000)
+    wait_policy.record("#remove", 8000)
+    assert wait_policy.absent == {"#remove": 3}
+    assert wait_policy.timeouts == {}
+    assert wait_policy.timeout_for("#remove", absence_ok=True) == 2000
+    # A wait that expects the element keeps the learned timeout of its present samples
+    assert wait_policy.timeout_for("#remove") == 24000
+
+    # Mostly present again: the learned timeout applies
+    for _ in range(5):
+        wait_policy.record("#remove", 8000)
+    assert wait_policy.timeout_for("#remove", absence_ok=True) == 24000
+
+def test_other_errors_not_recorded(wait_policy):
+    with pytest.raises(ValueError):
+        with wait_policy.track("#btn", 30000):
+            raise ValueError("TimeoutError in the message only")
+    assert wait_policy.recorded == 0
+
+def test_save_merges_new_samples(wait_policy, tmp_path):
+    with open(wait_policy.path, "w", encoding="utf-8") as f:
+        json.dump({"#other": [5.0], "#btn": [1.0]}, f)
+    wait_policy.record("#btn", 2)
+    wait_policy.record("#btn", None)
+    wait_policy.save()
+    with open(wait_policy.path, encoding="utf-8") as f:
+        assert json.load(f) == {"#other": [5.0], "#btn": [1.0, 2, None]}
+
+def test_worker_files_merged_without_losing_samples(tmp_path):
+    """Parallel workers save to their own files; merging keeps every worker's samples."""
+    shared = str(tmp_path / "waits.json")
+    merge_history({"#btn": [1.0]}, shared)
+    for worker, sample in enumerate((2.0, 3.0)):
+        policy = WaitPolicy(path=shared, max_samples=10)
+        policy.record("#btn", sample)
+        policy.save(str(tmp_path / f"worker-{worker}.json"))
+    assert load_history(shared) == {"#btn": [1.0]}
+    for worker in range(2):
+        merge_history(load_history(str(tmp_path / f"worker-{worker}.json")), shared)
+    assert load_history(shared) == {"#btn": [1.0, 2.0, 3.0]}